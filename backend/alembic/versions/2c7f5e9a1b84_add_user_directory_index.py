@@ -0,0 +1,26 @@
+"""add user directory index
+
+Revision ID: 2c7f5e9a1b84
+Revises: f0a92e4c6d37
+Create Date: 2026-10-18 16:57:12.448310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2c7f5e9a1b84"
+down_revision: Union[str, None] = "f0a92e4c6d37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_users_created_at_id", "users", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_created_at_id", table_name="users")
@@ -0,0 +1,49 @@
+"""add listing row versions
+
+Revision ID: 4b8e2d6f1c93
+Revises: 7d1b3e8f5a26
+Create Date: 2026-10-18 21:07:12.583019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4b8e2d6f1c93"
+down_revision: Union[str, None] = "7d1b3e8f5a26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The listing ETag indexes gain row_version so sum(row_version) stays index-only
+CAMPAIGN_INDEXES = {
+    "ix_campaigns_updated_at": ["updated_at"],
+    "ix_campaigns_status_updated_at": ["status", "updated_at"],
+    "ix_campaigns_brand_id_updated_at": ["brand_id", "updated_at"],
+}
+ORDER_INDEXES = {
+    "ix_orders_brand_id_updated_at": ["brand_id", "updated_at", "id"],
+    "ix_orders_creator_id_updated_at": ["creator_id", "updated_at", "id"],
+    "ix_orders_campaign_id_updated_at": ["campaign_id", "updated_at", "id"],
+    "ix_orders_updated_at_id": ["updated_at", "id"],
+}
+
+
+def _recreate_indexes(table: str, indexes: dict[str, list[str]], extra: list[str]) -> None:
+    for name, columns in indexes.items():
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, columns + extra)
+
+
+def upgrade() -> None:
+    for table, indexes in (("campaigns", CAMPAIGN_INDEXES), ("orders", ORDER_INDEXES)):
+        op.add_column(table, sa.Column("row_version", sa.Integer(), server_default="1", nullable=False))
+        _recreate_indexes(table, indexes, ["row_version"])
+
+
+def downgrade() -> None:
+    for table, indexes in (("orders", ORDER_INDEXES), ("campaigns", CAMPAIGN_INDEXES)):
+        _recreate_indexes(table, indexes, [])
+        op.drop_column(table, "row_version")
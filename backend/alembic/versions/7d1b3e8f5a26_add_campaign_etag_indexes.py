@@ -0,0 +1,30 @@
+"""add campaign etag indexes
+
+Revision ID: 7d1b3e8f5a26
+Revises: 2c7f5e9a1b84
+Create Date: 2026-10-18 18:21:40.917264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7d1b3e8f5a26"
+down_revision: Union[str, None] = "2c7f5e9a1b84"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_campaigns_updated_at", "campaigns", ["updated_at"])
+    op.create_index("ix_campaigns_status_updated_at", "campaigns", ["status", "updated_at"])
+    op.create_index("ix_campaigns_brand_id_updated_at", "campaigns", ["brand_id", "updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_campaigns_brand_id_updated_at", table_name="campaigns")
+    op.drop_index("ix_campaigns_status_updated_at", table_name="campaigns")
+    op.drop_index("ix_campaigns_updated_at", table_name="campaigns")
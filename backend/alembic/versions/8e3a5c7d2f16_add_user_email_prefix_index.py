@@ -0,0 +1,33 @@
+"""add user email prefix index
+
+Revision ID: 8e3a5c7d2f16
+Revises: 4b8e2d6f1c93
+Create Date: 2026-10-18 21:42:55.306871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8e3a5c7d2f16"
+down_revision: Union[str, None] = "4b8e2d6f1c93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # text_pattern_ops lets PostgreSQL serve lower(email) LIKE 'prefix%' under any collation;
+    # SQLite ignores it and uses the plain expression index for GLOB
+    op.create_index(
+        "ix_users_email_lower",
+        "users",
+        [sa.func.lower(sa.column("email")).label("email_lower")],
+        postgresql_ops={"email_lower": "text_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_email_lower", table_name="users")
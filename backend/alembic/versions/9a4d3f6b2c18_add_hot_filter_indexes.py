@@ -0,0 +1,40 @@
+"""add hot filter indexes
+
+Revision ID: 9a4d3f6b2c18
+Revises: 5e2b7c41d9a0
+Create Date: 2026-10-18 11:40:27.503114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4d3f6b2c18"
+down_revision: Union[str, None] = "5e2b7c41d9a0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_orders_brand_id_status", "orders", ["brand_id", "status"])
+    op.create_index("ix_orders_creator_id_status", "orders", ["creator_id", "status"])
+    op.create_index("ix_orders_campaign_id_status", "orders", ["campaign_id", "status"])
+    op.create_index("ix_campaigns_status_created_at", "campaigns", ["status", "created_at"])
+    op.create_index("ix_payments_status_created_at", "payments", ["status", "created_at"])
+    op.create_index(
+        "ix_notifications_user_id_is_read_created_at",
+        "notifications",
+        ["user_id", "is_read", sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notifications_user_id_is_read_created_at", table_name="notifications")
+    op.drop_index("ix_payments_status_created_at", table_name="payments")
+    op.drop_index("ix_campaigns_status_created_at", table_name="campaigns")
+    op.drop_index("ix_orders_campaign_id_status", table_name="orders")
+    op.drop_index("ix_orders_creator_id_status", table_name="orders")
+    op.drop_index("ix_orders_brand_id_status", table_name="orders")
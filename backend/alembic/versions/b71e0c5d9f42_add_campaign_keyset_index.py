@@ -0,0 +1,26 @@
+"""add campaign keyset index
+
+Revision ID: b71e0c5d9f42
+Revises: 9a4d3f6b2c18
+Create Date: 2026-10-18 13:05:51.218804
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b71e0c5d9f42"
+down_revision: Union[str, None] = "9a4d3f6b2c18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_campaigns_created_at_id", "campaigns", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_campaigns_created_at_id", table_name="campaigns")
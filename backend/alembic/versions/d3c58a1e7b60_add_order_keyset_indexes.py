@@ -0,0 +1,36 @@
+"""add order keyset indexes
+
+Revision ID: d3c58a1e7b60
+Revises: b71e0c5d9f42
+Create Date: 2026-10-18 14:22:09.674130
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3c58a1e7b60"
+down_revision: Union[str, None] = "b71e0c5d9f42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTICIPANTS = ("brand_id", "creator_id", "campaign_id")
+
+
+def upgrade() -> None:
+    # The (participant, updated_at, id) indexes also serve status-narrowed filters,
+    # so the (participant, status) ones would only add write overhead
+    for column in PARTICIPANTS:
+        op.create_index(f"ix_orders_{column}_updated_at", "orders", [column, "updated_at", "id"])
+        op.drop_index(f"ix_orders_{column}_status", table_name="orders")
+    op.create_index("ix_orders_updated_at_id", "orders", ["updated_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_orders_updated_at_id", table_name="orders")
+    for column in PARTICIPANTS:
+        op.create_index(f"ix_orders_{column}_status", "orders", [column, "status"])
+        op.drop_index(f"ix_orders_{column}_updated_at", table_name="orders")
@@ -0,0 +1,34 @@
+"""add notification counters
+
+Revision ID: f0a92e4c6d37
+Revises: d3c58a1e7b60
+Create Date: 2026-10-18 15:48:33.091527
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f0a92e4c6d37"
+down_revision: Union[str, None] = "d3c58a1e7b60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rows are created lazily by the first unread-count request for each user
+    op.create_table(
+        "notification_counters",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("unread", sa.Integer(), nullable=False),
+        sa.Column("reconciled_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("notification_counters")
@@ -2,9 +2,11 @@
 
 from fastapi import APIRouter
 
-from app.api.admin import campaigns, statistics, users
+from app.api.admin import campaigns, orders, statistics, users
+from app.core.timing import TimedRoute
 
-router = APIRouter(prefix="/admin", tags=["Admin"])
+router = APIRouter(prefix="/admin", tags=["Admin"], route_class=TimedRoute)
 router.include_router(users.router, prefix="/users")
 router.include_router(campaigns.router, prefix="/campaigns")
+router.include_router(orders.router, prefix="/orders")
 router.include_router(statistics.router, prefix="/statistics")
@@ -4,60 +4,89 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, require_admin
+from app.api.deps import get_async_db, require_admin
+from app.api.fieldsets import FieldsQuery, parse_fields, select_columns, sparse_items
+from app.core.serialization import validated_response
+from app.core.timing import TimedRoute
 from app.models import Campaign, User
 from app.models.enums import AdminLevel
 from app.schemas import AdminCampaignStatusUpdate, CampaignRead
 from app.services.admin_logs import log_admin_action
+from app.services.exports import ExportFormat, stream_export
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get("", response_model=list[CampaignRead])
-def list_campaigns(
+async def list_campaigns(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     admin_user: User = Depends(require_admin(AdminLevel.ADMIN_LEVEL_1)),
-) -> list[CampaignRead]:
-    campaigns = db.query(Campaign).all()
-    return [CampaignRead.model_validate(c) for c in campaigns]
+    fields: FieldsQuery = None,
+) -> Response:
+    """Return every campaign, loading only the columns of the read schema or ``fields``."""
+
+    selected = parse_fields(fields, CampaignRead)
+    rows = (await db.execute(select_columns(Campaign, selected or CampaignRead.model_fields))).all()
+    if selected:
+        return ORJSONResponse(sparse_items(rows, CampaignRead, selected))
+    return validated_response(list[CampaignRead], [row._mapping for row in rows])
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_campaigns(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    admin_user: User = Depends(require_admin(AdminLevel.ADMIN_LEVEL_2)),
+    fmt: ExportFormat = Query(default=ExportFormat.NDJSON, alias="format"),
+) -> StreamingResponse:
+    """Stream every campaign as NDJSON or CSV."""
+
+    await log_admin_action(db, str(admin_user.id), "export_campaigns", None, metadata={"format": fmt.value})
+    stmt = select_columns(Campaign, CampaignRead.model_fields).order_by(Campaign.created_at, Campaign.id)
+    return StreamingResponse(
+        stream_export(stmt, CampaignRead, fmt),
+        media_type=fmt.media_type,
+        headers={"Content-Disposition": f"attachment; filename=campaigns.{fmt.value}"},
+    )
 
 
 @router.patch("/{campaign_id}/status", response_model=CampaignRead)
-def update_campaign_status(
+async def update_campaign_status(
     *,
     campaign_id: UUID,
     payload: AdminCampaignStatusUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     admin_user: User = Depends(require_admin(AdminLevel.ADMIN_LEVEL_1)),
 ) -> CampaignRead:
-    campaign = db.get(Campaign, campaign_id)
+    campaign = await db.get(Campaign, campaign_id)
     if not campaign:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Campaign not found")
 
     campaign.status = payload.status
     db.add(campaign)
-    db.commit()
-    db.refresh(campaign)
-    log_admin_action(db, str(admin_user.id), "update_campaign_status", str(campaign_id), metadata=payload.model_dump())
+    await db.commit()
+    await db.refresh(campaign)
+    await log_admin_action(db, str(admin_user.id), "update_campaign_status", str(campaign_id), metadata=payload.model_dump())
     return CampaignRead.model_validate(campaign)
 
 
 @router.delete("/{campaign_id}")
-def delete_campaign(
+async def delete_campaign(
     *,
     campaign_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     admin_user: User = Depends(require_admin(AdminLevel.ADMIN_LEVEL_3)),
 ) -> None:
-    campaign = db.get(Campaign, campaign_id)
+    campaign = await db.get(Campaign, campaign_id)
     if not campaign:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Campaign not found")
 
-    db.delete(campaign)
-    db.commit()
-    log_admin_action(db, str(admin_user.id), "delete_campaign", str(campaign_id))
+    await db.delete(campaign)
+    await db.commit()
+    await log_admin_action(db, str(admin_user.id), "delete_campaign", str(campaign_id))
     return Response(status_code=status.HTTP_204_NO_CONTENT)
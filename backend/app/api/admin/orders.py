@@ -0,0 +1,36 @@
+"""Admin endpoints for orders."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db, require_admin
+from app.api.fieldsets import select_columns
+from app.core.timing import TimedRoute
+from app.models import Order, User
+from app.models.enums import AdminLevel
+from app.schemas import OrderRead
+from app.services.admin_logs import log_admin_action
+from app.services.exports import ExportFormat, stream_export
+
+router = APIRouter(route_class=TimedRoute)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_orders(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    admin_user: User = Depends(require_admin(AdminLevel.ADMIN_LEVEL_2)),
+    fmt: ExportFormat = Query(default=ExportFormat.NDJSON, alias="format"),
+) -> StreamingResponse:
+    """Stream every order as NDJSON or CSV."""
+
+    await log_admin_action(db, str(admin_user.id), "export_orders", None, metadata={"format": fmt.value})
+    stmt = select_columns(Order, OrderRead.model_fields).order_by(Order.created_at, Order.id)
+    return StreamingResponse(
+        stream_export(stmt, OrderRead, fmt),
+        media_type=fmt.media_type,
+        headers={"Content-Disposition": f"attachment; filename=orders.{fmt.value}"},
+    )
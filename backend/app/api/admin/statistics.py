@@ -4,37 +4,40 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import PlainTextResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, require_admin
+from app.api.deps import get_async_db, get_async_read_db, require_admin
+from app.core.timing import TimedRoute
 from app.models import User
 from app.models.enums import AdminLevel
 from app.schemas import StatisticsResponse
 from app.services import reports
 from app.services.admin_logs import log_admin_action
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get("", response_model=StatisticsResponse)
-def get_statistics(
+async def get_statistics(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    read_db: AsyncSession = Depends(get_async_read_db),
     admin_user: User = Depends(require_admin(AdminLevel.ADMIN_LEVEL_2)),
 ) -> StatisticsResponse:
-    data = reports.generate_statistics(db)
-    log_admin_action(db, str(admin_user.id), "view_statistics", None)
+    data = await read_db.run_sync(reports.generate_statistics)
+    await log_admin_action(db, str(admin_user.id), "view_statistics", None)
     return StatisticsResponse(data=data)
 
 
 @router.get("/export", response_class=PlainTextResponse)
-def export_statistics(
+async def export_statistics(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    read_db: AsyncSession = Depends(get_async_read_db),
     admin_user: User = Depends(require_admin(AdminLevel.ADMIN_LEVEL_2)),
 ) -> PlainTextResponse:
-    csv_content = reports.export_statistics_csv(db)
-    log_admin_action(db, str(admin_user.id), "export_statistics", None)
+    csv_content = await read_db.run_sync(reports.export_statistics_csv)
+    await log_admin_action(db, str(admin_user.id), "export_statistics", None)
     return PlainTextResponse(
         csv_content,
         media_type="text/csv",
@@ -2,39 +2,128 @@
 
 from __future__ import annotations
 
+import re
+from collections import defaultdict
+from collections.abc import Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import ColumnElement, Select, func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, require_admin
-from app.models import User
-from app.models.enums import AdminLevel
-from app.schemas import AdminUserRoleUpdate, UserRead
+from app.api.deps import get_async_db, get_async_read_db, require_admin
+from app.api.fieldsets import FieldsQuery, load_columns, parse_fields, sparse_items, sparse_response
+from app.api.pagination import DEFAULT_PAGE_SIZE, IncludeTotal, PageCursor, PageLimit, count_total, keyset_page
+from app.core.timing import TimedRoute
+from app.models import Application, Campaign, Order, User
+from app.models.enums import AdminLevel, UserRole
+from app.schemas import (
+    AdminUserActivity,
+    AdminUserDirectoryEntry,
+    AdminUserDirectoryResponse,
+    AdminUserRoleUpdate,
+    UserRead,
+)
 from app.services.admin_logs import log_admin_action
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
-@router.get("", response_model=list[UserRead])
-def list_users(
+def email_prefix(dialect_name: str, prefix: str) -> ColumnElement[bool]:
+    """Case-insensitive email prefix match served by ``ix_users_email_lower``."""
+
+    email = func.lower(User.email)
+    prefix = prefix.lower()
+    if dialect_name == "sqlite":
+        # SQLite only uses an expression index for GLOB; the lowered column makes its
+        # case-sensitivity moot, and bracketing the wildcards matches them literally
+        return email.op("GLOB", is_comparison=True)(re.sub(r"([*?\[])", r"[\1]", prefix) + "*")
+    # The pattern is built here rather than with startswith(), so it reaches the planner
+    # as a constant with the default backslash escape
+    return email.like(re.sub(r"([\\%_])", r"\\\1", prefix) + "%")
+
+
+async def _activity(db: AsyncSession, user_ids: Sequence[UUID]) -> dict[UUID, AdminUserActivity]:
+    """Campaign, order and application counts for a page of users, in one round trip."""
+
+    def grouped(column, kind: str) -> Select:
+        return (
+            select(column.label("user_id"), literal(kind).label("kind"), func.count().label("total"))
+            .where(column.in_(user_ids))
+            .group_by(column)
+        )
+
+    stmt = union_all(
+        grouped(Campaign.brand_id, "campaigns"),
+        grouped(Order.brand_id, "orders"),
+        grouped(Order.creator_id, "orders"),
+        grouped(Application.creator_id, "applications"),
+    )
+    counts: dict[UUID, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for user_id, kind, total in await db.execute(stmt):
+        counts[user_id][kind] += total
+    return {user_id: AdminUserActivity(**counts.get(user_id, {})) for user_id in user_ids}
+
+
+@router.get("", response_model=AdminUserDirectoryResponse)
+async def list_users(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     admin_user: User = Depends(require_admin(AdminLevel.ADMIN_LEVEL_1)),
-) -> list[UserRead]:
-    users = db.query(User).all()
-    return [UserRead.model_validate(user) for user in users]
+    role: UserRole | None = None,
+    admin_level: AdminLevel | None = None,
+    is_active: bool | None = None,
+    email: str | None = Query(default=None, min_length=1, description="Email prefix"),
+    include_activity: bool = False,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: PageCursor = None,
+    include_total: IncludeTotal = False,
+    fields: FieldsQuery = None,
+) -> AdminUserDirectoryResponse | JSONResponse:
+    """Return one page of the user directory, newest accounts first."""
+
+    selected = parse_fields(fields, AdminUserDirectoryEntry)
+    stmt: Select[tuple[User]] = select(User)
+    if role is not None:
+        stmt = stmt.where(User.role == role)
+    if admin_level is not None:
+        stmt = stmt.where(User.admin_level == admin_level)
+    if is_active is not None:
+        stmt = stmt.where(User.is_active == is_active)
+    if email:
+        stmt = stmt.where(email_prefix(db.get_bind().dialect.name, email))
+
+    columns = load_columns(User, selected or AdminUserDirectoryEntry.model_fields, always=(User.created_at, User.id))
+    users, next_cursor = await keyset_page(
+        db, stmt.options(columns), order=(User.created_at, User.id), cursor=cursor, limit=limit
+    )
+    activity = await _activity(db, [user.id for user in users]) if include_activity and users else {}
+    response = AdminUserDirectoryResponse(items=[], next_cursor=next_cursor)
+    if include_total:
+        response.total, response.total_is_estimate = await count_total(db, stmt)
+
+    if selected:
+        items = sparse_items(users, AdminUserDirectoryEntry, selected - {"activity"})
+        if "activity" in selected:
+            for user, item in zip(users, items):
+                item["activity"] = activity[user.id].model_dump() if user.id in activity else None
+        return sparse_response(response.model_dump(mode="json", exclude={"items"}), items)
+    response.items = [AdminUserDirectoryEntry.model_validate(user) for user in users]
+    for item in response.items:
+        item.activity = activity.get(item.id)
+    return response
 
 
 @router.patch("/{user_id}/role", response_model=UserRead)
-def update_user_role(
+async def update_user_role(
     *,
     user_id: UUID,
     payload: AdminUserRoleUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     admin_user: User = Depends(require_admin(AdminLevel.ADMIN_LEVEL_3)),
 ) -> UserRead:
-    user = db.get(User, user_id)
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -46,24 +135,24 @@ def update_user_role(
         user.permissions = payload.permissions
 
     db.add(user)
-    db.commit()
-    db.refresh(user)
-    log_admin_action(db, str(admin_user.id), "update_user_role", str(user.id), metadata=payload.model_dump())
+    await db.commit()
+    await db.refresh(user)
+    await log_admin_action(db, str(admin_user.id), "update_user_role", str(user.id), metadata=payload.model_dump())
     return UserRead.model_validate(user)
 
 
 @router.delete("/{user_id}")
-def delete_user(
+async def delete_user(
     *,
     user_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     admin_user: User = Depends(require_admin(AdminLevel.ADMIN_LEVEL_3)),
 ) -> None:
-    user = db.get(User, user_id)
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    db.delete(user)
-    db.commit()
-    log_admin_action(db, str(admin_user.id), "delete_user", str(user_id))
+    await db.delete(user)
+    await db.commit()
+    await log_admin_action(db, str(admin_user.id), "delete_user", str(user_id))
     return Response(status_code=status.HTTP_204_NO_CONTENT)
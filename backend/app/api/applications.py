@@ -10,10 +10,11 @@ from sqlalchemy.orm import Session
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.deps import get_db
+from app.core.timing import TimedRoute
 from app.models import Application, Campaign, User
 from app.schemas import ApplicationCreate, ApplicationRead
 
-router = APIRouter(prefix="/applications")
+router = APIRouter(prefix="/applications", route_class=TimedRoute)
 
 SessionDep = Annotated[Session, Depends(get_db)]
 
@@ -7,18 +7,21 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.api.deps import get_db
+from app.core.hashing import password_pool
 from app.core.security import (
+    DUMMY_PASSWORD_HASH,
     TokenError,
     create_access_token,
     create_refresh_token,
     get_subject,
-    hash_password,
+    password_needs_rehash,
     revoke_refresh_token,
-    verify_password,
     verify_token,
 )
+from app.core.timing import TimedRoute
 from app.models import User, UserRole
 from app.models.enums import AdminLevel
 from app.schemas import (
@@ -30,21 +33,32 @@ from app.schemas import (
     UserRead,
 )
 
-router = APIRouter(prefix="/auth")
+router = APIRouter(prefix="/auth", route_class=TimedRoute)
+
+
+def _save_user(db: Session, user: User) -> None:
+    db.add(user)
+    try:
+        db.commit()
+    except IntegrityError as exc:  # pragma: no cover - central handler
+        db.rollback()
+        raise exc
+    db.refresh(user)
 
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def register_user(payload: UserCreate, db: Session = Depends(get_db)) -> UserRead:
+async def register_user(payload: UserCreate, db: Session = Depends(get_db)) -> UserRead:
     """Register a new user account."""
 
-    existing = db.scalar(select(User).where(User.email == payload.email))
+    # Hashing runs on the dedicated pool; only the short DB calls use the threadpool
+    existing = await run_in_threadpool(db.scalar, select(User).where(User.email == payload.email))
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User with this email already exists",
         )
 
-    hashed = hash_password(payload.password)
+    hashed = await password_pool.hash(payload.password)
     user = User(
         email=payload.email,
         hashed_password=hashed,
@@ -53,27 +67,28 @@ def register_user(payload: UserCreate, db: Session = Depends(get_db)) -> UserRea
         admin_level=payload.admin_level if isinstance(payload.admin_level, AdminLevel) else AdminLevel(payload.admin_level),
         permissions=payload.permissions or {},
     )
-    db.add(user)
-    try:
-        db.commit()
-    except IntegrityError as exc:  # pragma: no cover - central handler
-        db.rollback()
-        raise exc
-    db.refresh(user)
+    await run_in_threadpool(_save_user, db, user)
     return UserRead.model_validate(user)
 
 
 @router.post("/login", response_model=TokenResponse)
-def login_user(payload: LoginRequest, db: Session = Depends(get_db)) -> TokenResponse:
+async def login_user(payload: LoginRequest, db: Session = Depends(get_db)) -> TokenResponse:
     """Validate credentials and return a bearer token."""
 
-    user = db.scalar(select(User).where(User.email == payload.email))
-    if not user or not verify_password(payload.password, user.hashed_password):
+    user = await run_in_threadpool(db.scalar, select(User).where(User.email == payload.email))
+    # Always pay for one KDF run; skipping it for unknown emails would reveal which ones are registered
+    verified = await password_pool.verify(payload.password, user.hashed_password if user else DUMMY_PASSWORD_HASH)
+    if not user or not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
 
+    if password_needs_rehash(user.hashed_password):
+        # Upgrade legacy SHA-256 (or lower-cost) hashes while the plaintext is at hand
+        user.hashed_password = await password_pool.hash(payload.password)
+        await run_in_threadpool(_save_user, db, user)
+
     claims = {"sub": str(user.id), "role": user.role.value}
     access_token = create_access_token(claims)
     refresh_token = create_refresh_token(claims)
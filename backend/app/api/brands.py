@@ -7,11 +7,12 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user_sync, get_db
+from app.core.timing import TimedRoute
 from app.models import Brand, User, UserRole
 from app.schemas import BrandCreate, BrandRead
 
-router = APIRouter(prefix="/brands")
+router = APIRouter(prefix="/brands", route_class=TimedRoute)
 
 
 @router.post("", response_model=BrandRead, status_code=status.HTTP_201_CREATED)
@@ -19,7 +20,7 @@ def create_brand(
     *,
     payload: BrandCreate,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[User, Depends(get_current_user_sync)],
 ) -> BrandRead:
     """Create a brand profile for the authenticated brand user."""
 
@@ -5,42 +5,71 @@ from __future__ import annotations
 from typing import Annotated
 from uuid import UUID
 
-from sqlalchemy import Select, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response
 
-from app.api.deps import get_current_user, get_db
+from app.api.conditional import etag_matches, listing_etag, not_modified
+from app.api.deps import get_async_db, get_async_read_db, get_current_user
+from app.api.fieldsets import FieldsQuery, parse_fields, select_columns, sparse_items, sparse_response
+from app.api.pagination import DEFAULT_PAGE_SIZE, IncludeTotal, PageCursor, PageLimit, count_total, keyset_page
+from app.core.serialization import validated_response
+from app.core.timing import TimedRoute
 from app.models import Campaign, CampaignStatus, User, UserRole
 from app.schemas import CampaignCreate, CampaignListResponse, CampaignRead
 from app.services.notifications import schedule_notification
 
-router = APIRouter(prefix="/campaigns")
+router = APIRouter(prefix="/campaigns", route_class=TimedRoute)
 
-SessionDep = Annotated[Session, Depends(get_db)]
+SessionDep = Annotated[AsyncSession, Depends(get_async_db)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_async_read_db)]
 
 
 @router.get("", response_model=CampaignListResponse)
-def list_campaigns(
+async def list_campaigns(
     *,
-    db: SessionDep,
+    db: ReadSessionDep,
+    request: Request,
     status_filter: CampaignStatus | None = Query(default=None, alias="status"),
     brand_id: UUID | None = None,
-) -> CampaignListResponse:
-    """Return campaigns filtered by status and/or brand."""
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: PageCursor = None,
+    include_total: IncludeTotal = False,
+    fields: FieldsQuery = None,
+) -> Response:
+    """Return one page of campaigns, newest first, filtered by status and/or brand.
+
+    Pages carry a weak ``ETag``; polling with it in ``If-None-Match`` returns 304
+    until a campaign in the filtered set changes.
+    """
+
+    selected = parse_fields(fields, CampaignRead)
 
-    stmt: Select[tuple[Campaign]] = select(Campaign)
+    stmt = select_columns(Campaign, selected or CampaignRead.model_fields, always=(Campaign.created_at, Campaign.id))
     if status_filter:
         stmt = stmt.where(Campaign.status == status_filter)
     if brand_id:
         stmt = stmt.where(Campaign.brand_id == brand_id)
 
-    items = list(db.scalars(stmt).all())
-    return CampaignListResponse(items=[CampaignRead.model_validate(item) for item in items], total=len(items))
+    etag = await listing_etag(db, stmt, Campaign.updated_at, Campaign.row_version, request.url.query)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+
+    items, next_cursor = await keyset_page(
+        db, stmt, order=(Campaign.created_at, Campaign.id), cursor=cursor, limit=limit
+    )
+    total, total_is_estimate = await count_total(db, stmt) if include_total else (None, False)
+    page = {"next_cursor": next_cursor, "total": total, "total_is_estimate": total_is_estimate}
+    if selected:
+        return sparse_response(page, sparse_items(items, CampaignRead, selected), headers={"ETag": etag})
+    return validated_response(
+        CampaignListResponse, {**page, "items": [row._mapping for row in items]}, headers={"ETag": etag}
+    )
 
 
 @router.post("", response_model=CampaignRead, status_code=status.HTTP_201_CREATED)
-def create_campaign(
+async def create_campaign(
     *,
     db: SessionDep,
     payload: CampaignCreate,
@@ -60,7 +89,7 @@ def create_campaign(
             detail="Brands may only create campaigns for their own account",
         )
 
-    brand = db.get(User, resolved_brand_id)
+    brand = await db.get(User, resolved_brand_id)
     if not brand:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Brand not found")
 
@@ -72,8 +101,8 @@ def create_campaign(
         brand_id=resolved_brand_id,
     )
     db.add(campaign)
-    db.commit()
-    db.refresh(campaign)
+    await db.commit()
+    await db.refresh(campaign)
     schedule_notification(
         background_tasks,
         user_id=resolved_brand_id,
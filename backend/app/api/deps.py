@@ -1,14 +1,16 @@
 """Shared API dependencies."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.security import TokenError, get_subject, verify_token
-from app.db.session import get_session
+from app.core.auth_context import AuthContext, get_auth_context
+from app.db.session import get_async_read_session, get_async_session, get_read_session, get_session
 from app.models import User
 from app.models.enums import AdminLevel
 
@@ -21,29 +23,75 @@ def get_db() -> Generator[Session, None, None]:
     yield from get_session()
 
 
-def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(auth_scheme)],
-    db: Annotated[Session, Depends(get_db)],
-) -> User:
-    """Resolve the currently authenticated user from the Authorization header."""
+def get_read_db() -> Generator[Session, None, None]:
+    """Provide a session for read-only work that may be served by a replica."""
+
+    yield from get_read_session()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Provide an async database session to request scope."""
+
+    async for session in get_async_session():
+        yield session
+
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Provide an async session for read-only work that may be served by a replica."""
+
+    async for session in get_async_read_session():
+        yield session
+
+
+def get_auth(request: Request) -> AuthContext:
+    """Return the request-scoped auth context, decoding the token at most once."""
+
+    return get_auth_context(request.scope)
+
 
-    if credentials is None:
+def _authenticated_user_id(credentials: HTTPAuthorizationCredentials | None, auth: AuthContext) -> UUID:
+    # ``credentials`` keeps the bearer scheme in the OpenAPI schema; the token
+    # itself has already been decoded into the auth context.
+    if credentials is None or auth.token is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    if auth.user_id is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=auth.error or "Invalid token")
+    return auth.user_id
 
-    token = credentials.credentials
-    try:
-        payload = verify_token(token, expected_type="access")
-        user_id = get_subject(payload)
-    except TokenError as exc:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc)) from exc
 
-    user = db.get(User, user_id)
+def _require_user(user: User | None) -> User:
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
-
     return user
 
 
+async def get_current_user(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(auth_scheme)],
+    auth: Annotated[AuthContext, Depends(get_auth)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> User:
+    """Resolve the currently authenticated user from the Authorization header."""
+
+    user_id = _authenticated_user_id(credentials, auth)
+    return _require_user(await db.get(User, user_id))
+
+
+def get_current_user_sync(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(auth_scheme)],
+    auth: Annotated[AuthContext, Depends(get_auth)],
+    db: Annotated[Session, Depends(get_db)],
+) -> User:
+    """Resolve the authenticated user on the request's sync ``get_db`` session.
+
+    Sync routers depend on this instead of :func:`get_current_user`, so the
+    request holds one connection and the user is attached to the session the
+    handler works with.
+    """
+
+    user_id = _authenticated_user_id(credentials, auth)
+    return _require_user(db.get(User, user_id))
+
+
 _ADMIN_LEVEL_ORDER = {
     AdminLevel.NONE: 0,
     AdminLevel.ADMIN_LEVEL_1: 1,
@@ -53,7 +101,7 @@ _ADMIN_LEVEL_ORDER = {
 
 
 def require_admin(min_level: AdminLevel = AdminLevel.ADMIN_LEVEL_1):
-    def dependency(current_user: Annotated[User, Depends(get_current_user)]) -> User:
+    async def dependency(current_user: Annotated[User, Depends(get_current_user)]) -> User:
         user_level_value = _ADMIN_LEVEL_ORDER.get(current_user.admin_level, 0)
         required_value = _ADMIN_LEVEL_ORDER.get(min_level, 0)
         if user_level_value < required_value:
@@ -0,0 +1,86 @@
+"""Sparse fieldsets (``?fields=id,title``) for list endpoints.
+
+The requested fields narrow both sides of a list request: the SQL select
+only loads the matching columns (``load_only``), and the response items only
+carry those keys. Without ``fields`` the select still loads just the columns
+the read schema uses, so large unused text columns never leave the database.
+
+Hot list endpoints go one step further with :func:`select_columns`: a plain
+column select returns row tuples, skipping ORM instances, the identity map
+and attribute instrumentation entirely. :func:`load_columns` remains for
+endpoints whose schemas need real ORM objects.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Annotated, Any
+
+from fastapi import HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from sqlalchemy import Select, select
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.interfaces import LoaderOption
+
+FieldsQuery = Annotated[
+    str | None, Query(description="Comma-separated fields to return for each item, e.g. id,title,status")
+]
+
+
+def parse_fields(raw: str | None, schema: type[BaseModel]) -> frozenset[str] | None:
+    """Validate ``fields`` against the item schema; None means every field."""
+
+    if raw is None:
+        return None
+    fields = frozenset(name.strip() for name in raw.split(",") if name.strip())
+    unknown = fields - schema.model_fields.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    return fields or None
+
+
+def load_columns(model: type, fields: Iterable[str], *, always: Sequence[Any] = ()) -> LoaderOption:
+    """``load_only`` option for the mapped columns among ``fields`` plus ``always``.
+
+    Unloaded attributes raise on access instead of lazy loading, so a schema
+    that reads a pruned column fails loudly rather than issuing a query per row.
+    """
+
+    column_names = model.__mapper__.column_attrs.keys()
+    columns = [getattr(model, name) for name in fields if name in column_names]
+    return load_only(*columns, *always, raiseload=True)
+
+
+def select_columns(model: type, fields: Iterable[str], *, always: Sequence[Any] = ()) -> Select:
+    """Column select of ``always`` plus the mapped columns among ``fields``, yielding row tuples.
+
+    Rows expose the columns as attributes, so they validate against the read
+    schema (``from_attributes``) and feed :func:`sparse_items` like ORM objects.
+    """
+
+    mapped = model.__mapper__.columns
+    keys = [column.key for column in always]
+    keys += [name for name in fields if name in mapped and name not in keys]
+    return select(*(getattr(model, key) for key in keys))
+
+
+def sparse_items(items: Iterable[Any], schema: type[BaseModel], fields: frozenset[str]) -> list[dict[str, Any]]:
+    """Serialise only ``fields`` of each ORM item or row, applying the schema's field serializers."""
+
+    # Values come straight from typed ORM columns, so validation is skipped; the
+    # schema's serializers still run for the included fields
+    return [
+        schema.model_construct(**{name: getattr(item, name) for name in fields}).model_dump(mode="json", include=fields)
+        for item in items
+    ]
+
+
+def sparse_response(
+    page: dict[str, Any], items: list[dict[str, Any]], *, headers: Mapping[str, str] | None = None
+) -> ORJSONResponse:
+    """Render a list response whose items were pruned by :func:`sparse_items`."""
+
+    return ORJSONResponse({**page, "items": items}, headers=headers)
@@ -2,52 +2,84 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from typing import Annotated
 from uuid import UUID
 
-from sqlalchemy import Select, select
-from sqlalchemy.orm import Session
+from sqlalchemy import false, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
 
-from app.api.deps import get_db
+from app.api.deps import get_async_db, get_async_read_db
+from app.api.fieldsets import FieldsQuery, parse_fields, select_columns, sparse_items, sparse_response
+from app.api.pagination import DEFAULT_PAGE_SIZE, IncludeTotal, PageCursor, PageLimit, count_total, keyset_page
+from app.core.serialization import validated_response
+from app.core.timing import TimedRoute
 from app.models import Notification, User
 from app.schemas import (
     NotificationListResponse,
     NotificationMarkReadRequest,
     NotificationMarkReadResponse,
     NotificationRead,
+    NotificationUnreadCountResponse,
 )
+from app.services.notifications import adjust_unread_counters, unread_count
 
-router = APIRouter(prefix="/notifications")
+router = APIRouter(prefix="/notifications", route_class=TimedRoute)
 
-SessionDep = Annotated[Session, Depends(get_db)]
+SessionDep = Annotated[AsyncSession, Depends(get_async_db)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_async_read_db)]
 
 
 @router.get("", response_model=NotificationListResponse)
-def list_notifications(
+async def list_notifications(
     *,
-    db: SessionDep,
+    db: ReadSessionDep,
     user_id: UUID | None = None,
     is_read: bool | None = Query(default=None),
-) -> NotificationListResponse:
-    """Return notifications with optional filtering."""
-
-    stmt: Select[tuple[Notification]] = select(Notification).order_by(Notification.created_at.desc())
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: PageCursor = None,
+    include_total: IncludeTotal = False,
+    fields: FieldsQuery = None,
+) -> Response:
+    """Return one page of notifications, newest first, with optional filtering."""
+
+    selected = parse_fields(fields, NotificationRead)
+    stmt = select_columns(
+        Notification, selected or NotificationRead.model_fields, always=(Notification.created_at, Notification.id)
+    )
     if user_id:
-        user_exists = db.get(User, user_id)
+        user_exists = await db.get(User, user_id)
         if not user_exists:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
         stmt = stmt.where(Notification.user_id == user_id)
     if is_read is not None:
         stmt = stmt.where(Notification.is_read == is_read)
 
-    items = list(db.scalars(stmt).all())
-    return NotificationListResponse(items=[NotificationRead.model_validate(item) for item in items], total=len(items))
+    items, next_cursor = await keyset_page(
+        db, stmt, order=(Notification.created_at, Notification.id), cursor=cursor, limit=limit
+    )
+    total, total_is_estimate = await count_total(db, stmt) if include_total else (None, False)
+    page = {"next_cursor": next_cursor, "total": total, "total_is_estimate": total_is_estimate}
+    if selected:
+        return sparse_response(page, sparse_items(items, NotificationRead, selected))
+    return validated_response(NotificationListResponse, {**page, "items": [row._mapping for row in items]})
+
+
+@router.get("/unread-count", response_model=NotificationUnreadCountResponse)
+async def get_unread_count(*, db: SessionDep, user_id: UUID) -> NotificationUnreadCountResponse:
+    """Return a user's unread notification count from their counter."""
+
+    unread = await unread_count(db, user_id)
+    if unread is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return NotificationUnreadCountResponse(user_id=user_id, unread=unread)
 
 
 @router.post("/mark-read", response_model=NotificationMarkReadResponse)
-def mark_notifications_read(
+async def mark_notifications_read(
     *,
     db: SessionDep,
     payload: NotificationMarkReadRequest,
@@ -57,11 +89,17 @@ def mark_notifications_read(
     if not payload.notification_ids:
         return NotificationMarkReadResponse(updated=0)
 
-    stmt = select(Notification).where(Notification.id.in_(payload.notification_ids))
-    notifications = list(db.scalars(stmt).all())
-    for notification in notifications:
-        notification.is_read = True
-        db.add(notification)
-
-    db.commit()
-    return NotificationMarkReadResponse(updated=len(notifications))
+    # Flip and collect in one statement: of two concurrent requests for the same ids, only
+    # one gets each row back, so counters are decremented exactly once per notification
+    stmt = (
+        update(Notification)
+        .where(Notification.id.in_(payload.notification_ids), Notification.is_read == false())
+        .values(is_read=True)
+        .returning(Notification.user_id)
+        .execution_options(synchronize_session=False)
+    )
+    newly_read = Counter((await db.scalars(stmt)).all())
+
+    await adjust_unread_counters(db, {user_id: -count for user_id, count in newly_read.items()})
+    await db.commit()
+    return NotificationMarkReadResponse(updated=newly_read.total())
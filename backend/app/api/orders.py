@@ -2,36 +2,66 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
-from sqlalchemy import Select, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response
 
-from app.api.deps import get_db
+from app.api.conditional import etag_matches, listing_etag, not_modified
+from app.api.deps import get_async_db, get_async_read_db
+from app.api.fieldsets import FieldsQuery, parse_fields, select_columns, sparse_items, sparse_response
+from app.api.pagination import (
+    DEFAULT_PAGE_SIZE,
+    IncludeTotal,
+    PageCursor,
+    PageLimit,
+    at_or_after,
+    count_total,
+    keyset_page,
+)
+from app.core.serialization import validated_response
+from app.core.timing import TimedRoute
 from app.models import Order, OrderStatus
 from app.schemas import OrderListResponse, OrderRead, OrderStatusUpdate
 from app.services.notifications import schedule_batch_notifications
 
-router = APIRouter(prefix="/orders")
+router = APIRouter(prefix="/orders", route_class=TimedRoute)
 
-SessionDep = Annotated[Session, Depends(get_db)]
+SessionDep = Annotated[AsyncSession, Depends(get_async_db)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_async_read_db)]
 
 
 @router.get("", response_model=OrderListResponse)
-def list_orders(
+async def list_orders(
     *,
-    db: SessionDep,
+    db: ReadSessionDep,
+    request: Request,
     status_filter: OrderStatus | None = Query(default=None, alias="status"),
     campaign_id: UUID | None = None,
     creator_id: UUID | None = None,
     brand_id: UUID | None = None,
-) -> OrderListResponse:
-    """Return orders filtered by participant or status."""
+    updated_since: datetime | None = None,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: PageCursor = None,
+    include_total: IncludeTotal = False,
+    fields: FieldsQuery = None,
+) -> Response:
+    """Return one page of orders, most recently updated first, filtered by participant or status.
+
+    Clients sync incrementally by passing the newest ``updated_at`` they have
+    seen as ``updated_since`` and paging through the changes. Those pages run
+    oldest change first and include rows at the watermark itself, so an
+    interrupted sync resumes from its last cursor without gaps. Pages carry a
+    weak ``ETag``; polling with it in ``If-None-Match`` returns 304 until an
+    order in the filtered set changes.
+    """
 
-    stmt: Select[tuple[Order]] = select(Order)
+    selected = parse_fields(fields, OrderRead)
+    stmt = select_columns(Order, selected or OrderRead.model_fields, always=(Order.updated_at, Order.id))
     if status_filter:
         stmt = stmt.where(Order.status == status_filter)
     if campaign_id:
@@ -40,13 +70,27 @@ def list_orders(
         stmt = stmt.where(Order.creator_id == creator_id)
     if brand_id:
         stmt = stmt.where(Order.brand_id == brand_id)
+    if updated_since:
+        stmt = stmt.where(at_or_after(db, Order.updated_at, updated_since))
+
+    etag = await listing_etag(db, stmt, Order.updated_at, Order.row_version, request.url.query)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
 
-    items = list(db.scalars(stmt).all())
-    return OrderListResponse(items=[OrderRead.model_validate(item) for item in items], total=len(items))
+    items, next_cursor = await keyset_page(
+        db, stmt, order=(Order.updated_at, Order.id), cursor=cursor, limit=limit, descending=updated_since is None
+    )
+    total, total_is_estimate = await count_total(db, stmt) if include_total else (None, False)
+    page = {"next_cursor": next_cursor, "total": total, "total_is_estimate": total_is_estimate}
+    if selected:
+        return sparse_response(page, sparse_items(items, OrderRead, selected), headers={"ETag": etag})
+    return validated_response(
+        OrderListResponse, {**page, "items": [row._mapping for row in items]}, headers={"ETag": etag}
+    )
 
 
 @router.patch("/{order_id}", response_model=OrderRead)
-def update_order_status(
+async def update_order_status(
     *,
     db: SessionDep,
     order_id: UUID,
@@ -55,14 +99,14 @@ def update_order_status(
 ) -> OrderRead:
     """Update order status."""
 
-    order = db.get(Order, order_id)
+    order = await db.get(Order, order_id)
     if not order:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Order not found")
 
     order.status = payload.status
     db.add(order)
-    db.commit()
-    db.refresh(order)
+    await db.commit()
+    await db.refresh(order)
     message = f"Order {order.id} status updated to {payload.status.value}"
     schedule_batch_notifications(
         background_tasks,
@@ -0,0 +1,118 @@
+"""Keyset (cursor) pagination for list endpoints.
+
+Pages are ordered by a ``(timestamp, id)`` pair and continue strictly after
+the last row of the previous page, so each page costs one index range scan
+however deep the client has paged. The cursor is an opaque URL-safe token
+holding that last pair.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from typing import Annotated, Any, TypeVar
+from uuid import UUID
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy import ColumnElement, Select, String, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+T = TypeVar("T")
+
+# Query parameter types shared by paginated endpoints
+PageLimit = Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE, description="Page size")]
+PageCursor = Annotated[str | None, Query(description="Opaque cursor from the previous page's next_cursor")]
+IncludeTotal = Annotated[bool, Query(description="Also count matching rows (estimated on PostgreSQL)")]
+
+
+def encode_cursor(timestamp: datetime, row_id: UUID) -> str:
+    raw = json.dumps([timestamp.isoformat(), str(row_id)], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Parse a cursor from :func:`encode_cursor`, rejecting malformed ones with 400."""
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        timestamp, row_id = json.loads(raw)
+        return datetime.fromisoformat(timestamp), UUID(row_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from None
+
+
+def _bound(value: datetime, dialect_name: str) -> Any:
+    if dialect_name == "sqlite":
+        if value.tzinfo is not None:
+            # Stored values are naive UTC; an offset suffix would break the text comparison
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        # CURRENT_TIMESTAMP defaults are stored as "YYYY-MM-DD HH:MM:SS" text; compare in the same
+        # form, or equal timestamps would sort apart and rows at the page boundary would be lost
+        return literal(value.isoformat(" "), String())
+    return value
+
+
+def at_or_after(db: AsyncSession, column: InstrumentedAttribute, value: datetime) -> ColumnElement[bool]:
+    """``column >= value`` with ``value`` bound the same way as cursor timestamps."""
+
+    return column >= _bound(value, db.get_bind().dialect.name)
+
+
+async def keyset_page(
+    db: AsyncSession,
+    stmt: Select[tuple[T]],
+    *,
+    order: tuple[InstrumentedAttribute, InstrumentedAttribute],
+    cursor: str | None,
+    limit: int,
+    descending: bool = True,
+) -> tuple[Sequence[T], str | None]:
+    """Run one page of ``stmt`` ordered by ``order``; return the rows and the next cursor.
+
+    An entity select (``select(Model)``) returns ORM instances; a column select
+    returns row tuples, which must include both ``order`` columns.
+    """
+
+    timestamp_column, id_column = order
+    if cursor is not None:
+        after_timestamp, after_id = decode_cursor(cursor)
+        key = tuple_(timestamp_column, id_column)
+        bound = tuple_(_bound(after_timestamp, db.get_bind().dialect.name), after_id)
+        stmt = stmt.where(key < bound if descending else key > bound)
+    if descending:
+        stmt = stmt.order_by(timestamp_column.desc(), id_column.desc())
+    else:
+        stmt = stmt.order_by(timestamp_column, id_column)
+
+    # One extra row tells whether another page exists without a COUNT
+    result = await db.execute(stmt.limit(limit + 1))
+    rows = result.scalars().all() if len(stmt.column_descriptions) == 1 else result.all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, timestamp_column.key), getattr(last, id_column.key))
+
+
+async def count_total(db: AsyncSession, stmt: Select) -> tuple[int, bool]:
+    """Count rows matching ``stmt``; returns ``(total, is_estimate)``.
+
+    On PostgreSQL the planner's row estimate is returned instead of running
+    ``COUNT(*)``, which would scan every matching row.
+    """
+
+    stmt = stmt.order_by(None)
+    connection = await db.connection(bind_arguments={"clause": stmt})
+    if connection.dialect.name == "postgresql":
+        sql = stmt.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+        plan = (await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()
+        return int(plan[0]["Plan"]["Plan Rows"]), True
+    total = await db.scalar(select(func.count()).select_from(stmt.subquery()))
+    return int(total or 0), False
@@ -9,11 +9,12 @@ from sqlalchemy.orm import Session
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 
 from app.api.deps import get_db
+from app.core.timing import TimedRoute
 from app.models import Order, Payment, PaymentStatus
 from app.schemas import PaymentCreate, PaymentRead
 from app.services.notifications import schedule_batch_notifications
 
-router = APIRouter(prefix="/payments")
+router = APIRouter(prefix="/payments", route_class=TimedRoute)
 
 SessionDep = Annotated[Session, Depends(get_db)]
 
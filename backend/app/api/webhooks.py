@@ -6,9 +6,10 @@ import logging
 from typing import Annotated
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
+from app.api.deps import get_async_db
+from app.core.timing import TimedRoute
 from app.models import Order, OrderStatus, Payment, PaymentStatus, WebhookEvent
 from app.schemas import (
     OrderWebhookPayload,
@@ -19,13 +20,13 @@ from app.services.notifications import schedule_batch_notifications
 
 logger = logging.getLogger("ugc.webhooks")
 
-router = APIRouter(prefix="/webhooks")
+router = APIRouter(prefix="/webhooks", route_class=TimedRoute)
 
-SessionDep = Annotated[Session, Depends(get_db)]
+SessionDep = Annotated[AsyncSession, Depends(get_async_db)]
 
 
 @router.post("/payment", response_model=WebhookAckResponse)
-def handle_payment_webhook(
+async def handle_payment_webhook(
     payload: PaymentWebhookPayload,
     background_tasks: BackgroundTasks,
     db: SessionDep,
@@ -33,20 +34,22 @@ def handle_payment_webhook(
     """Process payment status updates."""
 
     payload_dict = payload.model_dump(mode="json")
-    logger.info("Received payment webhook: %s", payload_dict)
+    logger.info("Received payment webhook: payment=%s status=%s", payload.payment_id, payload.status.value)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Payment webhook payload: %s", payload_dict)
     event = WebhookEvent(event_type="payment", payload=payload_dict, signature=payload.signature)
     db.add(event)
 
-    payment = db.get(Payment, payload.payment_id)
+    payment = await db.get(Payment, payload.payment_id)
     if not payment:
-        db.commit()
+        await db.commit()
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Payment not found")
 
     payment.status = payload.status
     db.add(payment)
-    db.commit()
+    await db.commit()
 
-    order = db.get(Order, payment.order_id)
+    order = await db.get(Order, payment.order_id)
     if order:
         notifications = []
         message = f"Payment {payload.status.value} for order {order.id}"
@@ -61,7 +64,7 @@ def handle_payment_webhook(
 
 
 @router.post("/order", response_model=WebhookAckResponse)
-def handle_order_webhook(
+async def handle_order_webhook(
     payload: OrderWebhookPayload,
     background_tasks: BackgroundTasks,
     db: SessionDep,
@@ -69,19 +72,21 @@ def handle_order_webhook(
     """Process order status updates from external systems."""
 
     payload_dict = payload.model_dump(mode="json")
-    logger.info("Received order webhook: %s", payload_dict)
+    logger.info("Received order webhook: order=%s status=%s", payload.order_id, payload.status.value)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Order webhook payload: %s", payload_dict)
     event = WebhookEvent(event_type="order", payload=payload_dict, signature=payload.signature)
     db.add(event)
 
-    order = db.get(Order, payload.order_id)
+    order = await db.get(Order, payload.order_id)
     if not order:
-        db.commit()
+        await db.commit()
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Order not found")
 
     order.status = payload.status
     db.add(order)
-    db.commit()
-    db.refresh(order)
+    await db.commit()
+    await db.refresh(order)
 
     message = payload.message or f"Order {order.id} status updated to {payload.status.value}"
     schedule_batch_notifications(
@@ -0,0 +1,103 @@
+"""Sampled access logging in text or structured JSON form."""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+from collections.abc import Callable
+
+from loguru import logger
+
+
+def parse_sample_rates(raw: str) -> dict[str, float]:
+    """Parse ``"2xx=0.1,/health=0.01"`` into a key -> rate mapping."""
+
+    rates: dict[str, float] = {}
+    for chunk in raw.split(","):
+        if "=" not in chunk:
+            continue
+        key, rate = chunk.split("=", 1)
+        if key.strip():
+            rates[key.strip()] = min(max(float(rate), 0.0), 1.0)
+    return rates
+
+
+class AccessLogSampler:
+    """Decide which requests are written to the access log.
+
+    Responses with a status of ``always_keep_status`` or above (every 4xx and
+    5xx by default) and requests slower than ``slow_ms`` are always kept. Other
+    requests are kept with the rate of the longest matching route prefix, or
+    failing that the rate for their status class (``2xx``, ``4xx``...).
+    """
+
+    def __init__(
+        self,
+        status_rates: dict[str, float] | None = None,
+        route_rates: dict[str, float] | None = None,
+        slow_ms: float = 500.0,
+        always_keep_status: int = 400,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.status_rates = status_rates or {}
+        self.route_rates = sorted((route_rates or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        self.slow_ms = slow_ms
+        self.always_keep_status = always_keep_status
+        self._rng = rng
+
+    def rate_for(self, path: str, status_code: int) -> float:
+        for prefix, rate in self.route_rates:
+            if path.startswith(prefix):
+                return rate
+        return self.status_rates.get(f"{status_code // 100}xx", 1.0)
+
+    def should_log(self, path: str, status_code: int, duration_ms: float) -> bool:
+        if status_code >= self.always_keep_status or duration_ms >= self.slow_ms:
+            return True
+        rate = self.rate_for(path, status_code)
+        return rate >= 1.0 or (rate > 0.0 and self._rng() < rate)
+
+
+class AccessLogger:
+    """Write one access record per sampled request through loguru."""
+
+    def __init__(self, sampler: AccessLogSampler, fmt: str = "text") -> None:
+        self.sampler = sampler
+        self.json = fmt == "json"
+        self._logger = logger.bind(access_log=True)
+
+    def log(
+        self,
+        *,
+        method: str,
+        path: str,
+        client_ip: str,
+        user: object,
+        status_code: int,
+        duration_ms: float,
+    ) -> None:
+        if not self.sampler.should_log(path, status_code, duration_ms):
+            return
+        if self.json:
+            record = {
+                "ts": round(time.time(), 3),
+                "method": method,
+                "path": path,
+                "status": status_code,
+                "duration_ms": round(duration_ms, 2),
+                "ip": client_ip,
+                "user": str(user) if user else None,
+            }
+            # Pre-rendered message: no loguru formatting pass over the JSON braces
+            self._logger.info(json.dumps(record, separators=(",", ":")))
+            return
+        self._logger.info(
+            "[REQUEST] {method} {path} from {ip} user={user} -> {status} ({duration:.2f} ms)",
+            method=method,
+            path=path,
+            ip=client_ip,
+            user=user or "-",
+            status=status_code,
+            duration=duration_ms,
+        )
@@ -0,0 +1,57 @@
+"""Request-scoped authentication context shared by middleware and dependencies."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from starlette.datastructures import Headers
+from starlette.types import Scope
+
+from app.core.security import TokenError, get_subject, verify_token
+
+AUTH_CONTEXT_KEY = "auth_context"
+
+
+@dataclass(slots=True)
+class AuthContext:
+    """Outcome of decoding the bearer token of a single request."""
+
+    token: str | None = None
+    payload: dict[str, Any] | None = None
+    user_id: UUID | None = None
+    error: str | None = None
+
+    @property
+    def is_authenticated(self) -> bool:
+        return self.user_id is not None
+
+
+def _resolve(headers: Headers) -> AuthContext:
+    auth_header = headers.get("Authorization")
+    if not auth_header or not auth_header.lower().startswith("bearer "):
+        return AuthContext()
+
+    token = auth_header.split(" ", 1)[1]
+    try:
+        payload = verify_token(token, expected_type="access")
+        user_id = get_subject(payload)
+    except TokenError as exc:
+        return AuthContext(token=token, error=str(exc))
+    return AuthContext(token=token, payload=payload, user_id=user_id)
+
+
+def get_auth_context(scope: Scope) -> AuthContext:
+    """Return the auth context for ``scope``, decoding the token on first use only.
+
+    The context lives in ``scope["state"]`` so it is also reachable as
+    ``request.state.auth_context`` from route handlers.
+    """
+
+    state = scope.setdefault("state", {})
+    context = state.get(AUTH_CONTEXT_KEY)
+    if context is None:
+        context = _resolve(Headers(scope=scope))
+        state[AUTH_CONTEXT_KEY] = context
+    return context
@@ -12,6 +12,7 @@ from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError
 from starlette import status
 
+from app.core.hashing import HashingOverloadedError
 from app.core.security import TokenError
 
 
@@ -56,6 +57,13 @@ def register_exception_handlers(app: FastAPI) -> None:
         logger.warning("Token error on %s: %s", request.url.path, exc)
         return _error_response(status.HTTP_401_UNAUTHORIZED, str(exc))
 
+    @app.exception_handler(HashingOverloadedError)
+    async def handle_hashing_overloaded(request: Request, exc: HashingOverloadedError) -> JSONResponse:
+        logger.warning("Password hashing pool saturated on {path}", path=request.url.path)
+        response = _error_response(status.HTTP_503_SERVICE_UNAVAILABLE, str(exc))
+        response.headers["Retry-After"] = "1"
+        return response
+
     @app.exception_handler(Exception)
     async def handle_unexpected_error(request: Request, exc: Exception) -> JSONResponse:  # pragma: no cover
         logger.exception("Unhandled exception at %s", request.url.path, exc_info=exc)
@@ -0,0 +1,99 @@
+"""Dedicated executor for password hashing with admission control.
+
+Password hashing is deliberately slow, so it runs on its own small thread
+pool instead of the AnyIO threadpool that serves every sync endpoint.
+``hashlib.pbkdf2_hmac`` releases the GIL, so threads scale across cores.
+Work beyond ``workers + max_queue`` pending jobs is rejected immediately
+rather than queued behind a growing backlog.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+from app.core.config import settings
+from app.core.security import hash_password, verify_password
+
+T = TypeVar("T")
+
+
+class HashingOverloadedError(RuntimeError):
+    """Raised when the hashing pool has no room for another job."""
+
+
+class PasswordHashingPool:
+    """Bounded thread pool for password hashing and verification."""
+
+    def __init__(self, workers: int, max_queue: int) -> None:
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    def _admit(self) -> None:
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise HashingOverloadedError("Password hashing capacity exhausted")
+            self._pending += 1
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        self._admit()
+        submitted = time.perf_counter()
+
+        def job() -> T:
+            waited = time.perf_counter() - submitted
+            with self._lock:
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+            return func(*args)
+
+        try:
+            future = self._get_executor().submit(job)
+        except BaseException:
+            self._release(None)
+            raise
+        # The slot is held until the job itself finishes: cancelling the awaiting request
+        # does not stop a KDF run that has already started
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Future | None) -> None:
+        with self._lock:
+            self._pending -= 1
+            if future is not None and not future.cancelled() and future.exception() is None:
+                self.completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self.run(hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self.run(verify_password, password, hashed_password)
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "pending": self._pending,
+                "completed_total": self.completed,
+                "rejected_total": self.rejected,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+            }
+
+
+password_pool = PasswordHashingPool(settings.password_hash_workers, settings.password_hash_max_queue)
@@ -0,0 +1,282 @@
+"""In-process request metrics exported in Prometheus text format.
+
+Latencies are kept in fixed-size log-linear histograms (the HDR histogram
+layout): values below 16 µs get exact buckets, above that every power of two
+is split into 8 linear sub-buckets, so relative error stays under 12.5% and
+each histogram is a flat list of counters regardless of traffic. Series are
+labelled by route template rather than raw path to keep cardinality bounded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import anyio.to_thread
+from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
+from starlette.routing import Route
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_SUB_BITS = 3
+_SUB_BUCKETS = 1 << _SUB_BITS
+_MAX_MICROS = 60_000_000  # values above one minute land in the last bucket
+# Octave boundaries (in µs) that line up with bucket edges, used as ``le`` labels
+_EXPORT_EDGES = tuple(1 << exponent for exponent in range(7, 27))
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _bucket_index(micros: int) -> int:
+    if micros < 2 * _SUB_BUCKETS:
+        return micros
+    shift = micros.bit_length() - (_SUB_BITS + 1)
+    return shift * _SUB_BUCKETS + (micros >> shift)
+
+
+def _bucket_upper_bound(index: int) -> int:
+    shift = max(index // _SUB_BUCKETS - 1, 0)
+    return ((index - shift * _SUB_BUCKETS) << shift) + (1 << shift)
+
+
+_BUCKET_COUNT = _bucket_index(_MAX_MICROS) + 1
+
+
+class LatencyHistogram:
+    """Fixed-memory log-linear histogram of durations in seconds."""
+
+    __slots__ = ("counts", "count", "total")
+
+    def __init__(self) -> None:
+        self.counts = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, seconds: float) -> None:
+        micros = min(max(int(seconds * 1_000_000), 0), _MAX_MICROS)
+        self.counts[_bucket_index(micros)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def percentile(self, quantile: float) -> float:
+        """Return the upper bound (seconds) of the bucket holding ``quantile``."""
+
+        if not self.count:
+            return 0.0
+        rank = max(int(quantile * self.count + 0.999999), 1)
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                return _bucket_upper_bound(index) / 1_000_000
+        return _MAX_MICROS / 1_000_000  # pragma: no cover - unreachable
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Return ``(le_seconds, count)`` pairs at the export boundaries."""
+
+        pairs: list[tuple[float, int]] = []
+        seen = 0
+        index = 0
+        for edge in _EXPORT_EDGES:
+            stop = _bucket_index(edge)
+            seen += sum(self.counts[index:stop])
+            index = stop
+            pairs.append((edge / 1_000_000, seen))
+        return pairs
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class MetricsRegistry:
+    """Thread-safe store of per-route request and background-task metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._latency: dict[tuple[str, str], LatencyHistogram] = {}
+            self._db_latency: dict[tuple[str, str], LatencyHistogram] = {}
+            self._db_queries: dict[tuple[str, str], int] = {}
+            self._responses: dict[tuple[str, str, str], int] = {}
+            self._in_flight: dict[tuple[str, str], int] = {}
+            self.requests_in_flight = 0
+            self.background_tasks: dict[str, int] = {"started": 0, "completed": 0, "failed": 0}
+            self.threadpool_wait = LatencyHistogram()
+
+    def request_started(self) -> None:
+        with self._lock:
+            self.requests_in_flight += 1
+
+    def route_entered(self, method: str, route: str) -> None:
+        with self._lock:
+            key = (method, route)
+            self._in_flight[key] = self._in_flight.get(key, 0) + 1
+
+    def route_exited(self, method: str, route: str) -> None:
+        with self._lock:
+            self._in_flight[(method, route)] -= 1
+
+    def request_finished(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        seconds: float,
+        db_seconds: float,
+        db_queries: int,
+    ) -> None:
+        key = (method, route)
+        with self._lock:
+            self.requests_in_flight -= 1
+            self._latency.setdefault(key, LatencyHistogram()).record(seconds)
+            self._db_latency.setdefault(key, LatencyHistogram()).record(db_seconds)
+            self._db_queries[key] = self._db_queries.get(key, 0) + db_queries
+            response_key = (method, route, f"{status_code // 100}xx")
+            self._responses[response_key] = self._responses.get(response_key, 0) + 1
+
+    def background_task(self, state: str, wait_seconds: float | None = None) -> None:
+        with self._lock:
+            self.background_tasks[state] += 1
+            if wait_seconds is not None:
+                self.threadpool_wait.record(wait_seconds)
+
+    def latency(self, method: str, route: str) -> LatencyHistogram | None:
+        return self._latency.get((method, route))
+
+    def render(self, gauges: dict[str, float] | None = None) -> str:
+        """Render every metric in the Prometheus text exposition format.
+
+        ``gauges`` adds values sampled by the caller (pool and threadpool
+        state), keyed by full metric name; ``*_total`` names are typed as
+        counters.
+        """
+
+        lines: list[str] = []
+        with self._lock:
+            lines += ["# TYPE http_requests_in_flight gauge", f"http_requests_in_flight {self.requests_in_flight}"]
+
+            lines.append("# TYPE http_route_requests_in_flight gauge")
+            for (method, route), value in sorted(self._in_flight.items()):
+                lines.append(f"http_route_requests_in_flight{_labels(method=method, route=route)} {value}")
+
+            lines.append("# TYPE http_responses_total counter")
+            for (method, route, status), value in sorted(self._responses.items()):
+                lines.append(f"http_responses_total{_labels(method=method, route=route, status=status)} {value}")
+
+            self._render_histograms(lines, "http_request_duration_seconds", self._latency)
+            self._render_histograms(lines, "http_request_db_seconds", self._db_latency)
+
+            lines.append("# TYPE http_request_db_queries_total counter")
+            for (method, route), value in sorted(self._db_queries.items()):
+                lines.append(f"http_request_db_queries_total{_labels(method=method, route=route)} {value}")
+
+            lines.append("# TYPE background_tasks_total counter")
+            for state, value in self.background_tasks.items():
+                lines.append(f"background_tasks_total{_labels(state=state)} {value}")
+
+            self._render_histograms(lines, "threadpool_queue_wait_seconds", {(): self.threadpool_wait})
+
+        for name, value in (gauges or {}).items():
+            kind = "counter" if name.endswith("_total") else "gauge"
+            lines += [f"# TYPE {name} {kind}", f"{name} {value}"]
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histograms(lines: list[str], name: str, histograms: dict[tuple, LatencyHistogram]) -> None:
+        lines.append(f"# TYPE {name} histogram")
+        for key, histogram in sorted(histograms.items()):
+            labels = dict(zip(("method", "route"), key))
+            for le, count in histogram.cumulative():
+                lines.append(f"{name}_bucket{_labels(**labels, le=f'{le:g}')} {count}")
+            lines.append(f"{name}_bucket{_labels(**labels, le='+Inf')} {histogram.count}")
+            suffix = _labels(**labels) if labels else ""
+            lines.append(f"{name}_sum{suffix} {histogram.total:.6f}")
+            lines.append(f"{name}_count{suffix} {histogram.count}")
+
+
+metrics_registry = MetricsRegistry()
+
+
+def threadpool_statistics() -> dict[str, int]:
+    """Snapshot of AnyIO's default worker-thread limiter (call from the event loop)."""
+
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    stats = limiter.statistics()
+    return {
+        "threads_total": int(limiter.total_tokens),
+        "threads_busy": stats.borrowed_tokens,
+        "tasks_waiting": stats.tasks_waiting,
+    }
+
+
+def _track_in_flight(app: ASGIApp, route: str) -> ASGIApp:
+    async def tracked(scope: Scope, receive: Receive, send: Send) -> None:
+        method = scope["method"]
+        metrics_registry.route_entered(method, route)
+        try:
+            await app(scope, receive, send)
+        finally:
+            metrics_registry.route_exited(method, route)
+
+    return tracked
+
+
+def instrument_routes(app: FastAPI) -> None:
+    """Wrap every registered route so in-flight requests are counted per template."""
+
+    for route in app.routes:
+        if isinstance(route, Route):
+            route.app = _track_in_flight(route.app, route.path)
+
+
+def instrument_task(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a background task to count it.
+
+    Sync tasks are run on the threadpool here so their queue wait can be
+    timed; coroutine tasks run on the event loop and have no queue wait.
+    """
+
+    if asyncio.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            metrics_registry.background_task("started")
+            try:
+                result = await func(*args, **kwargs)
+            except Exception:
+                metrics_registry.background_task("failed")
+                raise
+            metrics_registry.background_task("completed")
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        queued = time.perf_counter()
+
+        def run() -> Any:
+            metrics_registry.background_task("started", time.perf_counter() - queued)
+            return func(*args, **kwargs)
+
+        try:
+            result = await run_in_threadpool(run)
+        except Exception:
+            metrics_registry.background_task("failed")
+            raise
+        metrics_registry.background_task("completed")
+        return result
+
+    return wrapper
@@ -2,67 +2,99 @@
 
 from __future__ import annotations
 
-import asyncio
+import math
 import time
-from collections import defaultdict
 
 from fastapi import FastAPI
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.middleware.cors import CORSMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.core.access_log import AccessLogger, AccessLogSampler, parse_sample_rates
+from app.core.auth_context import AuthContext, get_auth_context
 from app.core.config import settings
-from app.core.security import TokenError, get_subject, verify_token
-
-
-class RequestLoggerMiddleware(BaseHTTPMiddleware):
-    """Log basic request/response information."""
-
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        start = time.time()
-        response = await call_next(request)
-        duration = (time.time() - start) * 1000
-        client_ip = request.client.host if request.client else "unknown"
-        logger.info(
-            "[REQUEST] {method} {path} from {ip} -> {status} ({duration:.2f} ms)",
-            method=request.method,
-            path=request.url.path,
-            ip=client_ip,
-            status=response.status_code,
-            duration=duration,
-        )
-        return response
+from app.core.metrics import UNMATCHED_ROUTE, metrics_registry
+from app.core.rate_limit import RateLimitDecision, RateLimitRule, RejectionLogger, parse_route_limits
+from app.core.rate_limit_backends import MemoryRateLimitBackend, RateLimitBackend, create_rate_limit_backend
+from app.core.timing import RequestTimings, request_timings, server_timing_header
+from app.db.routing import routing_key
+from app.db.session import QueryStats, query_stats
+
 
+class RequestPipelineMiddleware:
+    """Rate limiting, metrics, access logging and admin auditing in a single ASGI pass.
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Simple in-memory rate limiter keyed by client IP."""
+    Working on ``scope``/``send`` directly avoids the task and stream wrappers
+    that ``BaseHTTPMiddleware`` puts around every request, and lets streaming
+    responses flow through untouched.
+    """
 
-    def __init__(self, app: FastAPI, limit: int, window_seconds: int = 60) -> None:
-        super().__init__(app)
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        limit: int,
+        window_seconds: int = 60,
+        authenticated_limit: int | None = None,
+        route_limits: list[RateLimitRule] | None = None,
+        backend: RateLimitBackend | None = None,
+        access_logger: AccessLogger | None = None,
+        server_timing: bool = False,
+        n_plus_one_threshold: int = 0,
+    ) -> None:
+        self.app = app
         self.limit = limit
+        self.authenticated_limit = authenticated_limit or limit
         self.window_seconds = window_seconds
-        self._reservoir: dict[str, tuple[int, float]] = defaultdict(lambda: (0, 0.0))
-        self._lock = asyncio.Lock()
+        self.route_limits = route_limits or []
+        self.backend = backend or MemoryRateLimitBackend()
+        self.access_logger = access_logger or AccessLogger(AccessLogSampler())
+        self.server_timing = server_timing
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self._rejections = RejectionLogger()
         global _rate_limiter_instance
         _rate_limiter_instance = self
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        client_ip = request.client.host if request.client else "unknown"
-        async with self._lock:
-            count, reset_ts = self._reservoir[client_ip]
-            now = time.time()
-            if reset_ts <= now:
-                count, reset_ts = 0, now + self.window_seconds
-            count += 1
-            self._reservoir[client_ip] = (count, reset_ts)
-            if count > self.limit:
-                retry_after = max(int(reset_ts - now), 1)
-                logger.warning("Rate limit exceeded for %s", client_ip)
-                return JSONResponse(  # type: ignore[return-value]
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        path: str = scope["path"]
+        auth = get_auth_context(scope)
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        status_code = 500
+        db_stats = QueryStats(track_orm=self.server_timing)
+        stats_token = query_stats.set(db_stats)
+        timings = RequestTimings() if self.server_timing else None
+        timings_token = request_timings.set(timings)
+        metrics_registry.request_started()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if timings is not None:
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"server-timing", server_timing_header(db_stats, timings)),
+                    ]
+            await send(message)
+
+        key = f"user:{auth.user_id}" if auth.is_authenticated else f"ip:{client_ip}"
+        key_token = routing_key.set(key)
+        try:
+            decision = await self._check(key, path)
+            if decision.allowed:
+                await self.app(scope, receive, send_wrapper)
+            else:
+                self._rejections.record(key, path)
+                response = JSONResponse(
                     status_code=429,
-                    headers={"Retry-After": str(retry_after)},
+                    headers={"Retry-After": str(max(math.ceil(decision.retry_after), 1))},
                     content={
                         "status": "error",
                         "code": 429,
@@ -70,19 +102,80 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                         "details": [],
                     },
                 )
+                await response(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            query_stats.reset(stats_token)
+            request_timings.reset(timings_token)
+            routing_key.reset(key_token)
+            # The router stores the matched route in the scope; fall back for 404s and 429s
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            metrics_registry.request_finished(
+                scope["method"],
+                route,
+                status_code,
+                duration,
+                db_stats.seconds,
+                db_stats.count,
+            )
+            self.access_logger.log(
+                method=scope["method"],
+                path=path,
+                client_ip=client_ip,
+                user=auth.user_id,
+                status_code=status_code,
+                duration_ms=duration * 1000,
+            )
+            for statement, count in db_stats.repeated(self.n_plus_one_threshold):
+                logger.warning(
+                    "[N+1] {method} {route} ran the same statement {count} times: {statement}",
+                    method=scope["method"],
+                    route=route,
+                    count=count,
+                    statement=" ".join(statement.split()),
+                )
+            if path.startswith("/api/admin"):
+                self._audit(scope["method"], path, auth, status_code)
+
+    async def _check(self, key: str, path: str) -> RateLimitDecision:
+        route_rule = next((rule for rule in self.route_limits if path.startswith(rule.prefix)), None)
+        if route_rule is not None:
+            route_key = f"{route_rule.prefix}|{key}"
+            decision = await self.backend.acquire(route_key, limit=route_rule.limit, window_seconds=self.window_seconds)
+            if not decision.allowed:
+                return decision
+        limit = self.authenticated_limit if key.startswith("user:") else self.limit
+        decision = await self.backend.acquire(key, limit=limit, window_seconds=self.window_seconds)
+        if not decision.allowed and route_rule is not None:
+            # A request the global bucket rejects must not use up the route quota either
+            await self.backend.refund(route_key, limit=route_rule.limit, window_seconds=self.window_seconds)
+        return decision
 
-        return await call_next(request)
+    @staticmethod
+    def _audit(method: str, path: str, auth: AuthContext, status_code: int) -> None:
+        admin_id = "anonymous"
+        if auth.is_authenticated:
+            admin_id = str(auth.user_id)
+        elif auth.error is not None:
+            admin_id = "invalid-token"
+
+        logger.bind(admin_action=True).info(
+            "admin_action method={method} path={path} status={status} admin_id={admin}",
+            method=method,
+            path=path,
+            status=status_code,
+            admin=admin_id,
+        )
 
     async def reset(self) -> None:
-        async with self._lock:
-            self._reservoir.clear()
+        self.backend.reset()
 
     def reset_sync(self) -> None:
-        self._reservoir.clear()
+        self.backend.reset()
 
 
 # Expose a singleton middleware instance store for tests to reset
-_rate_limiter_instance: RateLimitMiddleware | None = None
+_rate_limiter_instance: RequestPipelineMiddleware | None = None
 
 
 async def reset_rate_limiter() -> None:
@@ -95,35 +188,10 @@ def reset_rate_limiter_sync() -> None:
         _rate_limiter_instance.reset_sync()
 
 
-class AdminActionMiddleware(BaseHTTPMiddleware):
-    """Write admin requests to a dedicated log."""
-
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        response = await call_next(request)
-        if request.url.path.startswith("/api/admin"):
-            admin_id = "anonymous"
-            auth_header = request.headers.get("Authorization")
-            if auth_header and auth_header.lower().startswith("bearer "):
-                token = auth_header.split(" ", 1)[1]
-                try:
-                    payload = verify_token(token, expected_type="access")
-                    admin_id = str(get_subject(payload))
-                except TokenError:  # pragma: no cover - logging best effort
-                    admin_id = "invalid-token"
-
-            logger.bind(admin_action=True).info(
-                "admin_action method={method} path={path} status={status} admin_id={admin}",
-                method=request.method,
-                path=request.url.path,
-                status=response.status_code,
-                admin=admin_id,
-            )
-        return response
-
-
 def setup_middleware(app: FastAPI) -> None:
     """Configure middleware stack on the FastAPI application."""
 
+    json_access_log = settings.access_log_format == "json"
     log_path = settings.log_path
     log_path.parent.mkdir(parents=True, exist_ok=True)
     logger.add(
@@ -132,8 +200,22 @@ def setup_middleware(app: FastAPI) -> None:
         retention="14 days",
         format="[{time:YYYY-MM-DD HH:mm:ss}] {level} — {message}",
         enqueue=True,
+        filter=(lambda record: record["extra"].get("access_log") is not True) if json_access_log else None,
     )
 
+    if json_access_log:
+        # JSON lines go to their own sink; the enqueue worker thread writes them
+        # through a block buffer so disk writes are batched off the request path.
+        logger.add(
+            settings.access_log_path,
+            rotation="50 MB",
+            retention="14 days",
+            format="{message}",
+            enqueue=True,
+            buffering=settings.access_log_buffer_bytes,
+            filter=lambda record: record["extra"].get("access_log") is True,
+        )
+
     admin_log_path = settings.log_path.parent / "admin_actions.log"
     admin_log_path.parent.mkdir(parents=True, exist_ok=True)
     logger.add(
@@ -151,8 +233,30 @@ def setup_middleware(app: FastAPI) -> None:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Lets polling dashboards on other origins send it back as If-None-Match
+        expose_headers=["ETag"],
     )
 
-    app.add_middleware(RateLimitMiddleware, limit=settings.rate_limit_per_minute)
-    app.add_middleware(RequestLoggerMiddleware)
-    app.add_middleware(AdminActionMiddleware)
+    app.add_middleware(
+        RequestPipelineMiddleware,
+        limit=settings.rate_limit_per_minute,
+        authenticated_limit=settings.rate_limit_authenticated_per_minute,
+        route_limits=parse_route_limits(settings.rate_limit_route_limits),
+        backend=create_rate_limit_backend(
+            settings.rate_limit_backend,
+            shards=settings.rate_limit_shards,
+            max_keys=settings.rate_limit_max_keys,
+            batch_size=settings.rate_limit_batch_size,
+        ),
+        access_logger=AccessLogger(
+            AccessLogSampler(
+                status_rates=parse_sample_rates(settings.access_log_sample_rates),
+                route_rates=parse_sample_rates(settings.access_log_route_sample_rates),
+                slow_ms=settings.access_log_slow_ms,
+                always_keep_status=settings.access_log_always_keep_status,
+            ),
+            fmt=settings.access_log_format,
+        ),
+        server_timing=settings.server_timing_enabled,
+        n_plus_one_threshold=settings.n_plus_one_threshold,
+    )
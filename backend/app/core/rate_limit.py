@@ -0,0 +1,174 @@
+"""Sharded token-bucket rate limiting engine."""
+
+from __future__ import annotations
+
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple
+
+from loguru import logger
+
+
+class RateLimitDecision(NamedTuple):
+    """Outcome of a single limiter acquisition."""
+
+    allowed: bool
+    retry_after: float
+    remaining: float
+
+
+class RateLimitRule(NamedTuple):
+    """Dedicated bucket for requests whose path starts with ``prefix``."""
+
+    prefix: str
+    limit: int
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated_at", "full_at")
+
+    def __init__(self, tokens: float, updated_at: float) -> None:
+        self.tokens = tokens
+        self.updated_at = updated_at
+        self.full_at = updated_at
+
+
+class _Shard:
+    __slots__ = ("lock", "buckets")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.buckets: OrderedDict[str, _Bucket] = OrderedDict()
+
+
+class TokenBucketLimiter:
+    """Token buckets spread over independently locked shards.
+
+    Each shard keeps its buckets in LRU order. A bucket that has refilled to
+    capacity carries no state worth keeping, so idle keys are dropped as soon
+    as they are full again, and the least recently used keys are evicted once
+    a shard exceeds its share of ``max_keys``.
+    """
+
+    _EVICTIONS_PER_CALL = 8
+
+    def __init__(
+        self,
+        *,
+        shards: int = 16,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if shards < 1:
+            raise ValueError("shards must be positive")
+        self._shards = [_Shard() for _ in range(shards)]
+        self._max_keys_per_shard = max(max_keys // shards, 1)
+        self._clock = clock
+
+    def _shard_for(self, key: str) -> _Shard:
+        return self._shards[zlib.crc32(key.encode("utf-8")) % len(self._shards)]
+
+    def acquire(self, key: str, *, limit: int, window_seconds: float, cost: float = 1) -> RateLimitDecision:
+        """Take ``cost`` tokens from the bucket for ``key`` if available."""
+
+        capacity = float(limit)
+        rate = capacity / window_seconds
+        shard = self._shard_for(key)
+        with shard.lock:
+            now = self._clock()
+            buckets = shard.buckets
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = _Bucket(capacity, now)
+                buckets[key] = bucket
+            else:
+                buckets.move_to_end(key)
+                elapsed = now - bucket.updated_at
+                if elapsed > 0:
+                    bucket.tokens = min(capacity, bucket.tokens + elapsed * rate)
+                    bucket.updated_at = now
+
+            if bucket.tokens >= cost:
+                bucket.tokens -= cost
+                decision = RateLimitDecision(True, 0.0, bucket.tokens)
+            else:
+                decision = RateLimitDecision(False, (cost - bucket.tokens) / rate, bucket.tokens)
+            bucket.full_at = now + (capacity - bucket.tokens) / rate
+
+            self._evict(buckets, now)
+        return decision
+
+    def refund(self, key: str, *, limit: int, window_seconds: float, cost: float = 1) -> None:
+        """Return ``cost`` tokens taken by :meth:`acquire` for a request that did not go ahead."""
+
+        shard = self._shard_for(key)
+        with shard.lock:
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                return
+            capacity = float(limit)
+            bucket.tokens = min(capacity, bucket.tokens + cost)
+            bucket.full_at = bucket.updated_at + (capacity - bucket.tokens) / (capacity / window_seconds)
+
+    def _evict(self, buckets: OrderedDict[str, _Bucket], now: float) -> None:
+        for _ in range(self._EVICTIONS_PER_CALL):
+            if not buckets:
+                return
+            oldest_key = next(iter(buckets))
+            if len(buckets) > self._max_keys_per_shard or buckets[oldest_key].full_at <= now:
+                buckets.popitem(last=False)
+            else:
+                return
+
+    def reset(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.buckets.clear()
+
+    def __len__(self) -> int:
+        return sum(len(shard.buckets) for shard in self._shards)
+
+
+class RejectionLogger:
+    """Emit at most one rejection warning per interval, summarising the rest."""
+
+    def __init__(self, interval_seconds: float = 10.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.interval_seconds = interval_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._next_emit = 0.0
+        self._suppressed = 0
+
+    def record(self, key: str, path: str) -> None:
+        with self._lock:
+            now = self._clock()
+            if now < self._next_emit:
+                self._suppressed += 1
+                return
+            suppressed, self._suppressed = self._suppressed, 0
+            self._next_emit = now + self.interval_seconds
+
+        logger.warning(
+            "Rate limit exceeded for {key} on {path} ({suppressed} similar rejections suppressed)",
+            key=key,
+            path=path,
+            suppressed=suppressed,
+        )
+
+
+def parse_route_limits(raw: str) -> list[RateLimitRule]:
+    """Parse ``"/api/auth/login=10,/api/auth/refresh=30"`` into rules."""
+
+    rules: list[RateLimitRule] = []
+    for chunk in raw.split(","):
+        if "=" not in chunk:
+            continue
+        prefix, limit = chunk.split("=", 1)
+        prefix = prefix.strip()
+        if prefix:
+            rules.append(RateLimitRule(prefix, int(limit)))
+    # Longest prefix first so the most specific rule wins
+    return sorted(rules, key=lambda rule: len(rule.prefix), reverse=True)
@@ -0,0 +1,341 @@
+"""Pluggable storage backends for the rate limiter.
+
+The in-memory backend keeps exact token buckets per worker process. The shared
+backends count requests in fixed windows that every worker increments
+atomically, and hand each worker a small batch of tokens per round trip so
+that most requests are decided locally.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+import anyio
+from loguru import logger
+
+from app.core.config import PROJECT_ROOT
+from app.core.rate_limit import RateLimitDecision, TokenBucketLimiter
+
+
+class RateLimitBackend(ABC):
+    """Interface shared by every limiter storage implementation."""
+
+    @abstractmethod
+    async def acquire(self, key: str, *, limit: int, window_seconds: float, cost: int = 1) -> RateLimitDecision:
+        """Consume ``cost`` units for ``key`` and report whether the request may proceed."""
+
+    @abstractmethod
+    async def refund(self, key: str, *, limit: int, window_seconds: float, cost: int = 1) -> None:
+        """Give back ``cost`` units consumed by an admitted :meth:`acquire` whose request was rejected later."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Forget all state held by this process."""
+
+    async def close(self) -> None:
+        """Release connections held by the backend."""
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Per-process sharded token buckets."""
+
+    def __init__(self, *, shards: int = 16, max_keys: int = 100_000) -> None:
+        self.limiter = TokenBucketLimiter(shards=shards, max_keys=max_keys)
+
+    async def acquire(self, key: str, *, limit: int, window_seconds: float, cost: int = 1) -> RateLimitDecision:
+        return self.limiter.acquire(key, limit=limit, window_seconds=window_seconds, cost=cost)
+
+    async def refund(self, key: str, *, limit: int, window_seconds: float, cost: int = 1) -> None:
+        self.limiter.refund(key, limit=limit, window_seconds=window_seconds, cost=cost)
+
+    def reset(self) -> None:
+        self.limiter.reset()
+
+
+class _Allotment:
+    __slots__ = ("tokens", "window_end", "exhausted")
+
+    def __init__(self, tokens: int, window_end: float, exhausted: bool) -> None:
+        self.tokens = tokens
+        self.window_end = window_end
+        # The shared counter reached the limit, so further claims this window are pointless
+        self.exhausted = exhausted
+
+
+class PreallocatingBackend(RateLimitBackend):
+    """Fixed-window counters shared between workers, claimed in batches.
+
+    A worker that runs out of local tokens claims ``batch`` more by atomically
+    incrementing the shared counter for the current window. The counter may
+    overshoot the limit, but tokens are only granted up to it, so the combined
+    admission across all workers never exceeds ``limit`` per window. Tokens a
+    worker claimed but did not use are lost when the window ends.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = 10,
+        max_local_keys: int = 50_000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.batch_size = batch_size
+        self.max_local_keys = max_local_keys
+        self._clock = clock
+        self._allotments: OrderedDict[str, _Allotment] = OrderedDict()
+
+    @abstractmethod
+    async def _claim(self, counter_key: str, amount: int, limit: int, ttl_seconds: float) -> int:
+        """Atomically add ``amount`` to ``counter_key`` and return how many units fit under ``limit``."""
+
+    def _batch_for(self, limit: int, cost: int) -> int:
+        # Keep batches small relative to the limit so one worker cannot hoard a tight tier
+        return max(cost, min(self.batch_size, limit // 10))
+
+    async def acquire(self, key: str, *, limit: int, window_seconds: float, cost: int = 1) -> RateLimitDecision:
+        now = self._clock()
+        window_index = math.floor(now / window_seconds)
+        window_end = (window_index + 1) * window_seconds
+
+        allotment = self._allotments.get(key)
+        if allotment is not None and allotment.window_end == window_end:
+            if allotment.tokens >= cost:
+                allotment.tokens -= cost
+                self._allotments.move_to_end(key)
+                return RateLimitDecision(True, 0.0, allotment.tokens)
+            if allotment.exhausted:
+                return RateLimitDecision(False, window_end - now, 0)
+
+        amount = self._batch_for(limit, cost)
+        granted = await self._claim(f"rl:{key}:{window_index}", amount, limit, window_end - now)
+        exhausted = granted < amount
+        if granted < cost:
+            self._store(key, _Allotment(0, window_end, exhausted))
+            return RateLimitDecision(False, window_end - now, 0)
+
+        remaining = granted - cost
+        self._store(key, _Allotment(remaining, window_end, exhausted))
+        return RateLimitDecision(True, 0.0, remaining)
+
+    async def refund(self, key: str, *, limit: int, window_seconds: float, cost: int = 1) -> None:
+        # The units return to this worker's allotment; the shared counter only ever grows
+        allotment = self._allotments.get(key)
+        window_end = (math.floor(self._clock() / window_seconds) + 1) * window_seconds
+        if allotment is not None and allotment.window_end == window_end:
+            allotment.tokens += cost
+
+    def _store(self, key: str, allotment: _Allotment) -> None:
+        self._allotments[key] = allotment
+        self._allotments.move_to_end(key)
+        while len(self._allotments) > self.max_local_keys:
+            self._allotments.popitem(last=False)
+
+    def reset(self) -> None:
+        self._allotments.clear()
+
+    @staticmethod
+    def _granted(counter: int, amount: int, limit: int) -> int:
+        previous = counter - amount
+        if previous >= limit:
+            return 0
+        return min(counter, limit) - previous
+
+
+class SQLiteRateLimitBackend(PreallocatingBackend):
+    """Counters stored in a WAL-mode SQLite file shared by workers on one host."""
+
+    _CLEANUP_EVERY = 1000
+
+    def __init__(self, path: str | Path, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._claims = 0
+        self._conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits ("
+            "key TEXT PRIMARY KEY, count INTEGER NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def _claim_sync(self, counter_key: str, amount: int, limit: int, ttl_seconds: float) -> int:
+        expires_at = self._clock() + ttl_seconds
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT INTO rate_limits (key, count, expires_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET count = count + excluded.count",
+                    (counter_key, amount, expires_at),
+                )
+                (counter,) = self._conn.execute(
+                    "SELECT count FROM rate_limits WHERE key = ?", (counter_key,)
+                ).fetchone()
+                self._claims += 1
+                if self._claims % self._CLEANUP_EVERY == 0:
+                    self._conn.execute("DELETE FROM rate_limits WHERE expires_at < ?", (self._clock(),))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return self._granted(counter, amount, limit)
+
+    async def _claim(self, counter_key: str, amount: int, limit: int, ttl_seconds: float) -> int:
+        return await anyio.to_thread.run_sync(self._claim_sync, counter_key, amount, limit, ttl_seconds)
+
+    def reset(self) -> None:
+        super().reset()
+        with self._lock:
+            self._conn.execute("DELETE FROM rate_limits")
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisProtocolError(RuntimeError):
+    """Raised when a Redis-compatible server returns an error reply."""
+
+
+class _RespConnection:
+    """Minimal RESP2 client supporting pipelined commands."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+
+    @staticmethod
+    def _encode(command: tuple[str | int | float, ...]) -> bytes:
+        parts = [f"*{len(command)}\r\n".encode()]
+        for arg in command:
+            data = str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(parts)
+
+    async def _read_reply(self):
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by server")
+        prefix, body = line[:1], line[1:-2]
+        if prefix == b"+":
+            return body.decode()
+        if prefix == b"-":
+            raise RedisProtocolError(body.decode())
+        if prefix == b":":
+            return int(body)
+        if prefix == b"$":
+            length = int(body)
+            if length == -1:
+                return None
+            data = await self._reader.readexactly(length + 2)
+            return data[:-2].decode()
+        if prefix == b"*":
+            length = int(body)
+            if length == -1:
+                return None
+            return [await self._read_reply() for _ in range(length)]
+        raise RedisProtocolError(f"Unexpected reply prefix {prefix!r}")
+
+    async def pipeline(self, *commands: tuple[str | int | float, ...]) -> list:
+        self._writer.write(b"".join(self._encode(command) for command in commands))
+        await self._writer.drain()
+        return [await self._read_reply() for _ in commands]
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:  # pragma: no cover - already closed
+            pass
+
+
+class RedisRateLimitBackend(PreallocatingBackend):
+    """Counters kept in Redis (or any RESP-compatible server) with atomic INCRBY + PEXPIRE."""
+
+    def __init__(self, url: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self._conn: _RespConnection | None = None
+        self._conn_lock = asyncio.Lock()
+        self._failures = 0
+
+    async def _connection(self) -> _RespConnection:
+        if self._conn is None:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+            conn = _RespConnection(reader, writer)
+            setup: list[tuple[str | int, ...]] = []
+            if self.password:
+                setup.append(("AUTH", self.password))
+            if self.db:
+                setup.append(("SELECT", self.db))
+            if setup:
+                await conn.pipeline(*setup)
+            self._conn = conn
+        return self._conn
+
+    async def _claim(self, counter_key: str, amount: int, limit: int, ttl_seconds: float) -> int:
+        ttl_ms = max(int(ttl_seconds * 1000), 1)
+        async with self._conn_lock:
+            try:
+                conn = await self._connection()
+                replies = await conn.pipeline(
+                    ("MULTI",),
+                    ("INCRBY", counter_key, amount),
+                    ("PEXPIRE", counter_key, ttl_ms),
+                    ("EXEC",),
+                )
+            except (OSError, ConnectionError, RedisProtocolError, asyncio.IncompleteReadError) as exc:
+                await self._drop_connection()
+                self._failures += 1
+                if self._failures == 1 or self._failures % 100 == 0:
+                    logger.warning("Rate limit backend unavailable, allowing request: {error}", error=exc)
+                # Fail open: a limiter outage must not take the API down with it
+                return amount
+        self._failures = 0
+        counter = replies[-1][0]
+        return self._granted(counter, amount, limit)
+
+    async def _drop_connection(self) -> None:
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.close()
+
+    async def close(self) -> None:
+        async with self._conn_lock:
+            await self._drop_connection()
+
+
+def create_rate_limit_backend(
+    url: str,
+    *,
+    shards: int = 16,
+    max_keys: int = 100_000,
+    batch_size: int = 10,
+) -> RateLimitBackend:
+    """Build a backend from ``memory``, ``sqlite:///path`` or ``redis://host:port/db``."""
+
+    if url in ("", "memory"):
+        return MemoryRateLimitBackend(shards=shards, max_keys=max_keys)
+    if url.startswith("sqlite:///"):
+        path = Path(url.removeprefix("sqlite:///"))
+        if not path.is_absolute():
+            path = PROJECT_ROOT / path
+        return SQLiteRateLimitBackend(path, batch_size=batch_size)
+    if url.startswith("redis://"):
+        return RedisRateLimitBackend(url, batch_size=batch_size)
+    raise ValueError(f"Unsupported rate limit backend: {url}")
@@ -0,0 +1,299 @@
+"""Refresh-token revocation keyed by ``jti``.
+
+Revocations are written to a pluggable backend so every worker sees them.
+Each process keeps a Bloom filter of revoked keys in front of the backend:
+a token that is not in the filter has certainly not been revoked, which is
+the answer for almost every lookup, and only filter hits are confirmed
+against the backend.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.revoked_token import RevokedToken
+
+
+def token_key(jti: str) -> bytes:
+    """Return the 16-byte storage key for a token id."""
+
+    try:
+        return UUID(jti).bytes
+    except ValueError:
+        return hashlib.sha256(jti.encode("utf-8")).digest()[:16]
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over byte keys."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        capacity = max(capacity, 1)
+        self.size = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.capacity = capacity
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: bytes) -> Iterable[int]:
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + idx * second) % self.size for idx in range(self.hash_count))
+
+    def add(self, key: bytes) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class RevocationBackend(ABC):
+    """Authoritative storage for revoked token keys."""
+
+    @abstractmethod
+    def add(self, key: bytes, expires_at: float) -> None:
+        """Record ``key`` as revoked until ``expires_at`` (unix seconds)."""
+
+    @abstractmethod
+    def contains(self, key: bytes, now: float) -> bool:
+        """Return True if ``key`` is revoked and not yet expired."""
+
+    @abstractmethod
+    def changes_since(self, watermark: float) -> list[bytes]:
+        """Return keys revoked at or after ``watermark`` (unix seconds)."""
+
+    @abstractmethod
+    def live_keys(self, now: float) -> list[bytes]:
+        """Return every unexpired revoked key."""
+
+    @abstractmethod
+    def purge_expired(self, now: float) -> None:
+        """Drop revocations whose tokens have expired anyway."""
+
+    def clear(self) -> None:
+        """Forget every revocation (used by tests)."""
+
+
+class MemoryRevocationBackend(RevocationBackend):
+    """Single-process backend with a min-heap ordered by expiry."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._expiry: dict[bytes, float] = {}
+        self._heap: list[tuple[float, bytes]] = []
+
+    def add(self, key: bytes, expires_at: float) -> None:
+        with self._lock:
+            self._expiry[key] = expires_at
+            heapq.heappush(self._heap, (expires_at, key))
+
+    def contains(self, key: bytes, now: float) -> bool:
+        expires_at = self._expiry.get(key)
+        return expires_at is not None and expires_at > now
+
+    def changes_since(self, watermark: float) -> list[bytes]:
+        # Nothing outside this process can write here
+        return []
+
+    def live_keys(self, now: float) -> list[bytes]:
+        with self._lock:
+            return [key for key, expires_at in self._expiry.items() if expires_at > now]
+
+    def purge_expired(self, now: float) -> None:
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                expires_at, key = heapq.heappop(self._heap)
+                if self._expiry.get(key) == expires_at:
+                    del self._expiry[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._expiry.clear()
+            self._heap.clear()
+
+
+def _as_datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+class DatabaseRevocationBackend(RevocationBackend):
+    """Backend stored in the ``revoked_tokens`` table, shared by all workers."""
+
+    def __init__(self, session_factory: Callable[[], Session]) -> None:
+        self.session_factory = session_factory
+
+    def add(self, key: bytes, expires_at: float) -> None:
+        values = {"jti": key, "expires_at": _as_datetime(expires_at), "revoked_at": _as_datetime(time.time())}
+        with self.session_factory() as session:
+            dialect = session.get_bind().dialect.name
+            if dialect == "postgresql":
+                stmt = pg_insert(RevokedToken).values(**values).on_conflict_do_nothing()
+            elif dialect == "sqlite":
+                stmt = sqlite_insert(RevokedToken).values(**values).on_conflict_do_nothing()
+            else:  # pragma: no cover - other dialects fall back to merge
+                session.merge(RevokedToken(**values))
+                session.commit()
+                return
+            session.execute(stmt)
+            session.commit()
+
+    def contains(self, key: bytes, now: float) -> bool:
+        with self.session_factory() as session:
+            expires_at = session.scalar(select(RevokedToken.expires_at).where(RevokedToken.jti == key))
+        if expires_at is None:
+            return False
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return expires_at.timestamp() > now
+
+    def changes_since(self, watermark: float) -> list[bytes]:
+        with self.session_factory() as session:
+            return list(
+                session.scalars(select(RevokedToken.jti).where(RevokedToken.revoked_at >= _as_datetime(watermark)))
+            )
+
+    def live_keys(self, now: float) -> list[bytes]:
+        with self.session_factory() as session:
+            return list(session.scalars(select(RevokedToken.jti).where(RevokedToken.expires_at > _as_datetime(now))))
+
+    def purge_expired(self, now: float) -> None:
+        with self.session_factory() as session:
+            session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= _as_datetime(now)))
+            session.commit()
+
+    def clear(self) -> None:
+        with self.session_factory() as session:
+            session.execute(delete(RevokedToken))
+            session.commit()
+
+
+class RevocationStore:
+    """Bloom-filter front over a revocation backend.
+
+    ``sync_interval`` bounds how stale the local filter may be with respect
+    to revocations made by other workers; ``0`` pulls changes on every
+    lookup. Revocations made by this process are visible immediately.
+
+    Backend round-trips run outside the store's lock, which only guards the
+    filter and the sync bookkeeping, so a slow database never queues the
+    lookups that the filter alone can answer.
+    """
+
+    # Allow for clock skew between workers when pulling recent revocations
+    _SYNC_OVERLAP_SECONDS = 30.0
+
+    def __init__(
+        self,
+        backend: RevocationBackend,
+        *,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+        sync_interval: float = 1.0,
+        cleanup_interval: float = 60.0,
+    ) -> None:
+        self.backend = backend
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.cleanup_interval = cleanup_interval
+        self._lock = threading.Lock()
+        self._filter = BloomFilter(capacity, error_rate)
+        self._watermark = 0.0
+        self._recent: set[bytes] = set()
+        self._next_sync = 0.0
+        self._next_cleanup = 0.0
+        # Keys added while a rebuild reads the backend, replayed into the new filter
+        self._rebuilding: list[bytes] | None = None
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        key = token_key(jti)
+        self.backend.add(key, expires_at)
+        with self._lock:
+            self._add(key)
+
+    def is_revoked(self, jti: str) -> bool:
+        key = token_key(jti)
+        now = time.time()
+        self._maintain(now)
+        with self._lock:
+            if key not in self._filter:
+                return False
+        return self.backend.contains(key, now)
+
+    def _add(self, key: bytes) -> None:
+        # Caller holds ``_lock``
+        self._filter.add(key)
+        if self._rebuilding is not None:
+            self._rebuilding.append(key)
+
+    def _maintain(self, now: float) -> None:
+        # Claim whatever work is due under the lock, so concurrent lookups do not repeat it
+        with self._lock:
+            cleanup = now >= self._next_cleanup
+            if cleanup:
+                self._next_cleanup = now + self.cleanup_interval
+            # Expired keys stay in the filter until it fills up; rebuilding only
+            # then keeps the full scan amortised over ``capacity`` revocations.
+            rebuild = cleanup and self._rebuilding is None and self._filter.count >= self._filter.capacity
+            sync = not rebuild and now >= self._next_sync
+            if rebuild:
+                self._rebuilding = []
+            if rebuild or sync:
+                self._next_sync = now + self.sync_interval
+            watermark = self._watermark
+
+        if cleanup:
+            self.backend.purge_expired(now)
+        if rebuild:
+            self._rebuild(now)
+        elif sync:
+            self._sync(now, watermark)
+
+    def _sync(self, now: float, watermark: float) -> None:
+        keys = set(self.backend.changes_since(watermark - self._SYNC_OVERLAP_SECONDS))
+        with self._lock:
+            # Consecutive pulls overlap, so only count keys the last pull did not return
+            for key in keys - self._recent:
+                self._add(key)
+            self._recent = keys
+            self._watermark = max(self._watermark, now)
+
+    def _rebuild(self, now: float) -> None:
+        """Start a fresh filter holding only unexpired revocations."""
+
+        try:
+            keys = self.backend.live_keys(now)
+            fresh = BloomFilter(max(self.capacity, len(keys) * 2), self.error_rate)
+            for key in keys:
+                fresh.add(key)
+        except BaseException:
+            with self._lock:
+                self._rebuilding = None
+            raise
+        with self._lock:
+            for key in self._rebuilding:
+                fresh.add(key)
+            self._filter = fresh
+            self._rebuilding = None
+            self._recent = set()
+            self._watermark = max(self._watermark, now)
+
+    def clear(self) -> None:
+        self.backend.clear()
+        with self._lock:
+            self._filter = BloomFilter(self.capacity, self.error_rate)
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import base64
 import hashlib
 import hmac
 import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Final
 from uuid import UUID, uuid4
@@ -13,6 +18,13 @@ import jwt
 from jwt import PyJWTError
 
 from app.core.config import settings
+from app.core.revocation import (
+    DatabaseRevocationBackend,
+    MemoryRevocationBackend,
+    RevocationBackend,
+    RevocationStore,
+)
+from app.db.session import SessionLocal
 
 
 _PASSWORD_SALT: Final[bytes] = os.getenv("API_PASSWORD_SALT", "ugc-salt").encode()
@@ -20,28 +32,75 @@ _ACCESS_SECRET: Final[str] = settings.secret_key
 _REFRESH_SECRET: Final[str] = settings.refresh_secret_key
 _ALGORITHM: Final[str] = settings.algorithm
 
-_revoked_refresh_tokens: dict[str, datetime] = {}
 
+def _build_revocation_store() -> RevocationStore:
+    if settings.revocation_backend == "database":
+        backend: RevocationBackend = DatabaseRevocationBackend(SessionLocal)
+    else:
+        backend = MemoryRevocationBackend()
+    return RevocationStore(backend, sync_interval=settings.revocation_sync_seconds)
 
-def _cleanup_revoked() -> None:
-    now = datetime.now(timezone.utc)
-    expired = [token for token, exp in _revoked_refresh_tokens.items() if exp <= now]
-    for token in expired:
-        _revoked_refresh_tokens.pop(token, None)
+
+revocation_store = _build_revocation_store()
+
+
+_PBKDF2_SCHEME: Final[str] = "pbkdf2_sha256"
+
+
+# Verified in place of a missing user's hash, so unknown emails take as long to reject as wrong passwords
+DUMMY_PASSWORD_HASH: Final[str] = "$".join(
+    (
+        _PBKDF2_SCHEME,
+        str(settings.password_hash_iterations),
+        base64.b64encode(bytes(16)).decode(),
+        base64.b64encode(bytes(32)).decode(),
+    )
+)
+
+
+def _legacy_hash(password: str) -> str:
+    return hashlib.sha256(_PASSWORD_SALT + password.encode("utf-8")).hexdigest()
 
 
-def hash_password(password: str) -> str:
-    """Return a salted SHA-256 hash for persistent storage."""
+def hash_password(password: str, iterations: int | None = None) -> str:
+    """Return a PBKDF2-SHA256 hash in ``scheme$iterations$salt$digest`` form."""
 
-    digest = hashlib.sha256(_PASSWORD_SALT + password.encode("utf-8")).hexdigest()
-    return digest
+    rounds = iterations or settings.password_hash_iterations
+    salt = secrets.token_bytes(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, rounds)
+    return "$".join(
+        (_PBKDF2_SCHEME, str(rounds), base64.b64encode(salt).decode(), base64.b64encode(digest).decode())
+    )
 
 
 def verify_password(password: str, hashed_password: str) -> bool:
-    """Safely compare a plaintext password with its hash."""
+    """Safely compare a plaintext password with its hash.
 
-    candidate = hash_password(password)
-    return hmac.compare_digest(candidate, hashed_password)
+    Accepts both PBKDF2 hashes and the legacy salted SHA-256 hex digests.
+    """
+
+    if not hashed_password.startswith(f"{_PBKDF2_SCHEME}$"):
+        return hmac.compare_digest(_legacy_hash(password), hashed_password)
+
+    try:
+        _, rounds, salt, expected = hashed_password.split("$")
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), base64.b64decode(salt), int(rounds))
+        expected_digest = base64.b64decode(expected)
+    except ValueError:  # also covers binascii.Error from malformed base64
+        return False
+    return hmac.compare_digest(digest, expected_digest)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Return True for legacy hashes or hashes weaker than the configured cost."""
+
+    if not hashed_password.startswith(f"{_PBKDF2_SCHEME}$"):
+        return True
+    try:
+        rounds = int(hashed_password.split("$")[1])
+    except (IndexError, ValueError):
+        return True
+    return rounds < settings.password_hash_iterations
 
 
 class TokenError(ValueError):
@@ -75,29 +134,109 @@ def create_refresh_token(data: dict[str, Any], expires_delta: timedelta | None =
     return jwt.encode(payload, _REFRESH_SECRET, algorithm=_ALGORITHM)
 
 
+def _token_id(token: str, payload: dict[str, Any] | None) -> str:
+    if payload is None:
+        try:
+            payload = jwt.decode(token, options={"verify_signature": False})
+        except PyJWTError:
+            payload = {}
+    # Tokens issued before ``jti`` was added fall back to a digest of the token
+    return str(payload.get("jti") or hashlib.sha256(token.encode("utf-8")).hexdigest())
+
+
 def revoke_refresh_token(token: str, payload: dict[str, Any] | None = None) -> None:
-    """Blacklist a refresh token by recording its expiry."""
+    """Blacklist a refresh token until its expiry."""
 
-    _cleanup_revoked()
     if payload is None:
         try:
             payload = verify_token(token, expected_type="refresh")
         except TokenError:
             return
-    exp = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
-    _revoked_refresh_tokens[token] = exp
+    revocation_store.revoke(_token_id(token, payload), float(payload["exp"]))
 
 
-def is_refresh_token_revoked(token: str) -> bool:
+def is_refresh_token_revoked(token: str, payload: dict[str, Any] | None = None) -> bool:
     """Return True if the refresh token has been blacklisted."""
 
-    _cleanup_revoked()
-    return token in _revoked_refresh_tokens
-
-
-def verify_token(token: str, expected_type: str = "access") -> dict[str, Any]:
-    """Decode and validate a JWT, raising TokenError on failure."""
-
+    return revocation_store.is_revoked(_token_id(token, payload))
+
+
+class VerifiedTokenCache:
+    """LRU cache of verified token payloads keyed by a digest of the token.
+
+    Entries never outlive the token's own ``exp`` claim, and the number of
+    entries is capped so memory use stays fixed.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(token: str, expected_type: str) -> bytes:
+        return hashlib.sha256(f"{expected_type}:{token}".encode("utf-8")).digest()
+
+    def get(self, key: bytes) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, payload = entry
+                if expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return dict(payload)
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: bytes, payload: dict[str, Any]) -> None:
+        expires_at = min(float(payload.get("exp", 0)), time.time() + self.ttl_seconds)
+        with self._lock:
+            self._entries[key] = (expires_at, dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits_total": self.hits,
+            "misses_total": self.misses,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+        }
+
+
+_token_cache: VerifiedTokenCache | None = (
+    VerifiedTokenCache(settings.token_cache_size, settings.token_cache_ttl_seconds)
+    if settings.token_cache_size > 0
+    else None
+)
+
+
+def token_cache_stats() -> dict[str, int]:
+    """Return hit/miss counters of the verified-token cache."""
+
+    if _token_cache is None:
+        return {"hits_total": 0, "misses_total": 0, "size": 0, "max_entries": 0}
+    return _token_cache.stats()
+
+
+def clear_token_cache() -> None:
+    if _token_cache is not None:
+        _token_cache.clear()
+
+
+def _decode(token: str, expected_type: str) -> dict[str, Any]:
     secret = _ACCESS_SECRET if expected_type == "access" else _REFRESH_SECRET
     try:
         payload = jwt.decode(token, secret, algorithms=[_ALGORITHM])
@@ -106,8 +245,22 @@ def verify_token(token: str, expected_type: str = "access") -> dict[str, Any]:
 
     if payload.get("type") != expected_type:
         raise TokenError("Token has wrong type")
+    return payload
+
+
+def verify_token(token: str, expected_type: str = "access") -> dict[str, Any]:
+    """Decode and validate a JWT, raising TokenError on failure."""
+
+    if _token_cache is None:
+        payload = _decode(token, expected_type)
+    else:
+        cache_key = VerifiedTokenCache.key(token, expected_type)
+        payload = _token_cache.get(cache_key)
+        if payload is None:
+            payload = _decode(token, expected_type)
+            _token_cache.put(cache_key, payload)
 
-    if expected_type == "refresh" and is_refresh_token_revoked(token):
+    if expected_type == "refresh" and is_refresh_token_revoked(token, payload):
         raise TokenError("Token revoked")
 
     return payload
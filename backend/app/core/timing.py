@@ -0,0 +1,62 @@
+"""Per-request phase timings reported through the ``Server-Timing`` header."""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine
+
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.db.session import QueryStats
+
+
+@dataclass(slots=True)
+class RequestTimings:
+    """Route handler, response validation and serialisation time for one request."""
+
+    handler: float = 0.0
+    validate: float = 0.0
+    serialize: float = 0.0
+
+
+request_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+class TimedRoute(APIRoute):
+    """API route that reports its handler time as the ``app`` phase of ``Server-Timing``.
+
+    The handler covers dependencies, the endpoint and response rendering.
+    Endpoints that render through :func:`app.core.serialization.validated_response`
+    also report their validate and serialize phases separately.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            timings = request_timings.get()
+            if timings is None:
+                return await handler(request)
+            started = time.perf_counter()
+            try:
+                return await handler(request)
+            finally:
+                timings.handler += time.perf_counter() - started
+
+        return timed_handler
+
+
+def server_timing_header(db_stats: QueryStats, timings: RequestTimings) -> bytes:
+    """Render the phases collected so far as a ``Server-Timing`` value."""
+
+    return (
+        f'db;desc="{db_stats.count} queries";dur={db_stats.seconds * 1000:.2f}, '
+        f"orm;dur={db_stats.orm_seconds * 1000:.2f}, "
+        f"app;dur={timings.handler * 1000:.2f}, "
+        f"validate;dur={timings.validate * 1000:.2f}, "
+        f"serialize;dur={timings.serialize * 1000:.2f}"
+    ).encode("latin-1")
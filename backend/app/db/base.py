@@ -15,3 +15,4 @@ from app.models.notification import Notification  # noqa: F401
 from app.models.brand import Brand  # noqa: F401
 from app.models.webhook_event import WebhookEvent  # noqa: F401
 from app.models.admin_log import AdminLog  # noqa: F401
+from app.models.revoked_token import RevokedToken  # noqa: F401
@@ -0,0 +1,94 @@
+"""Connection pool configuration and live statistics."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.engine import URL, Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+
+class _CheckoutStatsMixin:
+    """Records how long pool checkouts take, including waits for a free slot."""
+
+    def __init__(self, *args: Any, max_overflow: int = 10, **kwargs: Any) -> None:
+        super().__init__(*args, max_overflow=max_overflow, **kwargs)
+        self.max_overflow = max_overflow
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        waited = time.perf_counter() - started
+        with self._stats_lock:
+            self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        return connection
+
+
+class InstrumentedQueuePool(_CheckoutStatsMixin, QueuePool):
+    """``QueuePool`` with checkout statistics."""
+
+
+class InstrumentedAsyncQueuePool(_CheckoutStatsMixin, AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` with checkout statistics, for async engines."""
+
+
+def engine_options(url: URL, *, is_async: bool = False) -> dict[str, Any]:
+    """Return ``create_engine``/``create_async_engine`` arguments for the configured pool."""
+
+    if url.drivername.startswith("sqlite") and url.database in (None, "", ":memory:"):
+        # In-memory SQLite uses a per-thread singleton pool; sizing does not apply
+        return {}
+
+    options: dict[str, Any] = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_use_lifo": settings.db_pool_use_lifo,
+    }
+    if url.drivername == "postgresql+psycopg":
+        options["connect_args"] = {"prepare_threshold": settings.db_prepare_threshold}
+    return options
+
+
+def pool_statistics(engine: Engine) -> dict[str, float]:
+    """Snapshot of the engine's pool: size, usage and connection wait times."""
+
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+    stats: dict[str, float] = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+    }
+    if isinstance(pool, _CheckoutStatsMixin):
+        with pool._stats_lock:
+            stats.update(
+                max_overflow=pool.max_overflow,
+                checkouts_total=pool.checkouts,
+                timeouts_total=pool.timeouts,
+                wait_seconds_total=pool.wait_seconds_total,
+                wait_seconds_max=pool.wait_seconds_max,
+            )
+    return stats
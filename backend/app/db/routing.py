@@ -0,0 +1,185 @@
+"""Primary/replica session routing with read-your-writes stickiness.
+
+Sessions created from the read factories (``info={"use_replicas": True}``)
+send plain SELECTs to a healthy replica, picked round-robin. Everything else
+goes to the primary: flushes, DML, ``SELECT ... FOR UPDATE``, any statement
+issued after the session wrote, and reads by a client who committed a write
+within the last ``sticky_seconds`` (so they never see replication lag on
+their own changes).
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from contextvars import ContextVar
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import Select, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+# Identifies the client behind the current request (``user:<id>`` or ``ip:<addr>``)
+routing_key: ContextVar[str | None] = ContextVar("routing_key", default=None)
+
+
+class ReplicaSet:
+    """Round-robin over replica engines, skipping ones that fail health checks.
+
+    A replica's health is probed with ``SELECT 1`` at most once per
+    ``check_interval`` seconds, lazily when it is next picked. Connection
+    errors during normal use mark it down until the next probe.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[Engine],
+        *,
+        check_interval: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.engines = list(engines)
+        self.check_interval = check_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cycle = itertools.cycle(range(len(self.engines))) if self.engines else None
+        self._healthy = [True] * len(self.engines)
+        self._next_check = [0.0] * len(self.engines)
+        for engine in self.engines:
+            event.listen(engine, "handle_error", self._on_error)
+
+    def _on_error(self, context) -> None:
+        if context.is_disconnect or context.connection is None:
+            self.mark_down(context.engine)
+
+    def mark_down(self, engine: Engine) -> None:
+        with self._lock:
+            for idx, candidate in enumerate(self.engines):
+                if candidate is engine:
+                    self._healthy[idx] = False
+                    self._next_check[idx] = self._clock() + self.check_interval
+
+    def _probe(self, idx: int) -> bool:
+        engine = self.engines[idx]
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception as exc:  # pragma: no cover - exact error depends on the driver
+            logger.warning("Replica {url} failed health check: {error}", url=engine.url, error=exc)
+            return False
+        return True
+
+    def choose(self) -> Engine | None:
+        """Return the next healthy replica, or None to fall back to the primary."""
+
+        if self._cycle is None:
+            return None
+        for _ in range(len(self.engines)):
+            with self._lock:
+                idx = next(self._cycle)
+                due = self._clock() >= self._next_check[idx]
+                if due:
+                    # Claim the probe so concurrent callers do not repeat it
+                    self._next_check[idx] = self._clock() + self.check_interval
+                elif self._healthy[idx]:
+                    return self.engines[idx]
+            if due:
+                healthy = self._probe(idx)
+                with self._lock:
+                    self._healthy[idx] = healthy
+                if healthy:
+                    return self.engines[idx]
+        return None
+
+
+class ReadYourWrites:
+    """Remembers which clients wrote recently, bounded to ``max_keys`` entries."""
+
+    def __init__(
+        self,
+        window_seconds: float,
+        *,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._until: OrderedDict[str, float] = OrderedDict()
+
+    def mark(self, key: str) -> None:
+        with self._lock:
+            self._until[key] = self._clock() + self.window_seconds
+            self._until.move_to_end(key)
+            while len(self._until) > self.max_keys:
+                self._until.popitem(last=False)
+
+    def is_sticky(self, key: str) -> bool:
+        with self._lock:
+            until = self._until.get(key)
+            if until is None:
+                return False
+            if until <= self._clock():
+                del self._until[key]
+                return False
+            return True
+
+
+class RoutingSession(Session):
+    """Session that reads from replicas when created with ``use_replicas``."""
+
+    def __init__(
+        self,
+        *args: Any,
+        replicas: ReplicaSet | None = None,
+        stickiness: ReadYourWrites | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.stickiness = stickiness
+        self._replica: Engine | None = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        primary = super().get_bind(mapper, clause=clause, **kwargs)
+        if (
+            self.replicas is None
+            or not self.info.get("use_replicas")
+            or self.info.get("wrote")
+            or self._flushing
+            or not isinstance(clause, Select)
+            or clause._for_update_arg is not None
+        ):
+            return primary
+        key = routing_key.get()
+        if key is not None and self.stickiness is not None and self.stickiness.is_sticky(key):
+            return primary
+        # Stay on one replica for the session's lifetime: one connection, consistent reads
+        if self._replica is None:
+            self._replica = self.replicas.choose()
+        return self._replica or primary
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _record_write(session: Session, flush_context) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _record_bulk_write(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _start_stickiness(session: Session) -> None:
+    if not session.info.get("wrote"):
+        return
+    key = routing_key.get()
+    if key is not None and isinstance(session, RoutingSession) and session.stickiness is not None:
+        session.stickiness.mark(key)
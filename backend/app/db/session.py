@@ -2,19 +2,120 @@
 
 from __future__ import annotations
 
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import make_url
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from loguru import logger
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, ORMExecuteState, Session, sessionmaker
 
 from app.core.config import PROJECT_ROOT, settings
+from app.db.pool import engine_options
+from app.db.routing import ReadYourWrites, ReplicaSet, RoutingSession
+from app.db.sqlite import create_async_sqlite_engines, create_sqlite_engines, is_file_sqlite
 
 
 class Base(DeclarativeBase):
     """Base class for all ORM models."""
 
 
+@dataclass(slots=True)
+class QueryStats:
+    """Statements executed and time spent in the driver for one request.
+
+    With ``track_orm`` set, the ORM's own share of each buffered select
+    (statement compilation, result setup and hydrating the rows into
+    entities, driver time excluded) is measured as ``orm_seconds``. Streamed
+    and ``yield_per`` selects hydrate lazily as the caller consumes them, and
+    that part is not counted.
+    """
+
+    count: int = 0
+    seconds: float = 0.0
+    orm_seconds: float = 0.0
+    track_orm: bool = False
+    statements: dict[str, int] = field(default_factory=dict)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Return statement templates executed at least ``threshold`` times."""
+
+        if threshold <= 0:
+            return []
+        return [(statement, count) for statement, count in self.statements.items() if count >= threshold]
+
+
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+# Listening on the Engine class covers every engine, including test engines
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> str:
+    """Describe bound parameters by type only, so values never reach the logs."""
+
+    if executemany and isinstance(parameters, (list, tuple)):
+        first = parameter_shape(parameters[0]) if parameters else "()"
+        return f"{len(parameters)} x {first}"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: {type(value).__name__}" for key, value in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+    return type(parameters).__name__
+
+
+_SLOW_QUERY_SECONDS = settings.slow_query_ms / 1000
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    stats = query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+        stats.statements[statement] = stats.statements.get(statement, 0) + 1
+    if elapsed >= _SLOW_QUERY_SECONDS:
+        logger.warning(
+            "[SLOW QUERY] {duration:.2f} ms params={shape} {statement}",
+            duration=elapsed * 1000,
+            shape=parameter_shape(parameters, executemany),
+            statement=" ".join(statement.split()),
+        )
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context) -> None:
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start"):
+        connection.info["query_start"].pop()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _time_orm_execute(orm_execute_state: ORMExecuteState):
+    stats = query_stats.get()
+    if stats is None or not stats.track_orm or not orm_execute_state.is_select:
+        return None
+
+    options = orm_execute_state.execution_options
+    if not options.get("stream_results") and not options.get("yield_per"):
+        # Hydrate inside the timed call, as AsyncSession.execute always does. Streamed and
+        # yield_per results stay lazy, so they behave the same whether or not Server-Timing is on
+        orm_execute_state.update_execution_options(prebuffer_rows=True)
+    started = time.perf_counter()
+    db_before = stats.seconds
+    result = orm_execute_state.invoke_statement()
+    stats.orm_seconds += (time.perf_counter() - started) - (stats.seconds - db_before)
+    return result
+
+
 def _ensure_sqlite_database(url_str: str) -> str:
     url = make_url(url_str)
     if not url.drivername.startswith("sqlite"):
@@ -35,9 +136,74 @@ def _ensure_sqlite_database(url_str: str) -> str:
     return url.render_as_string(hide_password=False)
 
 
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+psycopg",
+    "postgresql+psycopg2": "postgresql+psycopg",
+}
+
+
+def async_database_url(url_str: str) -> str:
+    """Return the asyncio driver variant of a sync database URL."""
+
+    url = make_url(url_str)
+    drivername = _ASYNC_DRIVERS.get(url.drivername, url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+
 DATABASE_URL = _ensure_sqlite_database(settings.database_url)
-engine = create_engine(DATABASE_URL, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+ASYNC_DATABASE_URL = async_database_url(DATABASE_URL)
+REPLICA_URLS = [_ensure_sqlite_database(url) for url in settings.database_replica_urls]
+
+
+def _create_engine(url: str) -> Engine:
+    return create_engine(url, future=True, **engine_options(make_url(url)))
+
+
+def _create_async_engine(url: str):
+    async_url = async_database_url(url)
+    return create_async_engine(async_url, **engine_options(make_url(async_url), is_async=True))
+
+
+# Tuned SQLite mode: writes share one connection, reads go to a read-only pool
+SQLITE_SINGLE_WRITER = settings.sqlite_wal and is_file_sqlite(make_url(DATABASE_URL))
+
+if SQLITE_SINGLE_WRITER:
+    engine, read_engine = create_sqlite_engines(DATABASE_URL)
+    async_engine, async_read_engine = create_async_sqlite_engines(ASYNC_DATABASE_URL)
+    # Readers share the writer's file, so there is no replication lag to stick around for
+    stickiness = None
+    replicas = ReplicaSet([read_engine], check_interval=settings.replica_check_seconds)
+    async_replicas = ReplicaSet([async_read_engine.sync_engine], check_interval=settings.replica_check_seconds)
+    # Every session reads from the pool until it writes, so reads never queue behind the writer
+    _default_info = {"use_replicas": True}
+else:
+    engine = _create_engine(DATABASE_URL)
+    async_engine = _create_async_engine(DATABASE_URL)
+    read_engine = async_read_engine = None
+    stickiness = ReadYourWrites(settings.replica_sticky_seconds)
+    replicas = ReplicaSet([_create_engine(url) for url in REPLICA_URLS], check_interval=settings.replica_check_seconds)
+    async_replicas = ReplicaSet(
+        [_create_async_engine(url).sync_engine for url in REPLICA_URLS], check_interval=settings.replica_check_seconds
+    )
+    _default_info = {}
+
+_session_options = {"class_": RoutingSession, "replicas": replicas, "stickiness": stickiness}
+_async_session_options = {"sync_session_class": RoutingSession, "replicas": async_replicas, "stickiness": stickiness}
+
+SessionLocal = sessionmaker(
+    bind=engine, autoflush=False, autocommit=False, expire_on_commit=False, info=_default_info, **_session_options
+)
+ReadSessionLocal = sessionmaker(
+    bind=engine, autoflush=False, expire_on_commit=False, info={"use_replicas": True}, **_session_options
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False, info=_default_info, **_async_session_options
+)
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False, info={"use_replicas": True}, **_async_session_options
+)
 
 
 def get_session():
@@ -48,3 +214,24 @@ def get_session():
         yield session
     finally:
         session.close()
+
+
+def get_read_session():
+    """Yield a session whose plain reads may be served by a replica."""
+
+    with ReadSessionLocal() as session:
+        yield session
+
+
+async def get_async_session():
+    """Yield an ``AsyncSession`` that does not hold a worker thread during I/O."""
+
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def get_async_read_session():
+    """Yield an ``AsyncSession`` whose plain reads may be served by a replica."""
+
+    async with AsyncReadSessionLocal() as session:
+        yield session
@@ -0,0 +1,150 @@
+"""Tuned SQLite mode: WAL journaling, one writer connection and a reader pool.
+
+Under WAL, SQLite serves any number of readers alongside a single writer.
+Rather than letting every pooled connection race for the write lock (and fail
+with "database is locked" under load), writes share one connection: the
+writer engine's pool holds exactly one, so concurrent writers queue on
+checkout for up to ``DB_POOL_TIMEOUT`` seconds. The sync and async writer
+engines each have their own connection, so a process-wide lock per database
+file is held from writer checkout to checkin, and at most one of them writes
+at a time. Plain reads are served by a
+separate pool of read-only connections through the replica routing in
+:mod:`app.db.routing`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.util import await_only
+
+from app.core.config import settings
+from app.db.pool import engine_options
+
+
+def is_file_sqlite(url: URL) -> bool:
+    """Whether ``url`` points at an on-disk SQLite database."""
+
+    return url.drivername.startswith("sqlite") and url.database not in (None, "", ":memory:")
+
+
+def sqlite_pragmas(*, writer: bool) -> list[str]:
+    """Pragmas applied to every new connection of the writer or reader engine."""
+
+    pragmas = [
+        "PRAGMA journal_mode=WAL",
+        # Durable across application crashes; only an OS crash can lose the last commits
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}",
+        f"PRAGMA cache_size={settings.sqlite_cache_size}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size}",
+    ]
+    if not writer:
+        pragmas.append("PRAGMA query_only=ON")
+    return pragmas
+
+
+def configure_sqlite_engine(engine: Engine, *, writer: bool) -> None:
+    """Register the connect-time pragmas, and ``BEGIN IMMEDIATE`` for the writer."""
+
+    pragmas = sqlite_pragmas(writer=writer)
+
+    @event.listens_for(engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record) -> None:
+        if writer:
+            # Stop the driver from issuing its own deferred BEGIN; the hook below does it
+            dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    if writer:
+
+        @event.listens_for(engine, "begin")
+        def begin_immediate(connection) -> None:
+            # Take the write lock up front: a deferred transaction that reads and then
+            # writes cannot wait out another process's lock and fails with SQLITE_BUSY
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+@lru_cache(maxsize=None)
+def _writer_lock(database: str) -> threading.Lock:
+    return threading.Lock()
+
+
+def writer_lock(url: URL) -> threading.Lock:
+    """The process-wide write lock shared by every writer engine of one SQLite file."""
+
+    return _writer_lock(str(Path(url.database).resolve()))
+
+
+async def _acquire_polling(lock: threading.Lock, timeout: float) -> bool:
+    # Polling keeps the event loop free while a sync writer holds the lock, and a cancelled
+    # waiter can never end up owning it
+    deadline = time.monotonic() + timeout
+    while not lock.acquire(blocking=False):
+        if time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(0.005)
+    return True
+
+
+def share_writer_lock(engine: Engine, lock: threading.Lock, *, is_async: bool) -> None:
+    """Hold ``lock`` while a connection of ``engine`` is checked out."""
+
+    timeout = settings.db_pool_timeout
+
+    @event.listens_for(engine, "checkout")
+    def acquire(dbapi_connection, connection_record, connection_proxy) -> None:
+        # Async checkouts run inside SQLAlchemy's greenlet, which can await
+        acquired = await_only(_acquire_polling(lock, timeout)) if is_async else lock.acquire(timeout=timeout)
+        if not acquired:
+            raise exc.TimeoutError(f"SQLite writer lock not acquired within {timeout} seconds")
+        connection_record.record_info["holds_writer_lock"] = True
+
+    @event.listens_for(engine, "checkin")
+    def release(dbapi_connection, connection_record) -> None:
+        # Also fires when a checkout fails, before or after the lock was taken
+        if connection_record is not None and connection_record.record_info.pop("holds_writer_lock", False):
+            lock.release()
+
+
+def _options(url: URL, *, writer: bool, is_async: bool) -> dict[str, Any]:
+    options = engine_options(url, is_async=is_async)
+    options.update(pool_size=1 if writer else settings.sqlite_read_pool_size, max_overflow=0)
+    return options
+
+
+def create_sqlite_engines(url_str: str) -> tuple[Engine, Engine]:
+    """Return the ``(writer, reader)`` engines for a file-backed SQLite URL."""
+
+    url = make_url(url_str)
+    writer = create_engine(url, future=True, **_options(url, writer=True, is_async=False))
+    reader = create_engine(url, future=True, **_options(url, writer=False, is_async=False))
+    configure_sqlite_engine(writer, writer=True)
+    configure_sqlite_engine(reader, writer=False)
+    share_writer_lock(writer, writer_lock(url), is_async=False)
+    return writer, reader
+
+
+def create_async_sqlite_engines(url_str: str) -> tuple[AsyncEngine, AsyncEngine]:
+    """Async counterpart of :func:`create_sqlite_engines` for ``sqlite+aiosqlite`` URLs."""
+
+    url = make_url(url_str)
+    writer = create_async_engine(url, **_options(url, writer=True, is_async=True))
+    reader = create_async_engine(url, **_options(url, writer=False, is_async=True))
+    configure_sqlite_engine(writer.sync_engine, writer=True)
+    configure_sqlite_engine(reader.sync_engine, writer=False)
+    share_writer_lock(writer.sync_engine, writer_lock(url), is_async=True)
+    return writer, reader
@@ -1,9 +1,21 @@
-from fastapi import FastAPI
+from typing import Annotated
+
+from fastapi import Depends, FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
 from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
 
 from app.api import api_router
+from app.api.deps import get_db
 from app.core.error_handlers import register_exception_handlers
+from app.core.hashing import password_pool
+from app.core.metrics import instrument_routes, metrics_registry, threadpool_statistics
 from app.core.middleware import setup_middleware
+from app.core.security import token_cache_stats
+from app.db.pool import pool_statistics
+from app.db.session import async_engine, engine, read_engine
 
 app = FastAPI(title="UGC Marketplace API", version="0.3.0")
 setup_middleware(app)
@@ -21,3 +33,40 @@ def read_health() -> HealthResponse:
     """Return a simple health payload for smoke tests."""
 
     return HealthResponse(status="ok", service="backend")
+
+
+class ReadinessResponse(BaseModel):
+    status: str
+    pool: dict[str, float]
+
+
+@app.get("/health/ready", response_model=ReadinessResponse, tags=["Health"])
+def read_readiness(db: Annotated[Session, Depends(get_db)]) -> ReadinessResponse | JSONResponse:
+    """Check the database connection and report connection pool usage."""
+
+    pool = pool_statistics(db.get_bind())
+    try:
+        db.execute(text("SELECT 1"))
+    except SQLAlchemyError:
+        return JSONResponse(status_code=503, content={"status": "unavailable", "pool": pool})
+    return ReadinessResponse(status="ready", pool=pool)
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def read_metrics() -> PlainTextResponse:
+    """Expose request metrics in the Prometheus text format."""
+
+    gauges = {f"threadpool_{name}": value for name, value in threadpool_statistics().items()}
+    gauges.update({f"db_pool_{name}": value for name, value in pool_statistics(engine).items()})
+    gauges.update({f"db_async_pool_{name}": value for name, value in pool_statistics(async_engine.sync_engine).items()})
+    gauges.update({f"password_hash_{name}": value for name, value in password_pool.stats().items()})
+    gauges.update({f"token_cache_{name}": value for name, value in token_cache_stats().items()})
+    if read_engine is not None:
+        gauges.update({f"db_read_pool_{name}": value for name, value in pool_statistics(read_engine).items()})
+    return PlainTextResponse(
+        metrics_registry.render(gauges),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+instrument_routes(app)
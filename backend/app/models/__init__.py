@@ -15,10 +15,12 @@ from app.models.enums import (
 )
 from app.models.brand import Brand
 from app.models.notification import Notification
+from app.models.notification_counter import NotificationCounter
 from app.models.order import Order
 from app.models.payment import Payment
 from app.models.rating import Rating
 from app.models.report import Report
+from app.models.revoked_token import RevokedToken
 from app.models.user import User
 from app.models.video import Video
 from app.models.webhook_event import WebhookEvent
@@ -34,12 +36,14 @@ __all__ = [
     "Order",
     "OrderStatus",
     "Notification",
+    "NotificationCounter",
     "Payment",
     "PaymentStatus",
     "PaymentType",
     "Rating",
     "Report",
     "ReportType",
+    "RevokedToken",
     "User",
     "UserRole",
     "Video",
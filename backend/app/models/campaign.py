@@ -7,7 +7,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, Enum, ForeignKey, Numeric, String, Text, func
+from sqlalchemy import CheckConstraint, Enum, ForeignKey, Index, Numeric, String, Text, func, literal_column
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -25,6 +25,13 @@ class Campaign(Base):
     __tablename__ = "campaigns"
     __table_args__ = (
         CheckConstraint("budget >= 0", name="campaign_budget_positive"),
+        Index("ix_campaigns_status_created_at", "status", "created_at"),
+        # Keyset pagination order for unfiltered listings
+        Index("ix_campaigns_created_at_id", "created_at", "id"),
+        # Listing ETags aggregate count, max(updated_at) and sum(row_version) over the filtered set
+        Index("ix_campaigns_updated_at", "updated_at", "row_version"),
+        Index("ix_campaigns_status_updated_at", "status", "updated_at", "row_version"),
+        Index("ix_campaigns_brand_id_updated_at", "brand_id", "updated_at", "row_version"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -39,6 +46,10 @@ class Campaign(Base):
     end_date: Mapped[date | None] = mapped_column()
     created_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now(), onupdate=func.now())
+    # Bumped by every UPDATE, so listing ETags change even within updated_at's resolution
+    row_version: Mapped[int] = mapped_column(
+        nullable=False, default=1, server_default="1", onupdate=literal_column("row_version + 1")
+    )
 
     brand: Mapped["User"] = relationship("User", back_populates="campaigns")
     applications: Mapped[list["Application"]] = relationship("Application", back_populates="campaign", cascade="all, delete-orphan")
@@ -0,0 +1,24 @@
+"""Per-user unread notification counters."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class NotificationCounter(Base):
+    """Unread count kept in step with ``notifications`` and periodically recounted."""
+
+    __tablename__ = "notification_counters"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    unread: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    reconciled_at: Mapped[datetime] = mapped_column(nullable=False)
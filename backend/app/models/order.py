@@ -7,7 +7,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Enum, ForeignKey, Numeric, String, Text, UniqueConstraint, func
+from sqlalchemy import Enum, ForeignKey, Index, Numeric, String, Text, UniqueConstraint, func, literal_column
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -26,6 +26,12 @@ class Order(Base):
     __tablename__ = "orders"
     __table_args__ = (
         UniqueConstraint("application_id", name="uq_order_application"),
+        # list_orders filters by one participant and pages by (updated_at, id); row_version
+        # lets the listing ETag aggregate run on the index alone
+        Index("ix_orders_brand_id_updated_at", "brand_id", "updated_at", "id", "row_version"),
+        Index("ix_orders_creator_id_updated_at", "creator_id", "updated_at", "id", "row_version"),
+        Index("ix_orders_campaign_id_updated_at", "campaign_id", "updated_at", "id", "row_version"),
+        Index("ix_orders_updated_at_id", "updated_at", "id", "row_version"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -39,6 +45,10 @@ class Order(Base):
     delivery_due: Mapped[datetime | None] = mapped_column()
     created_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Bumped by every UPDATE, so listing ETags change even within updated_at's resolution
+    row_version: Mapped[int] = mapped_column(
+        nullable=False, default=1, server_default="1", onupdate=literal_column("row_version + 1")
+    )
 
     application: Mapped["Application"] = relationship("Application", back_populates="order")
     campaign: Mapped["Campaign"] = relationship("Campaign", back_populates="orders")
@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Enum, String, func, JSON
+from sqlalchemy import Enum, Index, String, func, JSON
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -24,6 +24,10 @@ if TYPE_CHECKING:  # pragma: no cover
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Keyset order of the admin user directory
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
@@ -44,3 +48,12 @@ class User(Base):
     authored_reports: Mapped[list["Report"]] = relationship("Report", back_populates="author")
     ratings: Mapped[list["Rating"]] = relationship("Rating", back_populates="user")
     notifications: Mapped[list["Notification"]] = relationship("Notification", back_populates="user", cascade="all, delete-orphan")
+
+
+# Admin directory email prefix search: lower(email) LIKE 'prefix%' on PostgreSQL, where
+# text_pattern_ops keeps LIKE indexable under any collation, and GLOB on SQLite
+Index(
+    "ix_users_email_lower",
+    func.lower(User.email).label("email_lower"),
+    postgresql_ops={"email_lower": "text_pattern_ops"},
+)
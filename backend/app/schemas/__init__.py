@@ -3,6 +3,9 @@
 from app.schemas.admin import (
     AdminCampaignStatusUpdate,
     AdminExportResponse,
+    AdminUserActivity,
+    AdminUserDirectoryEntry,
+    AdminUserDirectoryResponse,
     AdminUserRoleUpdate,
     StatisticsResponse,
 )
@@ -14,6 +17,7 @@ from app.schemas.notification import (
     NotificationMarkReadRequest,
     NotificationMarkReadResponse,
     NotificationRead,
+    NotificationUnreadCountResponse,
 )
 from app.schemas.order import OrderListResponse, OrderRead, OrderStatusUpdate
 from app.schemas.payment import PaymentCreate, PaymentRead
@@ -28,6 +32,9 @@ from app.schemas.user import LogoutRequest, LoginRequest, RefreshRequest, TokenR
 __all__ = [
     "AdminCampaignStatusUpdate",
     "AdminExportResponse",
+    "AdminUserActivity",
+    "AdminUserDirectoryEntry",
+    "AdminUserDirectoryResponse",
     "AdminUserRoleUpdate",
     "StatisticsResponse",
     "ApplicationCreate",
@@ -43,6 +50,7 @@ __all__ = [
     "NotificationMarkReadRequest",
     "NotificationMarkReadResponse",
     "NotificationRead",
+    "NotificationUnreadCountResponse",
     "OrderListResponse",
     "OrderRead",
     "OrderStatusUpdate",
@@ -8,6 +8,7 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 
 from app.models.enums import AdminLevel, CampaignStatus, UserRole
+from app.schemas.user import UserRead
 
 
 class AdminUserRoleUpdate(BaseModel):
@@ -16,6 +17,25 @@ class AdminUserRoleUpdate(BaseModel):
     permissions: dict | None = None
 
 
+class AdminUserActivity(BaseModel):
+    campaigns: int = 0
+    orders: int = 0
+    applications: int = 0
+
+
+class AdminUserDirectoryEntry(UserRead):
+    is_active: bool
+    # Only filled in when requested with include_activity
+    activity: AdminUserActivity | None = None
+
+
+class AdminUserDirectoryResponse(BaseModel):
+    items: list[AdminUserDirectoryEntry]
+    next_cursor: str | None = None
+    total: int | None = None
+    total_is_estimate: bool = False
+
+
 class AdminCampaignStatusUpdate(BaseModel):
     status: CampaignStatus = Field(..., description="New campaign status")
 
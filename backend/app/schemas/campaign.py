@@ -38,4 +38,7 @@ class CampaignRead(BaseModel):
 
 class CampaignListResponse(BaseModel):
     items: list[CampaignRead]
-    total: int
+    next_cursor: str | None = None
+    # Only filled in when requested with include_total
+    total: int | None = None
+    total_is_estimate: bool = False
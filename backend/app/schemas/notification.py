@@ -21,7 +21,15 @@ class NotificationRead(BaseModel):
 
 class NotificationListResponse(BaseModel):
     items: list[NotificationRead]
-    total: int
+    next_cursor: str | None = None
+    # Only filled in when requested with include_total
+    total: int | None = None
+    total_is_estimate: bool = False
+
+
+class NotificationUnreadCountResponse(BaseModel):
+    user_id: UUID
+    unread: int
 
 
 class NotificationMarkReadRequest(BaseModel):
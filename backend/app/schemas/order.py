@@ -20,6 +20,7 @@ class OrderRead(BaseModel):
     creator_id: UUID
     brand_id: UUID
     agreed_budget: Decimal | None = None
+    updated_at: datetime
 
     @field_serializer("agreed_budget")
     def serialize_budget(self, agreed_budget: Decimal | None) -> str | None:
@@ -30,7 +31,10 @@ class OrderRead(BaseModel):
 
 class OrderListResponse(BaseModel):
     items: list[OrderRead]
-    total: int
+    next_cursor: str | None = None
+    # Only filled in when requested with include_total
+    total: int | None = None
+    total_is_estimate: bool = False
 
 
 class OrderStatusUpdate(BaseModel):
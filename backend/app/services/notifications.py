@@ -3,37 +3,96 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
 from typing import Iterable
 from uuid import UUID
 
 from fastapi import BackgroundTasks
+from sqlalchemy import case, false, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import SessionLocal
-from app.models import Notification
+from app.core.config import settings
+from app.core.metrics import instrument_task
+from app.db.session import AsyncSessionLocal
+from app.models import Notification, NotificationCounter, User
 
 logger = logging.getLogger("ugc.notifications")
 
 # Allow overriding in tests
-SessionFactory = SessionLocal
+SessionFactory = AsyncSessionLocal
 
 
-def _persist_notification(user_id: UUID, notification_type: str, message: str) -> None:
-    session = SessionFactory()
+async def adjust_unread_counters(session: AsyncSession, deltas: Mapping[UUID, int]) -> None:
+    """Apply unread deltas to existing counters in the session's transaction.
+
+    Users without a counter row are skipped; their count is computed from the
+    table on the next :func:`unread_count` call.
+    """
+
+    for user_id, delta in deltas.items():
+        if not delta:
+            continue
+        adjusted = NotificationCounter.unread + delta
+        await session.execute(
+            update(NotificationCounter)
+            .where(NotificationCounter.user_id == user_id)
+            .values(unread=case((adjusted < 0, 0), else_=adjusted))
+            .execution_options(synchronize_session=False)
+        )
+
+
+async def unread_count(session: AsyncSession, user_id: UUID) -> int | None:
+    """Return the user's unread count, recounting it when the counter is missing or stale.
+
+    Returns None when the user has no counter and does not exist.
+    """
+
+    counter = await session.get(NotificationCounter, user_id)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    max_age = timedelta(seconds=settings.notification_counter_reconcile_seconds)
+    if counter is not None and now - counter.reconciled_at < max_age:
+        return counter.unread
+
+    unread = await session.scalar(
+        select(func.count())
+        .select_from(Notification)
+        .where(Notification.user_id == user_id, Notification.is_read == false())
+    )
+    if counter is None:
+        if await session.get(User, user_id) is None:
+            return None
+        session.add(NotificationCounter(user_id=user_id, unread=unread, reconciled_at=now))
+    else:
+        counter.unread, counter.reconciled_at = unread, now
     try:
-        notification = Notification(user_id=user_id, type=notification_type, message=message)
-        session.add(notification)
-        session.commit()
-    except Exception as exc:  # pragma: no cover - logged centrally
-        session.rollback()
-        logger.exception("Failed to persist notification for user %s", user_id, exc_info=exc)
-    finally:
-        session.close()
+        await session.commit()
+    except IntegrityError:
+        # Another request created the counter first; the count we computed is still current
+        await session.rollback()
+    return unread
+
+
+async def _persist_notification(user_id: UUID, notification_type: str, message: str) -> None:
+    async with SessionFactory() as session:
+        try:
+            notification = Notification(user_id=user_id, type=notification_type, message=message)
+            session.add(notification)
+            await adjust_unread_counters(session, {user_id: 1})
+            await session.commit()
+        except Exception as exc:  # pragma: no cover - logged centrally
+            await session.rollback()
+            logger.exception("Failed to persist notification for user %s", user_id, exc_info=exc)
+
+
+_persist_notification_task = instrument_task(_persist_notification)
 
 
 def schedule_notification(background_tasks: BackgroundTasks, *, user_id: UUID, notification_type: str, message: str) -> None:
     """Queue a notification creation in the background."""
 
-    background_tasks.add_task(_persist_notification, user_id, notification_type, message)
+    background_tasks.add_task(_persist_notification_task, user_id, notification_type, message)
 
 
 def schedule_batch_notifications(
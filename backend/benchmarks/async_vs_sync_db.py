@@ -0,0 +1,148 @@
+"""Compare sync ``def`` + ``Session`` endpoints with ``async def`` + ``AsyncSession``.
+
+Both endpoints run the same campaign listing query. A ``sleep_ms`` SQL
+function stands in for the network round trip to a remote database: on the
+sync path it blocks an AnyIO worker thread, so throughput is capped by the
+threadpool size (40 by default), while the async path only waits on the
+driver and keeps the worker threads free.
+
+The sync path tops out at roughly ``40 / latency`` requests per second. The
+client and server share one process here, so both paths are CPU bound until
+that cap drops below the single-core request rate; raise ``--db-latency-ms``
+until it does to see the threadpool limit.
+
+    python benchmarks/async_vs_sync_db.py --concurrency 200 --requests 2000 --db-latency-ms 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx
+from fastapi import FastAPI
+from loguru import logger
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.db.base import Base
+from app.models import Campaign, User, UserRole
+from app.schemas import CampaignRead
+
+
+def _register_sleep(engine: Engine) -> None:
+    @event.listens_for(engine, "connect")
+    def add_sleep_function(dbapi_connection, connection_record) -> None:
+        target = getattr(dbapi_connection, "_connection", dbapi_connection)
+        # aiosqlite proxies expose the sqlite3 connection on ``_conn``
+        target = getattr(target, "_conn", target)
+        target.create_function("sleep_ms", 1, lambda ms: time.sleep(ms / 1000) or 0)
+
+
+def build_app(db_path: Path, latency_ms: float, pool_size: int) -> FastAPI:
+    sync_engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}, pool_size=pool_size, max_overflow=0
+    )
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}", poolclass=AsyncAdaptedQueuePool, pool_size=pool_size, max_overflow=0
+    )
+    _register_sleep(sync_engine)
+    _register_sleep(async_engine.sync_engine)
+    SyncSession = sessionmaker(bind=sync_engine, expire_on_commit=False)
+    AsyncSessionFactory = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+    stmt = select(Campaign).limit(20)
+    wait = text("SELECT sleep_ms(:ms)").bindparams(ms=latency_ms)
+
+    app = FastAPI()
+
+    @app.get("/sync/campaigns")
+    def list_sync() -> list[CampaignRead]:
+        session: Session
+        with SyncSession() as session:
+            session.execute(wait)
+            return [CampaignRead.model_validate(item) for item in session.scalars(stmt).all()]
+
+    @app.get("/async/campaigns")
+    async def list_async() -> list[CampaignRead]:
+        session: AsyncSession
+        async with AsyncSessionFactory() as session:
+            await session.execute(wait)
+            return [CampaignRead.model_validate(item) for item in (await session.scalars(stmt)).all()]
+
+    return app
+
+
+def seed(db_path: Path, campaigns: int) -> None:
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        brand = User(email="bench@example.com", hashed_password="x", role=UserRole.BRAND)
+        session.add(brand)
+        session.flush()
+        for idx in range(campaigns):
+            session.add(Campaign(title=f"Campaign {idx}", budget=Decimal("100.00"), brand_id=brand.id))
+        session.commit()
+    engine.dispose()
+
+
+async def measure(app: FastAPI, path: str, requests: int, concurrency: int) -> tuple[float, float, float]:
+    transport = httpx.ASGITransport(app=app)
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        await asyncio.gather(*(client.get(path) for _ in range(min(concurrency, 50))))
+
+        async def one() -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(path)
+                latencies.append(time.perf_counter() - started)
+                assert response.status_code == 200, response.text
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    return requests / elapsed, statistics.median(latencies) * 1000, p99 * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--db-latency-ms", type=float, default=200.0)
+    parser.add_argument("--campaigns", type=int, default=20)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(lambda _: None)
+
+    db_path = Path(tempfile.mkdtemp()) / "bench.db"
+    seed(db_path, args.campaigns)
+    app = build_app(db_path, args.db_latency_ms, pool_size=args.concurrency)
+
+    print(f"concurrency={args.concurrency} requests={args.requests} db latency={args.db_latency_ms} ms")
+    print(f"{'path':<20} {'req/s':>10} {'p50 ms':>10} {'p99 ms':>10}")
+    for path in ("/sync/campaigns", "/async/campaigns"):
+        throughput, p50, p99 = asyncio.run(measure(app, path, args.requests, args.concurrency))
+        print(f"{path:<20} {throughput:>10.0f} {p50:>10.1f} {p99:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Measure per-request middleware overhead on /health and /api/campaigns.
+
+Compares the previous stack of three ``BaseHTTPMiddleware`` subclasses with
+the single pure-ASGI ``RequestPipelineMiddleware``, both relative to an app
+with no custom middleware at all.
+
+    python benchmarks/middleware_overhead.py --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx
+from fastapi import FastAPI
+from loguru import logger
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.cors import CORSMiddleware
+
+from app.api import api_router
+from app.api.deps import get_async_db, get_async_read_db, get_db, get_read_db
+from app.core.config import settings
+from app.core.error_handlers import register_exception_handlers
+from app.core.middleware import RequestPipelineMiddleware
+from app.core.security import TokenError, get_subject, verify_token
+from app.db.base import Base
+from app.models import Campaign, User, UserRole
+
+UNLIMITED = 10**9
+
+
+class LegacyRequestLogger(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        start = time.time()
+        response = await call_next(request)
+        duration = (time.time() - start) * 1000
+        client_ip = request.client.host if request.client else "unknown"
+        logger.info(
+            "[REQUEST] {method} {path} from {ip} -> {status} ({duration:.2f} ms)",
+            method=request.method,
+            path=request.url.path,
+            ip=client_ip,
+            status=response.status_code,
+            duration=duration,
+        )
+        return response
+
+
+class LegacyRateLimit(BaseHTTPMiddleware):
+    def __init__(self, app, limit: int, window_seconds: int = 60) -> None:
+        super().__init__(app)
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._reservoir: dict[str, tuple[int, float]] = {}
+        self._lock = asyncio.Lock()
+
+    async def dispatch(self, request, call_next):
+        client_ip = request.client.host if request.client else "unknown"
+        async with self._lock:
+            count, reset_ts = self._reservoir.get(client_ip, (0, 0.0))
+            now = time.time()
+            if reset_ts <= now:
+                count, reset_ts = 0, now + self.window_seconds
+            self._reservoir[client_ip] = (count + 1, reset_ts)
+        return await call_next(request)
+
+
+class LegacyAdminAction(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        if request.url.path.startswith("/api/admin"):
+            auth_header = request.headers.get("Authorization")
+            if auth_header and auth_header.lower().startswith("bearer "):
+                try:
+                    get_subject(verify_token(auth_header.split(" ", 1)[1], expected_type="access"))
+                except TokenError:
+                    pass
+        return response
+
+
+def build_app(stack: str, session_factory, async_session_factory) -> FastAPI:
+    app = FastAPI()
+    register_exception_handlers(app)
+    app.include_router(api_router)
+
+    @app.get("/health")
+    def read_health() -> dict[str, str]:
+        return {"status": "ok", "service": "backend"}
+
+    def override_get_db():
+        with session_factory() as session:
+            yield session
+
+    async def override_get_async_db():
+        async with async_session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_db
+    app.add_middleware(CORSMiddleware, allow_origins=settings.allowed_origins, allow_methods=["*"], allow_headers=["*"])
+    if stack == "legacy":
+        app.add_middleware(LegacyRateLimit, limit=UNLIMITED)
+        app.add_middleware(LegacyRequestLogger)
+        app.add_middleware(LegacyAdminAction)
+    elif stack == "pipeline":
+        app.add_middleware(RequestPipelineMiddleware, limit=UNLIMITED)
+    return app
+
+
+def seed(session_factory, campaigns: int) -> None:
+    with session_factory() as session:
+        brand = User(email="bench@example.com", hashed_password="x", role=UserRole.BRAND)
+        session.add(brand)
+        session.flush()
+        for idx in range(campaigns):
+            session.add(Campaign(title=f"Campaign {idx}", budget=Decimal("100.00"), brand_id=brand.id))
+        session.commit()
+
+
+async def measure(app: FastAPI, path: str, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(50):
+            await client.get(path)
+        start = time.perf_counter()
+        for _ in range(requests):
+            response = await client.get(path)
+            assert response.status_code == 200, response.text
+        return (time.perf_counter() - start) / requests * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--campaigns", type=int, default=20)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(lambda _: None)
+
+    db_path = Path(tempfile.mkdtemp()) / "bench.db"
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    async_session_factory = async_sessionmaker(create_async_engine(f"sqlite+aiosqlite:///{db_path}"), expire_on_commit=False)
+    seed(session_factory, args.campaigns)
+
+    print(f"{'path':<16} {'stack':<10} {'us/request':>12} {'overhead us':>12}")
+    for path in ("/health", "/api/campaigns"):
+        results = {stack: asyncio.run(measure(build_app(stack, session_factory, async_session_factory), path, args.requests))
+                   for stack in ("bare", "legacy", "pipeline")}
+        for stack, value in results.items():
+            print(f"{path:<16} {stack:<10} {value:>12.1f} {value - results['bare']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
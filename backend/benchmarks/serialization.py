@@ -0,0 +1,86 @@
+"""Measure list response serialisation throughput for campaign pages.
+
+Compares the previous path (``CampaignRead.model_validate`` per item, then
+FastAPI re-validating the ``response_model`` and rendering a ``JSONResponse``)
+with :func:`app.core.serialization.validated_response` on transient ORM rows.
+
+    python benchmarks/serialization.py --items 10000 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.core.serialization import validated_response
+from app.models import Campaign, CampaignStatus
+from app.schemas import CampaignListResponse, CampaignRead
+
+RESPONSE_FIELD = create_response_field(name="Response_list_campaigns", type_=CampaignListResponse)
+
+
+def build_rows(count: int) -> list[Campaign]:
+    brand_id = uuid.uuid4()
+    return [
+        Campaign(
+            id=uuid.uuid4(),
+            brand_id=brand_id,
+            title=f"Campaign {index}",
+            description="Benchmark campaign description",
+            budget=Decimal("1250.00"),
+            currency="USD",
+            status=CampaignStatus.ACTIVE,
+            created_at=datetime(2026, 1, 1, 12, 0, index % 60),
+        )
+        for index in range(count)
+    ]
+
+
+def legacy(rows: list[Campaign]) -> bytes:
+    response = CampaignListResponse(items=[CampaignRead.model_validate(row) for row in rows])
+    content = asyncio.run(serialize_response(field=RESPONSE_FIELD, response_content=response))
+    return JSONResponse(content).body
+
+
+def fast(rows: list[Campaign]) -> bytes:
+    return validated_response(CampaignListResponse, {"items": rows}).body
+
+
+def measure(render, rows: list[Campaign], rounds: int) -> float:
+    render(rows)  # warm-up: builds validators and the cached TypeAdapter
+    start = time.perf_counter()
+    for _ in range(rounds):
+        render(rows)
+    return len(rows) * rounds / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = build_rows(args.items)
+    results = {name: measure(render, rows, args.rounds) for name, render in (("legacy", legacy), ("fast", fast))}
+
+    print(f"{'path':<10} {'items/sec':>12} {'speedup':>8}")
+    for name, value in results.items():
+        print(f"{name:<10} {value:>12,.0f} {value / results['legacy']:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
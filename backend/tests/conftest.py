@@ -2,35 +2,53 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 import sys
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
+
+# Keep the password KDF cheap so auth-heavy tests stay fast
+os.environ.setdefault("PASSWORD_HASH_ITERATIONS", "1000")
+# Test runs write their app, access and admin logs here instead of the tracked logs/ directory
+TEST_TMP_DIR = Path(tempfile.mkdtemp(prefix="ugc-tests-"))
+os.environ["LOG_PATH"] = str(TEST_TMP_DIR / "logs" / "app.log")
+os.environ["ACCESS_LOG_PATH"] = str(TEST_TMP_DIR / "logs" / "access.log")
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from app.api.deps import get_db
+from app.api.deps import get_async_db, get_async_read_db, get_db, get_read_db
 from app.core.middleware import reset_rate_limiter_sync
 from app.db.base import Base
 from app.main import app
+from app.services import exports as export_service
 from app.services import notifications as notification_service
 
-SQLALCHEMY_DATABASE_URL = "sqlite+pysqlite:///:memory:"
+# A file rather than :memory: so the sync and async engines see the same data
+TEST_DB_PATH = TEST_TMP_DIR / "test.db"
 
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
+    f"sqlite+pysqlite:///{TEST_DB_PATH}",
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
 )
+# TestClient runs each request on a fresh event loop, so async connections cannot be pooled
+async_engine = create_async_engine(f"sqlite+aiosqlite:///{TEST_DB_PATH}", poolclass=NullPool)
 TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+AsyncTestingSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 
-notification_service.SessionFactory = TestingSessionLocal
+notification_service.SessionFactory = AsyncTestingSessionLocal
+export_service.SessionFactory = AsyncTestingSessionLocal
 
 
 def override_get_db():
@@ -38,7 +56,22 @@ def override_get_db():
         yield session
 
 
+async def override_get_async_db():
+    async with AsyncTestingSessionLocal() as session:
+        yield session
+
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_read_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
+app.dependency_overrides[get_async_read_db] = override_get_async_db
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_database_file() -> Iterator[Path]:
+    yield TEST_DB_PATH
+    engine.dispose()
+    shutil.rmtree(TEST_TMP_DIR, ignore_errors=True)
 
 
 @pytest.fixture(autouse=True)
@@ -57,3 +90,31 @@ def client() -> TestClient:
 def db_session() -> Session:
     with TestingSessionLocal() as session:
         yield session
+
+
+@pytest.fixture
+def query_budget() -> Callable[[int], AbstractContextManager[list[str]]]:
+    """Fail the test if the block runs more than ``max_queries`` statements.
+
+    Usage: ``with query_budget(3) as statements: client.get(...)``.
+    """
+
+    @contextmanager
+    def budget(max_queries: int) -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany) -> None:
+            statements.append(statement)
+
+        for target in (engine, async_engine.sync_engine):
+            event.listen(target, "after_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            for target in (engine, async_engine.sync_engine):
+                event.remove(target, "after_cursor_execute", record)
+        assert len(statements) <= max_queries, (
+            f"{len(statements)} queries exceeded the budget of {max_queries}:\n" + "\n".join(statements)
+        )
+
+    return budget
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+from decimal import Decimal
 from uuid import UUID
 
 from fastapi.testclient import TestClient
 
-from app.models import Campaign, User
+from app.api.fieldsets import select_columns
+from app.models import Application, Campaign, Order, User, UserRole
+from app.schemas import CampaignRead, OrderRead
+from app.services.exports import ExportFormat, stream_export
 
 
 def register_and_login(client: TestClient, email: str, *, role: str = "brand", admin_level: str = "none") -> dict:
@@ -40,7 +46,7 @@ def test_admin_user_listing_and_role_update(client: TestClient, db_session) -> N
         headers={"Authorization": f"Bearer {admin_tokens['access_token']}"},
     )
     assert response.status_code == 200
-    assert isinstance(response.json(), list)
+    assert [item["email"] for item in response.json()["items"]] == ["admin1@example.com"]
 
     super_tokens = register_and_login(client, "super@example.com", admin_level="admin_level_3")
     target_tokens = register_and_login(client, "target@example.com", admin_level="none")
@@ -56,6 +62,58 @@ def test_admin_user_listing_and_role_update(client: TestClient, db_session) -> N
     assert payload["permissions"]["can_review"] is True
 
 
+def test_admin_user_directory_filters_pages_and_counts_activity(client: TestClient, db_session) -> None:
+    admin_tokens = register_and_login(client, "directory-admin@example.com", admin_level="admin_level_1")
+    headers = {"Authorization": f"Bearer {admin_tokens['access_token']}"}
+    brand = User(email="dir-brand@example.com", hashed_password="x", role=UserRole.BRAND)
+    creator = User(email="dir-creator@example.com", hashed_password="x", role=UserRole.CREATOR)
+    inactive = User(email="dir-gone@example.com", hashed_password="x", role=UserRole.CREATOR, is_active=False)
+    db_session.add_all([brand, creator, inactive])
+    db_session.flush()
+    campaigns = [Campaign(title=f"C{idx}", budget=Decimal("10.00"), brand_id=brand.id) for idx in range(2)]
+    db_session.add_all(campaigns)
+    db_session.flush()
+    application = Application(campaign_id=campaigns[0].id, creator_id=creator.id)
+    db_session.add(application)
+    db_session.flush()
+    db_session.add(
+        Order(application_id=application.id, campaign_id=campaigns[0].id, creator_id=creator.id, brand_id=brand.id)
+    )
+    db_session.commit()
+
+    page = client.get(
+        "/api/admin/users", params={"email": "dir-", "is_active": True, "include_activity": True}, headers=headers
+    ).json()
+    activity = {item["email"]: item["activity"] for item in page["items"]}
+    assert activity == {
+        "dir-brand@example.com": {"campaigns": 2, "orders": 1, "applications": 0},
+        "dir-creator@example.com": {"campaigns": 0, "orders": 1, "applications": 1},
+    }
+    # Prefixes match case-insensitively, and LIKE/GLOB wildcards in them match literally
+    for prefix, expected in (("DIR-B", ["dir-brand@example.com"]), ("dir_", []), ("dir*", [])):
+        found = client.get("/api/admin/users", params={"email": prefix}, headers=headers).json()["items"]
+        assert [item["email"] for item in found] == expected
+
+    creators = client.get("/api/admin/users", params={"role": "creator", "limit": 1}, headers=headers).json()
+    assert len(creators["items"]) == 1 and creators["items"][0]["activity"] is None
+    rest = client.get(
+        "/api/admin/users", params={"role": "creator", "limit": 1, "cursor": creators["next_cursor"]}, headers=headers
+    ).json()
+    assert {creators["items"][0]["email"], rest["items"][0]["email"]} == {"dir-creator@example.com", "dir-gone@example.com"}
+
+    sparse = client.get(
+        "/api/admin/users",
+        params={"email": "dir-brand", "fields": "email,activity", "include_activity": True},
+        headers=headers,
+    ).json()
+    assert sparse["items"] == [
+        {"email": "dir-brand@example.com", "activity": {"campaigns": 2, "orders": 1, "applications": 0}}
+    ]
+
+    # "%" is matched literally, not as a wildcard
+    assert client.get("/api/admin/users", params={"email": "%"}, headers=headers).json()["items"] == []
+
+
 def test_admin_campaign_permissions(client: TestClient, db_session) -> None:
     super_tokens = register_and_login(client, "super2@example.com", admin_level="admin_level_3")
     mod_tokens = register_and_login(client, "mod@example.com", admin_level="admin_level_1")
@@ -74,6 +132,12 @@ def test_admin_campaign_permissions(client: TestClient, db_session) -> None:
     assert create_campaign.status_code == 201
     campaign_id = create_campaign.json()["id"]
 
+    mod_headers = {"Authorization": f"Bearer {mod_tokens['access_token']}"}
+    listed = client.get("/api/admin/campaigns", headers=mod_headers).json()
+    assert [(item["id"], item["description"], item["budget"]) for item in listed] == [(campaign_id, "Test", "1000.00")]
+    sparse = client.get("/api/admin/campaigns", params={"fields": "id,title"}, headers=mod_headers).json()
+    assert sparse == [{"id": campaign_id, "title": "Admin Test Campaign"}]
+
     # Moderator can update status
     status_resp = client.patch(
         f"/api/admin/campaigns/{campaign_id}/status",
@@ -114,3 +178,29 @@ def test_admin_statistics_and_export(client: TestClient) -> None:
     )
     assert export_resp.status_code == 200
     assert export_resp.headers["content-type"].startswith("text/csv")
+
+
+def test_admin_exports_stream_ndjson_and_csv_in_chunks(client: TestClient, db_session) -> None:
+    admin_tokens = register_and_login(client, "exporter@example.com", admin_level="admin_level_2")
+    headers = {"Authorization": f"Bearer {admin_tokens['access_token']}"}
+    brand_id = UUID(admin_tokens["user"]["id"])
+    db_session.add_all(Campaign(title=f"Export {idx}", budget=Decimal("5.00"), brand_id=brand_id) for idx in range(5))
+    db_session.commit()
+
+    response = client.get("/api/admin/campaigns/export", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(row["title"] for row in rows) == [f"Export {idx}" for idx in range(5)]
+    assert rows[0]["budget"] == "5.00"
+
+    response = client.get("/api/admin/orders/export", params={"format": "csv"}, headers=headers)
+    assert response.status_code == 200
+    assert response.text.splitlines() == [",".join(OrderRead.model_fields)]
+
+    chunks = asyncio.run(_collect(stream_export(select_columns(Campaign, CampaignRead.model_fields), CampaignRead, ExportFormat.NDJSON, chunk_rows=2)))
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]
+
+
+async def _collect(stream) -> list[bytes]:
+    return [chunk async for chunk in stream]
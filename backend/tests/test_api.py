@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import uuid
+from datetime import datetime
 from decimal import Decimal
 
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from app.models import Order, OrderStatus
+from app.api.deps import get_async_db
+from app.main import app
+from app.models import Campaign, Order, OrderStatus, User, UserRole
 
 
 def _auth_headers(client: TestClient, email: str, password: str) -> dict[str, str]:
@@ -82,6 +85,22 @@ def test_refresh_and_logout_flow(client: TestClient) -> None:
     )
     assert invalid_refresh.status_code == 401
 
+def test_brand_creation_resolves_the_user_on_its_own_session(client: TestClient, monkeypatch) -> None:
+    client.post(
+        "/api/auth/register",
+        json={"email": "profile@example.com", "password": "Secret123!", "full_name": "Profile", "role": "brand"},
+    )
+    headers = _auth_headers(client, "profile@example.com", "Secret123!")
+
+    def no_async_session():
+        raise AssertionError("sync brand routes must not open an async session")
+
+    monkeypatch.setitem(app.dependency_overrides, get_async_db, no_async_session)
+    response = client.post("/api/brands", json={"name": "Profile Co"}, headers=headers)
+    assert response.status_code == 201
+    assert response.json()["name"] == "Profile Co"
+
+
 def test_campaign_creation_and_listing(client: TestClient) -> None:
     brand_resp = client.post(
         "/api/auth/register",
@@ -110,13 +129,156 @@ def test_campaign_creation_and_listing(client: TestClient) -> None:
     assert campaign_data["title"] == "Winter Promo"
     assert campaign_data["status"] == "draft"
 
-    list_resp = client.get("/api/campaigns", params={"status": "draft"})
+    list_resp = client.get("/api/campaigns", params={"status": "draft", "include_total": True})
     assert list_resp.status_code == 200
     campaigns = list_resp.json()
     assert campaigns["total"] == 1
     assert campaigns["items"][0]["id"] == campaign_data["id"]
 
 
+def test_campaign_listing_pages_by_cursor(client: TestClient, db_session: Session) -> None:
+    brand = User(email="pager@example.com", hashed_password="x", role=UserRole.BRAND)
+    db_session.add(brand)
+    db_session.flush()
+    # Inserted in one statement batch, so most rows share a created_at second
+    db_session.add_all(
+        Campaign(title=f"Campaign {idx}", budget=Decimal("100.00"), brand_id=brand.id) for idx in range(7)
+    )
+    db_session.commit()
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/api/campaigns", params=params).json()
+        assert len(page["items"]) <= 3
+        assert page["total"] is None
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == len(set(seen)) == 7
+    created = [item["created_at"] for item in client.get("/api/campaigns", params={"limit": 7}).json()["items"]]
+    assert created == sorted(created, reverse=True)
+
+    counted = client.get("/api/campaigns", params={"limit": 1, "include_total": True}).json()
+    assert (counted["total"], counted["total_is_estimate"]) == (7, False)
+    assert client.get("/api/campaigns", params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get("/api/campaigns", params={"limit": 1000}).status_code == 400
+
+
+def test_campaign_listing_returns_sparse_fieldsets(client: TestClient, db_session: Session, query_budget) -> None:
+    brand = User(email="sparse@example.com", hashed_password="x", role=UserRole.BRAND)
+    db_session.add(brand)
+    db_session.flush()
+    db_session.add_all(
+        Campaign(title=f"Sparse {idx}", description="long text", brief="longer text", budget=Decimal("7.5"), brand_id=brand.id)
+        for idx in range(3)
+    )
+    db_session.commit()
+
+    # The ETag aggregate, then the page itself
+    with query_budget(2) as statements:
+        page = client.get("/api/campaigns", params={"fields": "id,title,status,budget", "limit": 2}).json()
+
+    assert [set(item) for item in page["items"]] == [{"id", "title", "status", "budget"}] * 2
+    assert page["items"][0]["budget"] == "7.50"
+    assert page["next_cursor"] is not None
+    assert "description" not in statements[-1] and "brief" not in statements[-1]
+
+    # The ETag aggregate, then the page itself
+    with query_budget(2) as statements:
+        full = client.get("/api/campaigns").json()
+    assert full["items"][0]["description"] == "long text"
+    # Columns the read schema does not use are never loaded
+    assert "brief" not in statements[-1]
+
+    response = client.get("/api/campaigns", params={"fields": "id,password"})
+    assert response.status_code == 400
+
+
+def test_listings_answer_conditional_gets_with_not_modified(
+    client: TestClient, db_session: Session, query_budget
+) -> None:
+    brand = User(email="poller@example.com", hashed_password="x", role=UserRole.BRAND)
+    db_session.add(brand)
+    db_session.flush()
+    campaign = Campaign(title="Polled", budget=Decimal("10.00"), brand_id=brand.id, updated_at=datetime(2026, 1, 1))
+    db_session.add(campaign)
+    db_session.commit()
+
+    params = {"brand_id": str(brand.id)}
+    first = client.get("/api/campaigns", params=params)
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    with query_budget(1):
+        cached = client.get("/api/campaigns", params=params, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+    # Other pages or fieldsets of the same set do not share the ETag
+    other = client.get("/api/campaigns", params={**params, "fields": "id"}, headers={"If-None-Match": etag})
+    assert other.status_code == 200
+
+    # A write within the same updated_at tick still changes the ETag
+    campaign.title = "Polled again"
+    campaign.updated_at = datetime(2026, 1, 1)
+    db_session.commit()
+    changed = client.get("/api/campaigns", params=params, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["items"][0]["title"] == "Polled again"
+
+    orders = client.get("/api/orders", params={"brand_id": str(brand.id)})
+    assert client.get(
+        "/api/orders", params={"brand_id": str(brand.id)}, headers={"If-None-Match": f'"x", {orders.headers["etag"]}'}
+    ).status_code == 304
+
+
+def test_order_listing_pages_and_filters_by_updated_since(client: TestClient, db_session: Session) -> None:
+    brand = User(email="orders-pager@example.com", hashed_password="x", role=UserRole.BRAND)
+    creator = User(email="orders-creator@example.com", hashed_password="x", role=UserRole.CREATOR)
+    db_session.add_all([brand, creator])
+    db_session.flush()
+    campaign = Campaign(title="Paged orders", budget=Decimal("100.00"), brand_id=brand.id)
+    db_session.add(campaign)
+    db_session.flush()
+
+    def order(**kwargs) -> Order:
+        return Order(
+            application_id=uuid.uuid4(), campaign_id=campaign.id, creator_id=creator.id, brand_id=brand.id, **kwargs
+        )
+
+    db_session.add_all([order(updated_at=datetime(2020, 1, 1)), order(updated_at=datetime(2020, 6, 1))])
+    db_session.add_all(order() for _ in range(5))
+    db_session.commit()
+
+    params = {"brand_id": str(brand.id), "updated_since": "2020-06-01T00:00:00Z", "limit": 2}
+    seen: list[dict] = []
+    while True:
+        page = client.get("/api/orders", params=params).json()
+        seen.extend(page["items"])
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+    # Oldest change first, starting at the watermark itself
+    assert len({item["id"] for item in seen}) == len(seen) == 6
+    assert seen[0]["updated_at"].startswith("2020-06-01")
+    assert [item["updated_at"] for item in seen] == sorted(item["updated_at"] for item in seen)
+
+    # Resuming from the newest timestamp seen returns every order sharing it
+    latest = seen[-1]["updated_at"]
+    resumed = client.get("/api/orders", params={"brand_id": str(brand.id), "updated_since": latest}).json()
+    assert {item["id"] for item in resumed["items"]} == {item["id"] for item in seen if item["updated_at"] == latest}
+
+    everything = client.get("/api/orders", params={"creator_id": str(creator.id), "include_total": True}).json()
+    assert everything["total"] == 7
+    assert everything["items"][-1]["updated_at"].startswith("2020-01-01")
+
+
 def test_payment_flow(client: TestClient, db_session: Session) -> None:
     brand_resp = client.post(
         "/api/auth/register",
@@ -0,0 +1,228 @@
+"""Primary/replica routing tests using SQLite files as stand-ins, plus the tuned SQLite mode."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.db.base import Base
+from app.db.pool import pool_statistics
+from app.db.routing import ReadYourWrites, ReplicaSet, RoutingSession, routing_key
+from app.db.sqlite import create_async_sqlite_engines, create_sqlite_engines
+from app.models import User, UserRole
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _database(path: Path, email: str) -> Engine:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(User(email=email, hashed_password="x", role=UserRole.CREATOR))
+        session.commit()
+    return engine
+
+
+def _emails(session) -> set[str]:
+    return set(session.scalars(select(User.email)))
+
+
+@pytest.fixture
+def databases(tmp_path: Path) -> tuple[Engine, Engine]:
+    # Each file holds a distinct row, so a query's result shows which one served it
+    return _database(tmp_path / "primary.db", "primary@example.com"), _database(tmp_path / "replica.db", "replica@example.com")
+
+
+def test_reads_go_to_replica_and_writes_to_primary(databases: tuple[Engine, Engine]) -> None:
+    primary, replica = databases
+    clock = FakeClock()
+    options = {
+        "class_": RoutingSession,
+        "replicas": ReplicaSet([replica], clock=clock),
+        "stickiness": ReadYourWrites(5, clock=clock),
+        "expire_on_commit": False,
+    }
+    ReadSession = sessionmaker(bind=primary, info={"use_replicas": True}, **options)
+    WriteSession = sessionmaker(bind=primary, **options)
+
+    token = routing_key.set("user:writer")
+    try:
+        with ReadSession() as session:
+            assert _emails(session) == {"replica@example.com"}
+            session.add(User(email="new@example.com", hashed_password="x", role=UserRole.CREATOR))
+            session.flush()
+            # After writing, the session reads its own changes from the primary
+            assert "new@example.com" in _emails(session)
+            session.commit()
+
+        with ReadSession() as session:
+            assert "new@example.com" in _emails(session)
+    finally:
+        routing_key.reset(token)
+
+    token = routing_key.set("user:someone-else")
+    try:
+        with ReadSession() as session:
+            assert _emails(session) == {"replica@example.com"}
+        with WriteSession() as session:
+            assert "new@example.com" in _emails(session)
+    finally:
+        routing_key.reset(token)
+
+    clock.now += 6
+    token = routing_key.set("user:writer")
+    try:
+        with ReadSession() as session:
+            assert _emails(session) == {"replica@example.com"}
+    finally:
+        routing_key.reset(token)
+
+
+def test_unhealthy_replica_is_skipped_until_it_recovers(databases: tuple[Engine, Engine], tmp_path: Path) -> None:
+    _, replica = databases
+    broken = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    clock = FakeClock()
+    replica_set = ReplicaSet([broken, replica], check_interval=10, clock=clock)
+
+    assert [replica_set.choose() for _ in range(4)] == [replica] * 4
+
+    (tmp_path / "missing").mkdir()
+    assert replica_set.choose() is replica
+    clock.now += 11
+    assert {replica_set.choose(), replica_set.choose()} == {broken, replica}
+
+
+def test_async_sessions_route_reads_to_replica(databases: tuple[Engine, Engine], tmp_path: Path) -> None:
+    async_primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}", poolclass=NullPool)
+    async_replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}", poolclass=NullPool)
+    AsyncReadSession = async_sessionmaker(
+        bind=async_primary,
+        sync_session_class=RoutingSession,
+        replicas=ReplicaSet([async_replica.sync_engine]),
+        info={"use_replicas": True},
+    )
+
+    async def read() -> set[str]:
+        async with AsyncReadSession() as session:
+            return set(await session.scalars(select(User.email)))
+
+    assert asyncio.run(read()) == {"replica@example.com"}
+
+
+def test_sqlite_mode_applies_pragmas_and_read_only_readers(tmp_path: Path) -> None:
+    writer, reader = create_sqlite_engines(f"sqlite:///{tmp_path / 'app.db'}")
+    Base.metadata.create_all(writer)
+
+    for engine in (writer, reader):
+        with engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+            assert connection.exec_driver_sql("PRAGMA busy_timeout").scalar() == 5000
+    assert writer.pool.size() == 1
+
+    with reader.connect() as connection, pytest.raises(OperationalError, match="readonly"):
+        connection.execute(text("DELETE FROM users"))
+
+
+def test_sqlite_mode_serialises_concurrent_writers(tmp_path: Path) -> None:
+    writer, reader = create_sqlite_engines(f"sqlite:///{tmp_path / 'app.db'}")
+    Base.metadata.create_all(writer)
+    SessionFactory = sessionmaker(
+        bind=writer, class_=RoutingSession, replicas=ReplicaSet([reader]), info={"use_replicas": True}
+    )
+
+    def write(worker: int) -> None:
+        for idx in range(20):
+            with SessionFactory() as session:
+                # Read from the pool, then write through the single writer connection
+                session.scalar(select(func.count(User.id)))
+                session.add(User(email=f"w{worker}-{idx}@example.com", hashed_password="x", role=UserRole.CREATOR))
+                session.commit()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(write, range(8)))
+
+    with SessionFactory() as session:
+        assert session.scalar(select(func.count(User.id))) == 160
+        assert session.get_bind(clause=select(User)) is reader
+
+
+def test_sqlite_mode_serialises_sync_and_async_writers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # With no busy wait, a second writer connection would fail at once with "database is locked"
+    monkeypatch.setattr(settings, "sqlite_busy_timeout_ms", 0)
+    path = tmp_path / "app.db"
+    _database(path, "first@example.com").dispose()
+    writer, reader = create_sqlite_engines(f"sqlite:///{path}")
+    in_transaction = threading.Event()
+
+    def sync_write() -> None:
+        with sessionmaker(bind=writer)() as session:
+            session.add(User(email="sync@example.com", hashed_password="x", role=UserRole.CREATOR))
+            session.flush()
+            in_transaction.set()
+            time.sleep(0.2)
+            session.commit()
+
+    async def run() -> None:
+        async_writer, async_reader = create_async_sqlite_engines(f"sqlite+aiosqlite:///{path}")
+        try:
+            sync_task = asyncio.ensure_future(asyncio.to_thread(sync_write))
+            await asyncio.to_thread(in_transaction.wait)
+            async with async_sessionmaker(bind=async_writer)() as session:
+                session.add(User(email="async@example.com", hashed_password="x", role=UserRole.CREATOR))
+                await session.commit()
+            await sync_task
+        finally:
+            await async_writer.dispose()
+            await async_reader.dispose()
+
+    asyncio.run(run())
+    with reader.connect() as connection:
+        assert connection.scalar(select(func.count(User.id))) == 3
+    writer.dispose()
+    reader.dispose()
+
+
+def test_async_sqlite_mode_routes_reads_to_reader_pool(tmp_path: Path) -> None:
+    path = tmp_path / "app.db"
+    _database(path, "first@example.com").dispose()
+
+    async def run() -> set[str]:
+        writer, reader = create_async_sqlite_engines(f"sqlite+aiosqlite:///{path}")
+        SessionFactory = async_sessionmaker(
+            bind=writer,
+            sync_session_class=RoutingSession,
+            replicas=ReplicaSet([reader.sync_engine]),
+            info={"use_replicas": True},
+        )
+        try:
+            async with SessionFactory() as session:
+                session.add(User(email="second@example.com", hashed_password="x", role=UserRole.CREATOR))
+                await session.commit()
+            async with SessionFactory() as session:
+                emails = set(await session.scalars(select(User.email)))
+            assert pool_statistics(reader.sync_engine)["checkouts_total"] >= 1
+            return emails
+        finally:
+            await writer.dispose()
+            await reader.dispose()
+
+    assert asyncio.run(run()) == {"first@example.com", "second@example.com"}
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import uuid
+from datetime import datetime
 from decimal import Decimal
 
 from fastapi.testclient import TestClient
@@ -13,12 +15,14 @@ from app.models import (
     ApplicationStatus,
     Campaign,
     Notification,
+    NotificationCounter,
     Order,
     OrderStatus,
     Payment,
     PaymentStatus,
     WebhookEvent,
 )
+from app.services import notifications as notification_service
 
 
 def _auth_headers(client: TestClient, email: str, password: str) -> dict[str, str]:
@@ -60,6 +64,38 @@ def test_mark_read_notifications(client: TestClient, db_session: Session) -> Non
     assert notification.is_read is True
 
 
+def test_unread_count_tracks_new_and_read_notifications(client: TestClient, db_session: Session) -> None:
+    user_id = _register_user(client, "badge@example.com", "creator")
+    db_session.add_all(Notification(user_id=user_id, type="test", message=f"#{idx}") for idx in range(3))
+    db_session.commit()
+
+    # The first request creates the counter from the table
+    resp = client.get("/api/notifications/unread-count", params={"user_id": str(user_id)})
+    assert resp.status_code == 200
+    assert resp.json()["unread"] == 3
+
+    # Persisting through the service increments the counter in the same transaction
+    asyncio.run(notification_service._persist_notification(user_id, "test", "one more"))
+    counter = db_session.get(NotificationCounter, user_id)
+    assert counter.unread == 4
+
+    page = client.get("/api/notifications", params={"user_id": str(user_id), "limit": 2}).json()
+    ids = [item["id"] for item in page["items"]]
+    assert len(ids) == 2 and page["next_cursor"] is not None
+    assert client.post("/api/notifications/mark-read", json={"notification_ids": ids}).json()["updated"] == 2
+    # Marking the same notifications again must not decrement twice, nor count them as updated
+    assert client.post("/api/notifications/mark-read", json={"notification_ids": ids}).json()["updated"] == 0
+    assert client.get("/api/notifications/unread-count", params={"user_id": str(user_id)}).json()["unread"] == 2
+
+    # A drifted counter is corrected once it is older than the reconcile interval
+    counter.unread, counter.reconciled_at = 99, datetime(2000, 1, 1)
+    db_session.commit()
+    assert client.get("/api/notifications/unread-count", params={"user_id": str(user_id)}).json()["unread"] == 2
+
+    missing = client.get("/api/notifications/unread-count", params={"user_id": str(uuid.uuid4())})
+    assert missing.status_code == 404
+
+
 def _create_order(
     db_session: Session,
     *,
@@ -118,7 +154,7 @@ def test_order_status_change_creates_notifications(client: TestClient, db_sessio
     creator_notifications = client.get("/api/notifications", params={"user_id": str(creator_id)})
     assert creator_notifications.status_code == 200
     notifications_payload = creator_notifications.json()
-    assert notifications_payload["total"] >= 1
+    assert len(notifications_payload["items"]) >= 1
     types = {item["type"] for item in notifications_payload["items"]}
     assert "order.status" in types
 
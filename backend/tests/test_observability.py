@@ -0,0 +1,161 @@
+"""Metrics and request instrumentation tests."""
+
+from __future__ import annotations
+
+import re
+import uuid
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from app.core import middleware
+from app.core.metrics import LatencyHistogram, metrics_registry
+from app.db.pool import InstrumentedQueuePool, engine_options, pool_statistics
+from app.db.session import QueryStats, parameter_shape, query_stats
+from app.models import Notification, User
+
+
+def test_latency_histogram_percentiles_stay_within_bucket_error() -> None:
+    histogram = LatencyHistogram()
+    for millis in range(1, 1001):
+        histogram.record(millis / 1000)
+
+    assert histogram.count == 1000
+    assert 0.5 <= histogram.percentile(0.5) <= 0.5 * 1.125
+    assert 0.99 <= histogram.percentile(0.99) <= 0.99 * 1.125
+    assert histogram.cumulative()[-1][1] == 1000
+
+
+def test_metrics_endpoint_reports_route_templates(client: TestClient) -> None:
+    metrics_registry.reset()
+    order_ids = [uuid.uuid4() for _ in range(3)]
+    for order_id in order_ids:
+        client.patch(f"/api/orders/{order_id}", json={"status": "completed"})
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    body = response.text
+    assert 'http_request_duration_seconds_count{method="PATCH",route="/api/orders/{order_id}"} 3' in body
+    assert 'http_responses_total{method="PATCH",route="/api/orders/{order_id}",status="4xx"} 3' in body
+    assert 'http_request_db_queries_total{method="PATCH",route="/api/orders/{order_id}"}' in body
+    assert "threadpool_tasks_waiting" in body
+    assert not any(str(order_id) in body for order_id in order_ids)
+
+
+def test_server_timing_header_reports_request_phases(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert "server-timing" not in client.get("/health").headers
+    monkeypatch.setattr(middleware._rate_limiter_instance, "server_timing", True)
+
+    client.post(
+        "/api/auth/register",
+        json={"email": "timing@example.com", "password": "Secret123!", "full_name": "Timing", "role": "brand"},
+    )
+    response = client.get("/api/campaigns")
+
+    assert response.status_code == 200
+    header = response.headers["server-timing"]
+    phases = dict(re.findall(r"(\w+);(?:desc=\"[^\"]*\";)?dur=([\d.]+)", header))
+    assert set(phases) == {"db", "orm", "app", "validate", "serialize"}
+    assert float(phases["validate"]) > 0
+    assert float(phases["app"]) >= float(phases["validate"]) + float(phases["serialize"])
+    assert re.search(r'db;desc="[1-9]\d* queries"', header)
+
+
+def test_orm_timing_covers_hydration_of_buffered_selects(db_session: Session) -> None:
+    for idx in range(3):
+        db_session.add(User(email=f"h{idx}@example.com", hashed_password="x", full_name="H", role="creator"))
+    db_session.commit()
+    db_session.expunge_all()
+    loaded: list[User] = []
+
+    def record_load(target: User, context) -> None:
+        loaded.append(target)
+
+    event.listen(User, "load", record_load)
+
+    token = query_stats.set(QueryStats(track_orm=True))
+    try:
+        result = db_session.scalars(select(User))
+        assert len(loaded) == 3
+        assert len(result.all()) == 3
+
+        db_session.expunge_all()
+        loaded.clear()
+        streamed = db_session.scalars(select(User).execution_options(yield_per=1))
+        assert loaded == []
+        assert len(streamed.all()) == 3
+    finally:
+        query_stats.reset(token)
+        event.remove(User, "load", record_load)
+
+
+def test_notification_listing_stays_within_query_budget(
+    client: TestClient, db_session: Session, query_budget
+) -> None:
+    response = client.post(
+        "/api/auth/register",
+        json={"email": "budget@example.com", "password": "Secret123!", "full_name": "Budget", "role": "creator"},
+    )
+    user_id = uuid.UUID(response.json()["id"])
+    db_session.add_all(Notification(user_id=user_id, type="test", message=f"#{idx}") for idx in range(5))
+    db_session.commit()
+
+    with query_budget(2) as statements:
+        response = client.get("/api/notifications", params={"user_id": str(user_id)})
+
+    assert len(response.json()["items"]) == 5
+    assert len(statements) == 2
+
+
+def test_repeated_statements_are_flagged_as_n_plus_one(db_session: Session) -> None:
+    for idx in range(3):
+        db_session.add(User(email=f"n{idx}@example.com", hashed_password="x", full_name="N", role="creator"))
+    db_session.commit()
+    users = db_session.scalars(select(User)).all()
+
+    stats = QueryStats()
+    token = query_stats.set(stats)
+    try:
+        for user in users:
+            list(user.notifications)
+    finally:
+        query_stats.reset(token)
+
+    [(statement, count)] = stats.repeated(3)
+    assert count == 3
+    assert "FROM notifications" in statement
+    assert parameter_shape(("abc", 1)) == "(str, int)"
+    assert parameter_shape([{"id": 1}, {"id": 2}], executemany=True) == "2 x {id: int}"
+
+
+def test_pool_statistics_track_checkouts(tmp_path: Path) -> None:
+    url = make_url(f"sqlite:///{tmp_path / 'pool.db'}")
+    pool_engine = create_engine(url, **engine_options(url))
+    assert isinstance(pool_engine.pool, InstrumentedQueuePool)
+
+    with pool_engine.connect(), pool_engine.connect():
+        stats = pool_statistics(pool_engine)
+        assert stats["checked_out"] == 2
+    stats = pool_statistics(pool_engine)
+    assert stats["checked_out"] == 0
+    assert stats["checkouts_total"] == 2
+    assert stats["wait_seconds_max"] >= 0
+    assert stats["max_overflow"] == pool_engine.pool.max_overflow
+    pool_engine.dispose()
+
+
+def test_readiness_and_metrics_report_pool(client: TestClient) -> None:
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+    metrics = client.get("/metrics").text
+    assert "db_pool_checked_out" in metrics
+    assert "password_hash_wait_seconds_max" in metrics
+    assert "# TYPE password_hash_completed_total counter" in metrics
+    assert "# TYPE token_cache_hits_total counter" in metrics
+    assert "# TYPE token_cache_misses_total counter" in metrics
@@ -0,0 +1,146 @@
+"""EXPLAIN checks that the hot list/report queries are served by their indexes.
+
+SQLite always runs. Set ``TEST_POSTGRES_URL`` to a scratch database to run the
+same checks on Postgres; sequential scans are disabled there because the
+planner would otherwise prefer them on near-empty tables.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import Select, create_engine, false, func, select, tuple_
+from sqlalchemy.engine import Connection, Engine
+
+from app.db.base import Base
+from app.api.admin.users import email_prefix
+from app.models import Campaign, Notification, Order, Payment, User
+from app.models.enums import CampaignStatus, OrderStatus
+
+SOME_ID = uuid.uuid4()
+CAMPAIGNS_ETAG = select(func.count(), func.max(Campaign.updated_at), func.sum(Campaign.row_version))
+ORDERS_ETAG = select(func.count(), func.max(Order.updated_at), func.sum(Order.row_version))
+
+HOT_QUERIES: list[tuple[str, Select, str]] = [
+    (
+        "orders page for a brand",
+        select(Order).where(Order.brand_id == SOME_ID).order_by(Order.updated_at.desc(), Order.id.desc()).limit(50),
+        "ix_orders_brand_id_updated_at",
+    ),
+    (
+        "orders by brand and status",
+        select(Order).where(Order.brand_id == SOME_ID, Order.status == OrderStatus.IN_PROGRESS),
+        "ix_orders_brand_id_updated_at",
+    ),
+    (
+        "orders changed for a creator",
+        select(Order)
+        .where(Order.creator_id == SOME_ID, Order.updated_at > datetime(2026, 1, 1))
+        .order_by(Order.updated_at.desc(), Order.id.desc())
+        .limit(50),
+        "ix_orders_creator_id_updated_at",
+    ),
+    (
+        "orders page for a campaign",
+        select(Order).where(Order.campaign_id == SOME_ID).order_by(Order.updated_at.desc(), Order.id.desc()).limit(50),
+        "ix_orders_campaign_id_updated_at",
+    ),
+    (
+        "orders page",
+        select(Order).order_by(Order.updated_at.desc(), Order.id.desc()).limit(50),
+        "ix_orders_updated_at_id",
+    ),
+    (
+        "campaigns by status",
+        select(Campaign).where(Campaign.status == CampaignStatus.ACTIVE).order_by(Campaign.created_at),
+        "ix_campaigns_status_created_at",
+    ),
+    (
+        "campaigns page after cursor",
+        select(Campaign)
+        .where(tuple_(Campaign.created_at, Campaign.id) < tuple_(datetime(2026, 1, 1), SOME_ID))
+        .order_by(Campaign.created_at.desc(), Campaign.id.desc())
+        .limit(50),
+        "ix_campaigns_created_at_id",
+    ),
+    (
+        "campaigns etag aggregate",
+        CAMPAIGNS_ETAG,
+        "ix_campaigns_updated_at",
+    ),
+    (
+        "campaigns etag aggregate by status",
+        CAMPAIGNS_ETAG.where(Campaign.status == CampaignStatus.ACTIVE),
+        "ix_campaigns_status_updated_at",
+    ),
+    (
+        "campaigns etag aggregate for a brand",
+        CAMPAIGNS_ETAG.where(Campaign.brand_id == SOME_ID),
+        "ix_campaigns_brand_id_updated_at",
+    ),
+    (
+        "orders etag aggregate for a creator",
+        ORDERS_ETAG.where(Order.creator_id == SOME_ID),
+        "ix_orders_creator_id_updated_at",
+    ),
+    (
+        "payments grouped by status",
+        select(Payment.status, func.count()).group_by(Payment.status),
+        "ix_payments_status_created_at",
+    ),
+    (
+        "unread notifications for a user",
+        select(Notification)
+        .where(Notification.user_id == SOME_ID, Notification.is_read == false())
+        .order_by(Notification.created_at.desc()),
+        "ix_notifications_user_id_is_read_created_at",
+    ),
+]
+
+
+def _plan(connection: Connection, stmt: Select) -> str:
+    sql = stmt.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    prefix = "EXPLAIN QUERY PLAN" if connection.dialect.name == "sqlite" else "EXPLAIN"
+    return "\n".join(str(row[-1]) for row in connection.exec_driver_sql(f"{prefix} {sql}"))
+
+
+@pytest.fixture(scope="module", params=["sqlite", "postgresql"])
+def plan_engine(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> Engine:
+    if request.param == "sqlite":
+        engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}")
+    else:
+        url = os.getenv("TEST_POSTGRES_URL")
+        if not url:
+            pytest.skip("TEST_POSTGRES_URL is not set")
+        engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.mark.parametrize(
+    ("stmt", "index"), [(stmt, index) for _, stmt, index in HOT_QUERIES], ids=[name for name, _, _ in HOT_QUERIES]
+)
+def test_hot_query_uses_index(plan_engine: Engine, stmt: Select, index: str) -> None:
+    with plan_engine.connect() as connection:
+        if connection.dialect.name == "postgresql":
+            connection.exec_driver_sql("SET enable_seqscan = off")
+        plan = _plan(connection, stmt)
+
+    assert index in plan, plan
+    # The composite index already yields rows in the requested order
+    assert "TEMP B-TREE FOR ORDER BY" not in plan
+
+
+def test_user_email_prefix_uses_expression_index(plan_engine: Engine) -> None:
+    with plan_engine.connect() as connection:
+        if connection.dialect.name == "postgresql":
+            connection.exec_driver_sql("SET enable_seqscan = off")
+        plan = _plan(connection, select(User.id).where(email_prefix(connection.dialect.name, "Dir_")))
+
+    assert "ix_users_email_lower" in plan, plan
@@ -0,0 +1,96 @@
+"""Shared rate limit backend tests."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from app.core.rate_limit_backends import RedisRateLimitBackend, SQLiteRateLimitBackend
+
+
+class FakeRedisServer:
+    """Tiny RESP server implementing the commands used by the limiter."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, int] = {}
+        self.expiry: dict[str, int] = {}
+        self.commands = 0
+
+    async def _read_command(self, reader: asyncio.StreamReader) -> list[str] | None:
+        header = await reader.readline()
+        if not header:
+            return None
+        args = []
+        for _ in range(int(header[1:-2])):
+            length = int((await reader.readline())[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2].decode())
+        return args
+
+    def _execute(self, args: list[str]) -> bytes:
+        name = args[0].upper()
+        if name == "INCRBY":
+            self.data[args[1]] = self.data.get(args[1], 0) + int(args[2])
+            return b":%d\r\n" % self.data[args[1]]
+        if name == "PEXPIRE":
+            self.expiry[args[1]] = int(args[2])
+            return b":1\r\n"
+        return b"-ERR unknown command\r\n"
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        queued: list[list[str]] | None = None
+        while (args := await self._read_command(reader)) is not None:
+            self.commands += 1
+            name = args[0].upper()
+            if name == "MULTI":
+                queued = []
+                writer.write(b"+OK\r\n")
+            elif name == "EXEC":
+                replies = [self._execute(cmd) for cmd in queued or []]
+                writer.write(b"*%d\r\n" % len(replies) + b"".join(replies))
+                queued = None
+            elif queued is not None:
+                queued.append(args)
+                writer.write(b"+QUEUED\r\n")
+            else:
+                writer.write(self._execute(args))
+            await writer.drain()
+        writer.close()
+
+
+def test_redis_backend_shares_limit_across_workers() -> None:
+    async def scenario() -> tuple[list[bool], int]:
+        fake = FakeRedisServer()
+        server = await asyncio.start_server(fake.handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        workers = [RedisRateLimitBackend(f"redis://127.0.0.1:{port}/0", batch_size=5, clock=lambda: 1000.0) for _ in range(2)]
+        decisions = []
+        for idx in range(130):
+            decision = await workers[idx % 2].acquire("ip:1.2.3.4", limit=100, window_seconds=3600)
+            decisions.append(decision.allowed)
+        for worker in workers:
+            await worker.close()
+        server.close()
+        await server.wait_closed()
+        return decisions, fake.commands
+
+    decisions, commands = asyncio.run(scenario())
+    assert sum(decisions) <= 100
+    assert sum(decisions) >= 90
+    # Batched claims keep round trips well below one per request
+    assert commands < 130
+
+
+def test_sqlite_backend_shares_limit_across_workers(tmp_path: Path) -> None:
+    async def scenario() -> list[bool]:
+        workers = [SQLiteRateLimitBackend(tmp_path / "limits.db", batch_size=2, clock=lambda: 1000.0) for _ in range(3)]
+        decisions = []
+        for idx in range(30):
+            decision = await workers[idx % 3].acquire("user:42", limit=20, window_seconds=3600)
+            decisions.append(decision.allowed)
+        for worker in workers:
+            await worker.close()
+        return decisions
+
+    decisions = asyncio.run(scenario())
+    assert sum(decisions) == 20
+    assert decisions[-1] is False
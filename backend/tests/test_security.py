@@ -2,7 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import threading
+import time
+import uuid
+
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core import auth_context, middleware
+from app.core.access_log import AccessLogSampler, parse_sample_rates
+from app.core.hashing import HashingOverloadedError, PasswordHashingPool
+from app.core.middleware import RequestPipelineMiddleware
+from app.core.rate_limit import RateLimitRule, TokenBucketLimiter
+from app.core.rate_limit_backends import MemoryRateLimitBackend
+from app.core.revocation import BloomFilter, DatabaseRevocationBackend, MemoryRevocationBackend, RevocationStore
+from app.core.security import (
+    DUMMY_PASSWORD_HASH,
+    TokenError,
+    VerifiedTokenCache,
+    create_refresh_token,
+    revoke_refresh_token,
+    verify_password,
+    verify_token,
+)
+from app.models import User, UserRole
 
 
 def test_rate_limiter_enforces_limit(client: TestClient) -> None:
@@ -23,3 +49,249 @@ def test_cors_headers(client: TestClient) -> None:
     blocked = client.get("/health", headers={"Origin": "http://evil.example"})
     assert blocked.status_code == 200
     assert "access-control-allow-origin" not in blocked.headers
+
+
+def test_login_route_has_stricter_limit(client: TestClient) -> None:
+    payload = {"email": "nobody@example.com", "password": "Secret123!"}
+    statuses = [client.post("/api/auth/login", json=payload).status_code for _ in range(11)]
+    assert statuses[:10] == [401] * 10
+    assert statuses[10] == 429
+
+    # The general bucket still has room for other routes
+    assert client.get("/health").status_code == 200
+
+
+def test_access_log_sampler_keeps_errors_and_slow_requests() -> None:
+    sampler = AccessLogSampler(
+        status_rates=parse_sample_rates("2xx=0,4xx=0"),
+        route_rates=parse_sample_rates("/api/admin=1"),
+        slow_ms=250,
+        rng=lambda: 0.5,
+    )
+
+    assert not sampler.should_log("/health", 200, 3.0)
+    assert sampler.should_log("/health", 200, 300.0)
+    assert sampler.should_log("/health", 503, 3.0)
+    assert sampler.should_log("/api/auth/login", 401, 3.0)
+    assert sampler.should_log("/api/campaigns", 429, 3.0)
+    assert sampler.should_log("/api/admin/users", 200, 3.0)
+
+    server_errors_only = AccessLogSampler(status_rates={"4xx": 0}, always_keep_status=500, rng=lambda: 0.5)
+    assert not server_errors_only.should_log("/api/campaigns", 404, 3.0)
+    assert server_errors_only.should_log("/api/campaigns", 500, 3.0)
+
+
+def test_global_rejection_refunds_the_route_bucket(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Keep the app's limiter registered for reset_rate_limiter()
+    monkeypatch.setattr(middleware, "_rate_limiter_instance", middleware._rate_limiter_instance)
+    backend = MemoryRateLimitBackend()
+    pipeline = RequestPipelineMiddleware(
+        None, limit=2, route_limits=[RateLimitRule("/api/auth/login", 3)], backend=backend
+    )
+
+    async def scenario() -> list[bool]:
+        # Spend the global bucket elsewhere, then hammer the login route while throttled
+        for _ in range(2):
+            await pipeline._check("ip:1", "/health")
+        return [(await pipeline._check("ip:1", "/api/auth/login")).allowed for _ in range(5)]
+
+    assert asyncio.run(scenario()) == [False] * 5
+    route_bucket = asyncio.run(backend.acquire("/api/auth/login|ip:1", limit=3, window_seconds=60))
+    assert route_bucket.remaining == 2
+
+
+def test_token_bucket_refills_and_evicts_idle_keys() -> None:
+    now = [0.0]
+    limiter = TokenBucketLimiter(shards=4, max_keys=8, clock=lambda: now[0])
+
+    assert limiter.acquire("ip:a", limit=2, window_seconds=60).allowed
+    assert limiter.acquire("ip:a", limit=2, window_seconds=60).allowed
+    rejected = limiter.acquire("ip:a", limit=2, window_seconds=60)
+    assert not rejected.allowed
+    assert rejected.retry_after == pytest.approx(30.0)
+
+    now[0] = 30.0
+    assert limiter.acquire("ip:a", limit=2, window_seconds=60).allowed
+
+    # Once every bucket has refilled, idle keys are dropped on the next access
+    now[0] = 1000.0
+    limiter.acquire("ip:b", limit=2, window_seconds=60)
+    assert len(limiter) <= 2
+
+
+def test_token_bucket_caps_tracked_keys() -> None:
+    limiter = TokenBucketLimiter(shards=2, max_keys=10)
+    for idx in range(500):
+        limiter.acquire(f"ip:{idx}", limit=60, window_seconds=60)
+    assert len(limiter) <= 10
+
+
+def test_admin_request_decodes_token_once(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    client.post(
+        "/api/auth/register",
+        json={"email": "ctx@example.com", "password": "Secret123!", "role": "brand", "admin_level": "admin_level_1"},
+    )
+    token = client.post("/api/auth/login", json={"email": "ctx@example.com", "password": "Secret123!"}).json()[
+        "access_token"
+    ]
+
+    calls = []
+    original = auth_context.verify_token
+
+    def counting_verify(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(auth_context, "verify_token", counting_verify)
+    response = client.get("/api/admin/users", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert len(calls) == 1
+
+
+def test_verified_token_cache_counts_hits_and_respects_expiry() -> None:
+    cache = VerifiedTokenCache(max_entries=2, ttl_seconds=300)
+    now = int(time.time())
+    live = {"sub": "a", "exp": now + 60}
+    cache.put(b"live", live)
+    cache.put(b"expired", {"sub": "b", "exp": now - 1})
+
+    assert cache.get(b"live") == live
+    assert cache.get(b"expired") is None
+    assert cache.get(b"missing") is None
+
+    cache.put(b"second", live)
+    cache.put(b"third", live)
+    assert cache.get(b"live") is None
+    assert cache.stats()["size"] == 2
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_cached_refresh_token_is_still_checked_for_revocation() -> None:
+    refresh = create_refresh_token({"sub": "00000000-0000-0000-0000-000000000001"})
+    verify_token(refresh, expected_type="refresh")
+    revoke_refresh_token(refresh)
+    with pytest.raises(TokenError):
+        verify_token(refresh, expected_type="refresh")
+
+
+def test_bloom_filter_has_no_false_negatives() -> None:
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    keys = [uuid.uuid4().bytes for _ in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    false_positives = sum(uuid.uuid4().bytes in bloom for _ in range(2000))
+    assert false_positives < 100
+
+
+def test_database_revocations_are_shared_between_workers(db_session: Session) -> None:
+    session_factory = sessionmaker(bind=db_session.get_bind())
+    worker_a = RevocationStore(DatabaseRevocationBackend(session_factory), sync_interval=0)
+    worker_b = RevocationStore(DatabaseRevocationBackend(session_factory), sync_interval=0)
+    jti = str(uuid.uuid4())
+
+    assert worker_b.is_revoked(jti) is False
+    worker_a.revoke(jti, time.time() + 60)
+    assert worker_a.is_revoked(jti) is True
+    assert worker_b.is_revoked(jti) is True
+    assert worker_b.is_revoked(str(uuid.uuid4())) is False
+
+
+def test_revocation_store_does_not_hold_its_lock_across_backend_reads() -> None:
+    release = threading.Event()
+    reading = threading.Event()
+
+    class SlowBackend(MemoryRevocationBackend):
+        def live_keys(self, now: float) -> list[bytes]:
+            reading.set()
+            release.wait(5)
+            return super().live_keys(now)
+
+    store = RevocationStore(SlowBackend(), capacity=1, sync_interval=0)
+    store.revoke(str(uuid.uuid4()), time.time() + 60)
+    # The filter is full, so the first lookup rebuilds it from the (slow) backend
+    rebuild = threading.Thread(target=store.is_revoked, args=(str(uuid.uuid4()),))
+    rebuild.start()
+    assert reading.wait(5)
+
+    revoked = str(uuid.uuid4())
+    store.revoke(revoked, time.time() + 60)
+    assert store.is_revoked(revoked) is True
+    assert rebuild.is_alive()
+
+    release.set()
+    rebuild.join(5)
+    # Revoked mid-rebuild, and still in the filter that replaced the old one
+    assert store.is_revoked(revoked) is True
+
+
+def test_login_rehashes_legacy_sha256_password(client: TestClient, db_session: Session) -> None:
+    legacy = hashlib.sha256(b"ugc-salt" + b"Secret123!").hexdigest()
+    user = User(email="legacy@example.com", hashed_password=legacy, role=UserRole.BRAND)
+    db_session.add(user)
+    db_session.commit()
+
+    response = client.post("/api/auth/login", json={"email": "legacy@example.com", "password": "Secret123!"})
+    assert response.status_code == 200
+
+    db_session.refresh(user)
+    assert user.hashed_password.startswith("pbkdf2_sha256$")
+    assert verify_password("Secret123!", user.hashed_password)
+    assert client.post("/api/auth/login", json={"email": "legacy@example.com", "password": "Secret123!"}).status_code == 200
+
+
+def test_unknown_email_login_still_runs_the_kdf(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    verified: list[str] = []
+    real_verify = PasswordHashingPool.verify
+
+    async def spy(self, password: str, hashed_password: str) -> bool:
+        verified.append(hashed_password)
+        return await real_verify(self, password, hashed_password)
+
+    monkeypatch.setattr(PasswordHashingPool, "verify", spy)
+    response = client.post("/api/auth/login", json={"email": "nobody@example.com", "password": "Secret123!"})
+
+    assert response.status_code == 401
+    assert verified == [DUMMY_PASSWORD_HASH]
+
+
+def test_malformed_stored_hash_does_not_verify() -> None:
+    assert verify_password("Secret123!", "pbkdf2_sha256$1000$c2FsdA==$not*base64") is False
+
+
+def test_cancelled_hash_keeps_its_slot_until_the_job_ends() -> None:
+    pool = PasswordHashingPool(workers=1, max_queue=0)
+    release = threading.Event()
+
+    async def scenario() -> None:
+        waiter = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.sleep(0.01)
+        # The job is still running in the executor, so there is no room for another
+        with pytest.raises(HashingOverloadedError):
+            await pool.hash("Secret123!")
+        release.set()
+        await asyncio.to_thread(pool._get_executor().submit(lambda: None).result)
+        assert pool.stats()["pending"] == 0
+        assert pool.stats()["completed_total"] == 1
+        await pool.hash("Secret123!")
+
+    asyncio.run(scenario())
+
+
+def test_saturated_hashing_pool_rejects_fast() -> None:
+    pool = PasswordHashingPool(workers=1, max_queue=0)
+    release = threading.Event()
+
+    async def scenario() -> None:
+        blocked = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.01)
+        with pytest.raises(HashingOverloadedError):
+            await pool.hash("Secret123!")
+        release.set()
+        await blocked
+
+    asyncio.run(scenario())
+    assert pool.stats()["rejected_total"] == 1
+    assert pool.stats()["pending"] == 0